@@ -1,17 +1,37 @@
+import click
 from flask import Flask
 from config import Config
-import oracledb
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
 from models import Customer, Airplane, Seat, Reservation, Cancellation
 from routes.api import api
-from routes.main import main
+from routes.main import main, warm_statistics
+from session_store import create_session_interface
+from request_metrics import request_metrics
+from models.stats_cache import stats_cache
+from models.stats_summary import (
+    ensure_summaries,
+    rebuild_summaries,
+    summary_signature,
+)
+from models.schedule_loader import load_schedule
+from models.inventory import flight_inventory
+from models.seat_hold import seat_hold_sweeper
 
 app = Flask(__name__)
 app.config.from_object(Config)
 
+# 서버 측 세션 저장소 설정 (쿠키에는 세션 ID만 저장)
+session_interface = create_session_interface(app.config)
+if session_interface is not None:
+    app.session_interface = session_interface
+
 # SQLAlchemy db 객체 초기화 (models.customer에서 db 객체 import)
 from models.customer import db
+from models.db_pool import engine_options
 
+# Config의 풀 설정을 SQLAlchemy 엔진 옵션으로 적용
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(app.config)
 db.init_app(app)
 
 
@@ -19,26 +39,32 @@ db.init_app(app)
 app.register_blueprint(api, url_prefix="/api")
 app.register_blueprint(main)
 
+# 요청별 SQL 실행 횟수/지연 시간 계측 (Server-Timing 헤더, /metrics)
+if app.config["METRICS_ENABLED"]:
+    request_metrics.init_app(app)
+
+# 항공편 검색용 메모리 재고 스냅샷 (백그라운드 적재, 적재 전/만료 시에는 SQL로 검색)
+if app.config["INVENTORY_ENABLED"]:
+    flight_inventory.init_app(app)
+
+# 결제 전 좌석 선점 만료 처리 (만료된 선점의 좌석을 백그라운드에서 반환)
+seat_hold_sweeper.init_app(app)
+
+# 관리자 통계 화면이 바로 뜨도록 통계/차트를 백그라운드에서 미리 렌더링
+stats_cache.start_prerender(app, warm_statistics, summary_signature)
+
 
 def get_db_connection():
     """
-    오라클 DB에 직접 연결하는 함수 (SQLAlchemy와 별개, 테스트/직접 쿼리용)
+    SQLAlchemy와 같은 커넥션 풀에서 오라클 DB 연결을 빌려오는 함수 (직접 쿼리용)
+    사용 후 close()를 호출하면 풀로 반환됨
     """
     try:
-        print(f"연결 시도 : {app.config['DB_HOST']}:{app.config['DB_PORT']}")
-
-        # Thin 모드로 연결
-        connection = oracledb.connect(
-            user=app.config["DB_USER"],
-            password=app.config["DB_PASSWORD"],
-            host=app.config["DB_HOST"],
-            port=app.config["DB_PORT"],
-            service_name=app.config["DB_SERVICE"],
-        )
-        print("데이터베이스 연결 성공!")
-        return connection
-
-    except oracledb.Error as error:
+        with app.app_context():
+            return db.engine.raw_connection()
+
+    # 풀의 커넥션이 모두 사용 중이면 DB_POOL_TIMEOUT 후 PoolTimeoutError 발생
+    except (DBAPIError, PoolTimeoutError) as error:
         print(f"데이터베이스 연결 오류 : {error}")
         return None
 
@@ -59,6 +85,72 @@ def get_db_connection():
 # return "데이터베이스 연결 실패"
 
 
+@app.cli.command("init-stats")
+def init_stats_command():
+    """
+    통계 집계 테이블이 없으면 생성 후 원본으로 채움 (배포 시 1회, flask --app app init-stats)
+    """
+    missing = ensure_summaries()
+    if missing:
+        stats_cache.bump()
+        print(f"집계 테이블 생성: {', '.join(missing)}")
+    else:
+        print("집계 테이블이 이미 있습니다.")
+
+
+@app.cli.command("rebuild-stats")
+def rebuild_stats_command():
+    """
+    통계 집계 테이블 재계산 (flask --app app rebuild-stats)
+    """
+    counts = rebuild_summaries()
+    stats_cache.bump()
+    for table, count in counts.items():
+        print(f"{table}: {count}건")
+
+
+@app.cli.command("load-schedule")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--batch-size", type=int, default=None, help="배치당 행 수")
+def load_schedule_command(path, batch_size):
+    """
+    운항 스케줄 파일(CSV/Parquet) 적재 (flask --app app load-schedule schedule.csv)
+    """
+    result = load_schedule(
+        path, batch_size=batch_size or app.config["SCHEDULE_LOAD_BATCH_SIZE"]
+    )
+    print(
+        f"{result['rows']}행 처리 (항공편 {result['flights']}건, "
+        f"좌석 {result['seats']}건, 제외 {result['rejected']}건) - "
+        f"{result['seconds']}초, {result['rows_per_sec']}행/초"
+    )
+    for error in result["errors"]:
+        print(f"  제외: {error}")
+
+
+@app.cli.command("cancel-flights")
+@click.option("--flight", "flight_number", default=None, help="운항편명")
+@click.option(
+    "--from", "start", type=click.DateTime(), default=None, help="출발일시 시작"
+)
+@click.option(
+    "--to", "end", type=click.DateTime(), default=None, help="출발일시 끝(미포함)"
+)
+@click.option("--full-refund", is_flag=True, help="위약금 없이 전액 환불")
+def cancel_flights_command(flight_number, start, end, full_refund):
+    """
+    항공편 예약 일괄 취소 (flask --app app cancel-flights --flight KE123 --from 2025-06-01)
+    """
+    try:
+        result = Cancellation.cancel_flights(flight_number, start, end, full_refund)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    print(
+        f"예약 {result['reservations']}건 취소, "
+        f"환불 합계 {result['refund_total']:,}원 - {result['seconds']}초"
+    )
+
+
 # Flask 앱 실행 (개발용 서버)
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5001, debug=True)
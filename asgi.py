@@ -0,0 +1,9 @@
+from app import app as flask_app
+from routes.async_api import create_asgi_app
+
+# ASGI 서버 진입점 (예: uvicorn asgi:app --host 0.0.0.0 --port 5001)
+# 항공편 검색/잔여좌석 알림/예약 내역 조회는 비동기 DB 드라이버로 처리하고
+# 나머지 라우트는 기존 Flask 앱이 처리
+# 세션은 기본 저장소(SESSION_BACKEND=sqlite)로 여러 워커가 공유
+# (SESSION_BACKEND=memory는 워커 프로세스가 하나일 때만 사용)
+app = create_asgi_app(flask_app)
@@ -0,0 +1,74 @@
+"""
+공항 별칭 변환 마이크로 벤치마크
+
+기존 중첩 부분문자열 탐색과 AliasResolver 인덱스 조회 속도 비교 (약 1만 개 공항 기준)
+
+실행: python -m benchmarks.alias_resolver --airports 10000
+"""
+
+import argparse
+import random
+import string
+import time
+
+from models.alias_resolver import AliasResolver
+
+
+def legacy_codes(mapping, airport_name):
+    """
+    기존 방식 (모든 공항의 모든 별칭에 대해 양방향 부분문자열 비교)
+    """
+    airport_codes = []
+    for code, names in mapping.items():
+        if any(
+            name.lower() in airport_name.lower() or airport_name.lower() in name.lower()
+            for name in names
+        ):
+            airport_codes.append(code)
+    return airport_codes
+
+
+def build_mapping(count):
+    rng = random.Random(0)
+    mapping = {}
+    while len(mapping) < count:
+        code = "".join(rng.choices(string.ascii_uppercase, k=3))
+        city = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 10)))
+        mapping[code] = [code, city, f"{city} international airport"]
+    return mapping
+
+
+def timed(fn, queries, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for query in queries:
+            fn(query)
+    return (time.perf_counter() - started) / (repeat * len(queries)) * 1e6
+
+
+def run(airports, repeat):
+    mapping = build_mapping(airports)
+
+    started = time.perf_counter()
+    resolver = AliasResolver(mapping)
+    print(f"인덱스 생성: {(time.perf_counter() - started) * 1000:.1f}ms")
+
+    codes = list(mapping)
+    queries = [codes[i] for i in range(0, airports, airports // 50 or 1)]
+    queries += [mapping[code][1] for code in queries]
+
+    for query in queries:
+        assert resolver.resolve(query)[0] in legacy_codes(mapping, query), query
+
+    legacy = timed(lambda q: legacy_codes(mapping, q), queries, repeat)
+    indexed = timed(resolver.resolve, queries, repeat)
+    print(f"기존 탐색: {legacy:,.1f}us/query")
+    print(f"인덱스 조회: {indexed:,.1f}us/query ({legacy / indexed:,.0f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--airports", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.airports, args.repeat)
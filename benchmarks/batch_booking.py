@@ -0,0 +1,109 @@
+"""
+일괄 예약 API 벤치마크
+
+같은 예약 N건을 /api/reserve 단건 호출 N번과 /api/reserve/batch 1번으로 처리할 때의
+처리 시간/초당 예약 수를 비교 (Flask 테스트 클라이언트, SQLite)
+메일 발송 큐 등록은 두 방식 모두 측정에서 제외 (DB 처리 비용만 비교)
+
+실행: python -m benchmarks.batch_booking --items 20 --rounds 10
+"""
+
+import argparse
+import time
+
+from benchmarks.common import create_sqlite_app, seed_flights
+from models.airplane import Airplane
+from models.customer import Customer, db
+from models.reservation import Reservation
+from routes import api as api_routes
+
+
+def create_app():
+    app = create_sqlite_app(SECRET_KEY="bench")
+    app.register_blueprint(api_routes.api, url_prefix="/api")
+    # 외부 SMTP 서버로 메일이 나가지 않도록 발송 큐 등록을 생략
+    api_routes.send_reservation_email = lambda *args: (False, "벤치마크: 발송 생략")
+    return app
+
+
+def make_items(flights, offset, count):
+    return [
+        {
+            "flight_number": flight["flight_number"],
+            "departure_date_time": flight["departure_date_time"].strftime(
+                "%Y-%m-%d %H:%M"
+            ),
+            "seat_class": "Economy",
+            "price": 900000,
+        }
+        for flight in flights[offset : offset + count]
+    ]
+
+
+def run(items, rounds):
+    app = create_app()
+    with app.app_context():
+        seed_flights(items * rounds * 2)
+        flights = [
+            {
+                "flight_number": airplane.flight_number,
+                "departure_date_time": airplane.departure_date_time,
+            }
+            for airplane in Airplane.query.order_by(Airplane.flight_number)
+        ]
+        for cno in ("C100", "C200"):
+            db.session.add(
+                Customer(
+                    cno=cno,
+                    password="pw",
+                    name=cno,
+                    email=f"{cno}@example.com",
+                    passport=f"P{cno}",
+                )
+            )
+        db.session.commit()
+
+    # 단건 API N번 호출
+    client = app.test_client()
+    client.post("/api/login", json={"cno": "C100", "password": "pw"})
+    started = time.perf_counter()
+    for n in range(rounds):
+        for item in make_items(flights, n * items, items):
+            response = client.post("/api/reserve", json=item)
+            assert response.get_json()["success"], response.get_json()
+    single_elapsed = time.perf_counter() - started
+
+    # 일괄 API 1번 호출
+    client = app.test_client()
+    client.post("/api/login", json={"cno": "C200", "password": "pw"})
+    started = time.perf_counter()
+    for n in range(rounds):
+        batch = make_items(flights, (rounds + n) * items, items)
+        response = client.post("/api/reserve/batch", json={"items": batch})
+        assert response.get_json()["success"], response.get_json()
+    batch_elapsed = time.perf_counter() - started
+
+    with app.app_context():
+        booked = {
+            cno: Reservation.query.filter_by(cno=cno).count()
+            for cno in ("C100", "C200")
+        }
+
+    total = items * rounds
+    print(f"예약 {total}건 ({items}건 x {rounds}회), 예약 행 수: {booked}")
+    print(
+        f"단건 호출: {single_elapsed:.2f}s ({total / single_elapsed:,.1f} bookings/sec)"
+    )
+    print(
+        f"일괄 호출: {batch_elapsed:.2f}s ({total / batch_elapsed:,.1f} bookings/sec)"
+    )
+    print(f"속도 향상: {single_elapsed / batch_elapsed:.1f}x")
+    assert booked == {"C100": total, "C200": total}, "예약 수 불일치"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    run(args.items, args.rounds)
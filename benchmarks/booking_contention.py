@@ -0,0 +1,74 @@
+"""
+예약 동시성 벤치마크
+
+여러 스레드가 동시에 같은 항공편/좌석등급을 예약할 때
+잔여좌석 수보다 많이 팔리지 않는지(초과 판매 없음) 확인하고 초당 예약 수를 측정
+
+실행: python -m benchmarks.booking_contention --threads 16 --seats 200
+"""
+
+import argparse
+import threading
+import time
+
+from benchmarks.common import create_sqlite_app, seed_flights
+from models.customer import db
+from models.reservation import Reservation
+from models.seat import Seat
+
+
+def run(threads, seats, attempts_per_thread):
+    app = create_sqlite_app()
+    with app.app_context():
+        flight = seed_flights(1, seats_per_class=seats)
+
+    flight_number = flight["flight_number"]
+    departure = flight["departure_date_time"]
+    succeeded = []
+    failed = []
+    lock = threading.Lock()
+
+    def worker(worker_id):
+        with app.app_context():
+            for i in range(attempts_per_thread):
+                reservation, message = Reservation.create_reservation(
+                    cno=f"C{worker_id:03d}{i:05d}",
+                    flight_number=flight_number,
+                    departure_date_time=departure,
+                    seat_class="Economy",
+                    payment=900000,
+                )
+                with lock:
+                    (succeeded if reservation else failed).append(message)
+            db.session.remove()
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    started = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    with app.app_context():
+        remaining = Seat.get_available_seats(flight_number, departure, "Economy")
+        booked = Reservation.query.filter_by(flight_number=flight_number).count()
+
+    print(
+        f"시도: {threads * attempts_per_thread}, 성공: {len(succeeded)}, 실패: {len(failed)}"
+    )
+    print(f"예약 행 수: {booked}, 잔여좌석: {remaining}")
+    print(f"처리량: {len(succeeded) / elapsed:,.1f} bookings/sec ({elapsed:.2f}s)")
+
+    # 초과 판매 검증
+    assert booked == len(succeeded) == seats - remaining, "좌석 수와 예약 수 불일치"
+    assert remaining >= 0, "초과 판매 발생"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--seats", type=int, default=200)
+    parser.add_argument("--attempts", type=int, default=25)
+    args = parser.parse_args()
+    run(args.threads, args.seats, args.attempts)
@@ -0,0 +1,72 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+from flask import Flask
+from sqlalchemy import insert
+from models.customer import db
+from models.airplane import Airplane
+from models.seat import Seat
+
+# 벤치마크 공용 헬퍼 (오라클 대신 로컬 SQLite 파일 DB 사용)
+
+
+def create_sqlite_app(db_path=None, **config):
+    """
+    SQLite 파일 DB에 연결된 Flask 앱 생성 (테이블 생성 포함)
+    """
+    if db_path is None:
+        db_path = os.path.join(tempfile.mkdtemp(prefix="c-air-bench-"), "bench.db")
+
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    # 여러 스레드가 동시에 쓰기를 시도하므로 잠금 대기 시간을 넉넉하게 설정
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "connect_args": {"timeout": 30, "check_same_thread": False}
+    }
+    app.config.update(config)
+
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def seed_flights(count, seats_per_class=100, start=None, batch_size=10000):
+    """
+    테스트용 항공편/좌석 데이터 생성 (앱 컨텍스트 안에서 호출, 배치 단위 INSERT)
+    """
+    start = start or datetime(2030, 1, 1, 9, 0)
+    first_flight = None
+    for batch_start in range(0, count, batch_size):
+        airplanes = []
+        seats = []
+        for i in range(batch_start, min(batch_start + batch_size, count)):
+            departure = start + timedelta(minutes=37 * i)
+            flight_number = f"KE{i:07d}"
+            airplanes.append(
+                {
+                    "airline": "C-AIR",
+                    "flight_number": flight_number,
+                    "departure_date_time": departure,
+                    "departure_airport": "ICN" if i % 2 == 0 else "JFK",
+                    "arrival_date_time": departure + timedelta(hours=14),
+                    "arrival_airport": "JFK" if i % 2 == 0 else "ICN",
+                }
+            )
+            for seat_class, price in (("Business", 2500000), ("Economy", 900000)):
+                seats.append(
+                    {
+                        "flight_number": flight_number,
+                        "departure_date_time": departure,
+                        "seat_class": seat_class,
+                        "number_of_seats": seats_per_class,
+                        "price": price + (i % 50) * 1000,
+                    }
+                )
+        db.session.execute(insert(Airplane), airplanes)
+        db.session.execute(insert(Seat), seats)
+        db.session.commit()
+        first_flight = first_flight or airplanes[0]
+    return first_flight
@@ -0,0 +1,93 @@
+"""
+요금 달력 벤치마크
+
+N일 요금 달력을 만드는 두 방식의 지연시간 비교 (검색 캐시 없이 매번 DB 조회)
+- 날짜별 검색 N회 (기존: 하루씩 /api/search 호출)
+- GROUP BY 출발일 쿼리 1회 (Airplane.fare_calendar)
+및 하루 검색 1회의 지연시간
+
+실행: python -m benchmarks.fare_calendar --flights 1000000 --days 30
+"""
+
+import argparse
+import statistics
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import text
+
+from benchmarks.common import create_sqlite_app, seed_flights
+from models.airplane import Airplane
+from models.customer import db
+from models.search_cache import search_cache
+
+
+def per_day_calendar(start, days):
+    calendar = []
+    for n in range(days):
+        day = start + timedelta(days=n)
+        search_cache.clear()
+        rows = Airplane.search_flights(day.isoformat(), "ICN", "JFK", "Economy")
+        calendar.append((day, min((row[8] for row in rows), default=None), len(rows)))
+    return calendar
+
+
+def grouped_calendar(start, days):
+    search_cache.clear()
+    rows = Airplane.fare_calendar(
+        start, start + timedelta(days=days - 1), "ICN", "JFK", "Economy"
+    )
+    return [(row[0], row[1], row[2]) for row in rows]
+
+
+def single_day_search(start, days):
+    search_cache.clear()
+    return Airplane.search_flights(start.isoformat(), "ICN", "JFK", "Economy")
+
+
+def measure(fn, starts, days, repeat):
+    timings = []
+    for _ in range(repeat):
+        for start in starts:
+            started = time.perf_counter()
+            fn(start, days)
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), max(timings)
+
+
+def run(flights, days, repeat):
+    app = create_sqlite_app()
+    with app.app_context():
+        started = time.perf_counter()
+        seed_flights(flights)
+        # 항공편마다 가격이 다르도록 변경 (최저가 비교용)
+        db.session.execute(
+            text('UPDATE "SEAT" SET "PRICE" = "PRICE" + (abs(random()) % 100000)')
+        )
+        db.session.commit()
+        print(f"{flights:,}개 항공편 생성: {time.perf_counter() - started:.1f}s")
+
+        first_day = date(2030, 1, 1)
+        span = max((37 * flights) // (24 * 60) - days, 1)
+        starts = [first_day + timedelta(days=span * k // 10) for k in range(10)]
+
+        assert per_day_calendar(starts[0], days) == grouped_calendar(
+            starts[0], days
+        ), "요금 달력 결과 불일치"
+
+        for name, fn in (
+            (f"날짜별 검색 {days}회", per_day_calendar),
+            (f"GROUP BY 1회 ({days}일)", grouped_calendar),
+            ("하루 검색 1회", single_day_search),
+        ):
+            median, worst = measure(fn, starts, days, repeat)
+            print(f"{name}: median {median:.2f}ms, max {worst:.2f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--flights", type=int, default=1000000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.flights, args.days, args.repeat)
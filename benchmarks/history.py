@@ -0,0 +1,181 @@
+"""
+예약/취소 내역 조회 벤치마크
+
+예약 N건, 취소 M건이 있는 고객의 내역을
+- 기존 방식: 목록 조회 후 항목마다 항공편 정보 지연 로딩 (N+1)
+- 항공편 정보 JOIN 한 번으로 전체 목록 조회
+- 키셋 페이지 조회 (첫 페이지, 마지막 페이지까지 전체 순회)
+로 읽을 때의 SQL 실행 횟수/처리 시간을 비교하고, /api/history 전체 순회 시간을 측정 (SQLite)
+
+실행: python -m benchmarks.history --reservations 10000 --cancellations 2000
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from benchmarks.common import create_sqlite_app, seed_flights
+from benchmarks.query_counts import QueryCounter
+from models.airplane import Airplane
+from models.cancellation import Cancellation
+from models.customer import Customer, db
+from models.history import get_history_page, history_item
+from models.reservation import Reservation
+from routes import api as api_routes
+
+
+def seed_history(reservations, cancellations, flights=0):
+    seed_flights(max(reservations, cancellations, flights))
+    flights = [
+        (airplane.flight_number, airplane.departure_date_time)
+        for airplane in Airplane.query.order_by(Airplane.flight_number)
+    ]
+    db.session.add(
+        Customer(
+            cno="C100",
+            password="pw",
+            name="C100",
+            email="C100@example.com",
+            passport="PC100",
+        )
+    )
+    reserved_at = datetime(2029, 6, 1)
+    db.session.execute(
+        insert(Reservation),
+        [
+            {
+                "cno": "C100",
+                "flight_number": flight_number,
+                "departure_date_time": departure,
+                "seat_class": "Economy",
+                "payment": 900000,
+                "reserve_date_time": reserved_at,
+            }
+            for flight_number, departure in flights[:reservations]
+        ],
+    )
+    db.session.execute(
+        insert(Cancellation),
+        [
+            {
+                "cno": "C100",
+                "flight_number": flight_number,
+                "departure_date_time": departure,
+                "seat_class": "Business",
+                "refund": 2000000,
+                "cancel_date_time": reserved_at + timedelta(minutes=i),
+            }
+            for i, (flight_number, departure) in enumerate(flights[:cancellations])
+        ],
+    )
+    db.session.commit()
+
+
+def lazy_history(model, order_by):
+    # 기존 방식: 목록 조회 후 화면에서 항목마다 항공편 정보 사용
+    rows = model.query.filter_by(cno="C100").order_by(order_by.desc()).all()
+    for row in rows:
+        row.airplane.departure_airport, row.airplane.arrival_date_time
+    return rows
+
+
+def eager_history(kind, page_size):
+    rows, next_after = get_history_page(kind, "C100", page_size=page_size)
+    for row in rows:
+        row.airplane.departure_airport, row.airplane.arrival_date_time
+    return rows
+
+
+def walk_pages(kind, page_size):
+    total = 0
+    after = None
+    while True:
+        rows, after = get_history_page(kind, "C100", page_size=page_size, after=after)
+        total += len([history_item(kind, row) for row in rows])
+        if not after:
+            return total
+
+
+def measure(app, counter, label, func):
+    with app.app_context():
+        before = counter.count
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        db.session.remove()
+    rows = result if isinstance(result, int) else len(result)
+    print(
+        f"{label:<40} {rows:>7,}행 {counter.count - before:>7,}쿼리 "
+        f"{elapsed * 1000:>9.1f}ms"
+    )
+    return rows
+
+
+def run(reservations, cancellations, page_size):
+    app = create_sqlite_app(SECRET_KEY="bench")
+    app.register_blueprint(api_routes.api, url_prefix="/api")
+    with app.app_context():
+        seed_history(reservations, cancellations)
+        counter = QueryCounter(db.engine)
+
+    print(f"고객 1명: 예약 {reservations:,}건, 취소 {cancellations:,}건")
+    for kind, model, order_by in (
+        ("reservation", Reservation, Reservation.departure_date_time),
+        ("cancellation", Cancellation, Cancellation.cancel_date_time),
+    ):
+        total = reservations if kind == "reservation" else cancellations
+        cases = [
+            (f"{kind} 지연 로딩 전체", lambda: lazy_history(model, order_by), total),
+            (f"{kind} JOIN 전체", lambda: eager_history(kind, total), total),
+            (
+                f"{kind} 키셋 첫 페이지({page_size})",
+                lambda: eager_history(kind, page_size),
+                min(page_size, total),
+            ),
+            (
+                f"{kind} 키셋 전체 순회({page_size})",
+                lambda: walk_pages(kind, page_size),
+                total,
+            ),
+        ]
+        for label, func, expected in cases:
+            rows = measure(app, counter, label, func)
+            assert rows == expected, f"{label}: {rows}건 (예상 {expected}건)"
+
+    # /api/history 전체 순회
+    client = app.test_client()
+    client.post("/api/login", json={"cno": "C100", "password": "pw"})
+    started = time.perf_counter()
+    before = counter.count
+    items = 0
+    requests = 0
+    cursor = None
+    while True:
+        params = {"type": "reservation", "page_size": page_size}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/api/history", query_string=params).get_json()
+        assert body["success"], body
+        items += len(body["items"])
+        requests += 1
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+    elapsed = time.perf_counter() - started
+    assert items == reservations, items
+    print(
+        f"/api/history 전체 순회: {requests:,}회 요청, {items:,}건, "
+        f"{counter.count - before:,}쿼리, {elapsed:.2f}s "
+        f"(요청당 {elapsed / requests * 1000:.1f}ms)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reservations", type=int, default=10_000)
+    parser.add_argument("--cancellations", type=int, default=2_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    args = parser.parse_args()
+    run(args.reservations, args.cancellations, args.page_size)
@@ -0,0 +1,164 @@
+"""
+메모리 재고 스냅샷 벤치마크
+
+항공편 N개(좌석등급 2개)를 적재했을 때
+- 항공편 1개당 메모리: 스냅샷 열 배열 vs ORM 객체(Airplane + Seat)
+- 검색 지연시간: 스냅샷(NumPy 마스크 + searchsorted) vs DB 쿼리 (검색 캐시 없음)
+- 예약/취소 커밋 후 잔여좌석 변경분 반영
+을 측정하고, 정렬/페이지 조건별 검색 결과가 SQL 검색과 같은지 확인
+
+실행: python -m benchmarks.inventory --flights 1000000
+"""
+
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from sqlalchemy import and_, text
+
+from benchmarks.common import create_sqlite_app, seed_flights
+from models.airplane import Airplane
+from models.customer import db
+from models.inventory import flight_inventory, load_snapshot
+from models.search_cache import search_cache
+from models.seat import Seat
+
+
+def orm_bytes_per_flight(flights):
+    """
+    항공편 flights개를 ORM 객체(Airplane + 좌석등급별 Seat)로 읽었을 때 항공편당 메모리
+    """
+    db.session.expunge_all()
+    tracemalloc.start()
+    rows = (
+        db.session.query(Airplane, Seat)
+        .join(
+            Seat,
+            and_(
+                Airplane.flight_number == Seat.flight_number,
+                Airplane.departure_date_time == Seat.departure_date_time,
+            ),
+        )
+        .order_by(Airplane.departure_date_time)
+        .limit(flights * 2)
+        .all()
+    )
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = len({airplane.flight_number for airplane, _ in rows})
+    del rows
+    db.session.expunge_all()
+    return memory / count
+
+
+def sql_search(*args, **kwargs):
+    flight_inventory.enabled = False
+    try:
+        return Airplane.search_flights(*args, **kwargs)
+    finally:
+        flight_inventory.enabled = True
+
+
+def measure(fn, cases, repeat):
+    timings = []
+    for _ in range(repeat):
+        for case in cases:
+            started = time.perf_counter()
+            fn(*case, limit=21, offset=0)
+            timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.99) - 1]
+
+
+def run(flights, repeat):
+    app = create_sqlite_app()
+    with app.app_context():
+        started = time.perf_counter()
+        seed_flights(flights)
+        # 가격/잔여좌석 분포를 다양하게 (동점 정렬과 매진 좌석 포함)
+        db.session.execute(
+            text(
+                'UPDATE "SEAT" SET "PRICE" = "PRICE" + (abs(random()) % 20) * 10000, '
+                '"NUMBER_OF_SEATS" = abs(random()) % 5'
+            )
+        )
+        db.session.commit()
+        print(f"{flights:,}개 항공편 생성: {time.perf_counter() - started:.1f}s")
+        search_cache.max_size = 0
+
+        # 스냅샷 적재 (적재 시간, 메모리)
+        tracemalloc.start()
+        started = time.perf_counter()
+        with db.engine.connect() as connection:
+            snapshot = load_snapshot(connection)
+        load_elapsed = time.perf_counter() - started
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del snapshot
+        flight_inventory.enabled = True
+        flight_inventory.reload(db.engine)
+        stats = flight_inventory.stats()
+        print(
+            f"스냅샷 적재: {load_elapsed:.1f}s, 행 {stats['rows']:,}개, "
+            f"열 배열 {stats['bytes'] / flights:.0f} bytes/항공편 "
+            f"(변환표 포함 {retained / flights:.0f} bytes/항공편, 적재 중 최대 {peak / 2**20:,.0f}MB)"
+        )
+        print(
+            f"ORM 객체(Airplane + Seat 2개): "
+            f"{orm_bytes_per_flight(min(flights, 20000)):.0f} bytes/항공편"
+        )
+
+        # 검색 결과 비교 (정렬/방향/페이지)
+        rng = random.Random(0)
+        last_day = (37 * flights) // (24 * 60)
+        cases = [
+            (
+                (
+                    date(2030, 1, 1) + timedelta(days=rng.randrange(last_day))
+                ).isoformat(),
+                *rng.choice([("ICN", "JFK"), ("JFK", "ICN")]),
+                rng.choice(["Economy", "Business"]),
+                rng.choice(["price", "time"]),
+                rng.choice(["asc", "desc"]),
+            )
+            for _ in range(200)
+        ]
+        for case in cases[:50]:
+            for offset in (0, 5):
+                assert Airplane.search_flights(
+                    *case, limit=7, offset=offset
+                ) == sql_search(*case, limit=7, offset=offset), f"결과 불일치: {case}"
+        print("SQL 검색과 결과 일치 (50개 조건 x 2페이지)")
+
+        # 예약/취소 변경분 반영
+        row = Airplane.search_flights(*cases[0], limit=1)[0]
+        for change in (-1, 1, 1):
+            Seat.update_seat_count(row[1], row[2], row[6], change)
+            db.session.commit()
+            assert Airplane.search_flights(*cases[0]) == sql_search(*cases[0])
+        print(f"잔여좌석 변경분 반영 확인 ({flight_inventory.stats()['deltas']}건)")
+
+        for name, fn in (
+            ("DB 쿼리", sql_search),
+            ("재고 스냅샷", Airplane.search_flights),
+        ):
+            median, p99 = measure(
+                lambda *case, **kwargs: fn(
+                    *case[:4], sort=case[4], order=case[5], **kwargs
+                ),
+                cases,
+                repeat,
+            )
+            print(f"{name}: median {median:.3f}ms, p99 {p99:.3f}ms")
+        print(flight_inventory.stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--flights", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.flights, args.repeat)
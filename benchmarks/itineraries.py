@@ -0,0 +1,200 @@
+"""
+경유 항공편 검색 벤치마크
+
+공항 A개, 항공편 N개(허브 공항 비중이 높은 임의 노선) 스케줄에서
+직항/1회/2회 경유 일정 검색(가격순/소요시간순 상위 K개)의 지연시간 측정
+- 첫 검색: 노선 그래프 출발일 버킷 적재 포함
+- 이후 검색: 적재된 그래프 + 후보 일정 잔여좌석 확인 쿼리 1회
+정확성은 모든 구간 조합을 전수 탐색한 결과의 비용 목록과 비교
+
+실행: python -m benchmarks.itineraries --flights 50000 --queries 200
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+
+from benchmarks.common import create_sqlite_app
+from config import Config
+from models.airplane import Airplane
+from models.customer import db
+from models.route_graph import route_graph
+from models.seat import Seat
+
+AIRPORTS = [
+    "ICN", "GMP", "NRT", "HND", "KIX", "PEK", "PVG", "HKG", "TPE", "SIN",
+    "BKK", "MNL", "SGN", "DEL", "DXB", "IST", "LHR", "CDG", "FRA", "AMS",
+    "MAD", "FCO", "JFK", "LAX", "SFO", "SEA", "ORD", "YVR", "SYD", "AKL",
+]  # fmt: skip
+HUBS = ["ICN", "NRT", "SIN", "DXB", "FRA", "LAX"]
+FIRST_DAY = date(2030, 1, 1)
+
+
+def seed_network(flights, days, seed=0, batch_size=10000):
+    """
+    허브 중심 임의 노선 스케줄 생성 (좌석등급 2개, 일부 구간은 매진)
+    """
+    rng = random.Random(seed)
+    airplanes = []
+    seats = []
+    for i in range(flights):
+        if rng.random() < 0.6:
+            origin = rng.choice(HUBS)
+        else:
+            origin = rng.choice(AIRPORTS)
+        destination = rng.choice([code for code in AIRPORTS if code != origin])
+        departure = datetime.combine(FIRST_DAY, datetime.min.time()) + timedelta(
+            minutes=rng.randrange(days * 24 * 60 // 5) * 5
+        )
+        flight_number = f"KE{i:07d}"
+        airplanes.append(
+            {
+                "airline": "C-AIR",
+                "flight_number": flight_number,
+                "departure_date_time": departure,
+                "departure_airport": origin,
+                "arrival_date_time": departure
+                + timedelta(minutes=rng.randrange(60, 14 * 60, 5)),
+                "arrival_airport": destination,
+            }
+        )
+        for seat_class, base in (("Business", 1500000), ("Economy", 300000)):
+            seats.append(
+                {
+                    "flight_number": flight_number,
+                    "departure_date_time": departure,
+                    "seat_class": seat_class,
+                    "number_of_seats": 0 if rng.random() < 0.05 else 50,
+                    "price": base + rng.randrange(0, 500) * 1000,
+                }
+            )
+        if len(airplanes) >= batch_size:
+            db.session.execute(insert(Airplane), airplanes)
+            db.session.execute(insert(Seat), seats)
+            airplanes, seats = [], []
+    if airplanes:
+        db.session.execute(insert(Airplane), airplanes)
+        db.session.execute(insert(Seat), seats)
+    db.session.commit()
+
+
+def brute_force_costs(origin, destination, day, seat_class, sort, limit):
+    """
+    모든 구간 조합 전수 탐색 (비교용), 상위 limit개의 비용 리스트 반환
+    """
+    min_connection = timedelta(minutes=Config.CONNECTION_MIN_MINUTES)
+    max_connection = timedelta(hours=Config.CONNECTION_MAX_HOURS)
+    legs = {}
+    for row in db.session.execute(
+        Airplane.route_graph_statement(day, day + timedelta(days=8))
+    ):
+        if row[6] == seat_class and row[7] > 0:
+            legs.setdefault(row[3], []).append(row)
+
+    def cost(path):
+        if sort == "duration":
+            return path[-1][4] - path[0][2]
+        return sum(leg[8] for leg in path)
+
+    def connections(leg, visited):
+        return [
+            nxt
+            for nxt in legs.get(leg[5], ())
+            if leg[4] + min_connection <= nxt[2] < leg[4] + max_connection
+            and nxt[5] not in visited
+        ]
+
+    costs = []
+    for first in legs.get(origin, ()):
+        if first[2].date() != day:
+            continue
+        if first[5] == destination:
+            costs.append(cost([first]))
+            continue
+        for second in connections(first, {origin}):
+            if second[5] == destination:
+                costs.append(cost([first, second]))
+                continue
+            for third in connections(second, {origin, first[5]}):
+                if third[5] == destination:
+                    costs.append(cost([first, second, third]))
+    return sorted(costs)[:limit]
+
+
+def run(flights, days, queries, limit):
+    app = create_sqlite_app()
+    with app.app_context():
+        started = time.perf_counter()
+        seed_network(flights, days)
+        print(
+            f"항공편 {flights:,}개 ({len(AIRPORTS)}개 공항, {days}일) 생성: "
+            f"{time.perf_counter() - started:.1f}s"
+        )
+
+        rng = random.Random(1)
+        cases = []
+        for _ in range(queries):
+            origin, destination = rng.sample(AIRPORTS, 2)
+            day = FIRST_DAY + timedelta(days=rng.randrange(days - 7))
+            sort = rng.choice(["price", "duration"])
+            cases.append((origin, destination, day, sort))
+
+        # 정확성 확인 (전수 탐색과 상위 K개 비용 비교)
+        for origin, destination, day, sort in cases[:5]:
+            results, _ = Airplane.search_itineraries(
+                day.isoformat(), origin, destination, "Economy", sort=sort, limit=limit
+            )
+            found = [
+                (
+                    legs[-1].arrival_date_time - legs[0].departure_date_time
+                    if sort == "duration"
+                    else sum(leg.fares["Economy"] for leg in legs)
+                )
+                for legs, _ in results
+            ]
+            expected = brute_force_costs(
+                origin, destination, day, "Economy", sort, limit
+            )
+            assert found == expected, f"검색 결과 불일치: {origin}->{destination} {day}"
+        print("전수 탐색 결과와 일치 (5개 검색)")
+
+        for label in ("첫 검색(그래프 적재 포함)", "그래프 적재 후"):
+            if label.startswith("첫"):
+                route_graph.clear()
+            timings = []
+            stops = []
+            truncated = 0
+            for origin, destination, day, sort in cases:
+                started = time.perf_counter()
+                results, hit_limit = Airplane.search_itineraries(
+                    day.isoformat(),
+                    origin,
+                    destination,
+                    "Economy",
+                    sort=sort,
+                    limit=limit,
+                )
+                timings.append((time.perf_counter() - started) * 1000)
+                stops.extend(len(legs) - 1 for legs, _ in results)
+                truncated += hit_limit
+            timings.sort()
+            print(
+                f"{label}: 검색 {len(cases)}회, median {statistics.median(timings):.2f}ms, "
+                f"p99 {timings[int(len(timings) * 0.99) - 1]:.2f}ms, max {timings[-1]:.2f}ms, "
+                f"경유 횟수별 결과 {[stops.count(n) for n in range(3)]}, 탐색 한도 도달 {truncated}회"
+            )
+        print(route_graph.stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--flights", type=int, default=50000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+    run(args.flights, args.days, args.queries, args.limit)
@@ -0,0 +1,346 @@
+"""
+WSGI / ASGI 배포 부하 테스트
+
+같은 SQLite DB를 사용하는 두 서버를 각각 별도 프로세스로 띄우고
+동시 접속 클라이언트 C개가 항공편 검색(JSON)과 예약 내역 조회를 반복 요청할 때의
+초당 처리 요청 수와 지연 시간(p50/p99/최대)을 비교
+- wsgi: 현재 배포 방식 (Flask 앱, app.run과 같은 werkzeug 스레드 서버)
+- asgi: asgi.py와 같은 구성 (비동기 조회 라우트 + Flask 앱, uvicorn)
+
+검색 캐시는 기본적으로 끄고(--search-cache로 사용) 매 요청 DB를 조회
+부하 생성기는 asyncio로 직접 HTTP/1.1 요청을 보냄 (연결 유지, 서버가 닫으면 다시 연결)
+
+실행: python -m benchmarks.load_test --clients 1000 --duration 20
+필요 패키지: starlette, uvicorn, a2wsgi, aiosqlite
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from config import Config
+
+SERVERS = ("wsgi", "asgi")
+FIRST_DEPARTURE = datetime(2030, 1, 1, 9, 0)
+
+
+# ---------------------------------------------------------------- 서버 프로세스
+
+
+def create_flask_app(db_path, pool_size, max_overflow):
+    from benchmarks.common import create_sqlite_app
+    from routes.api import api
+    from session_store import create_session_interface
+
+    app = create_sqlite_app(
+        db_path,
+        SECRET_KEY="load-test",
+        SQLALCHEMY_ENGINE_OPTIONS={
+            "connect_args": {"timeout": 30, "check_same_thread": False},
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": Config.DB_POOL_TIMEOUT,
+        },
+    )
+    app.register_blueprint(api, url_prefix="/api")
+    app.session_interface = create_session_interface(
+        {"SESSION_BACKEND": "memory", "SESSION_MEMORY_MAX": 10000}
+    )
+    return app
+
+
+def serve(kind, db_path, port, pool_size, max_overflow):
+    flask_app = create_flask_app(db_path, pool_size, max_overflow)
+    # 요청별 접근 로그는 끄고 비교
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    if kind == "wsgi":
+        from werkzeug.serving import run_simple
+
+        run_simple("127.0.0.1", port, flask_app, threaded=True)
+        return
+
+    import uvicorn
+
+    from routes.async_api import create_asgi_app
+
+    asgi_app = create_asgi_app(
+        flask_app,
+        f"sqlite:///{db_path}",
+        {
+            "connect_args": {"timeout": 30},
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": Config.DB_POOL_TIMEOUT,
+        },
+    )
+    uvicorn.run(
+        asgi_app,
+        host="127.0.0.1",
+        port=port,
+        log_level="warning",
+        access_log=False,
+    )
+
+
+def seed(db_path, flights, reservations):
+    from benchmarks.common import create_sqlite_app
+    from benchmarks.history import seed_history
+
+    app = create_sqlite_app(db_path)
+    with app.app_context():
+        seed_history(reservations, reservations // 5, flights=flights)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(kind, db_path, args):
+    port = free_port()
+    env = dict(os.environ)
+    if not args.search_cache:
+        env["SEARCH_CACHE_SIZE"] = "0"
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.load_test",
+            "--serve",
+            kind,
+            "--db",
+            db_path,
+            "--port",
+            str(port),
+            "--pool-size",
+            str(args.pool_size),
+            "--max-overflow",
+            str(args.max_overflow),
+        ],
+        env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return process, port
+        except OSError:
+            if process.poll() is not None:
+                break
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"{kind} 서버를 시작하지 못했습니다.")
+
+
+def login(port):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    connection.request(
+        "POST",
+        "/api/login",
+        body=json.dumps({"cno": "C100", "password": "pw"}),
+        headers={"Content-Type": "application/json"},
+    )
+    response = connection.getresponse()
+    cookie = response.getheader("Set-Cookie")
+    response.read()
+    connection.close()
+    if not cookie:
+        raise RuntimeError("로그인하지 못했습니다.")
+    return cookie.split(";", 1)[0]
+
+
+# ---------------------------------------------------------------- 부하 생성
+
+
+def make_request_paths(flights, count, history_ratio, seed=0):
+    """
+    요청 경로 목록 생성 (검색: 임의 날짜/노선/좌석등급/정렬, 내역: 예약/취소 첫 페이지)
+    """
+    rng = random.Random(seed)
+    last_day = (FIRST_DEPARTURE + timedelta(minutes=37 * flights)).date()
+    days = (last_day - FIRST_DEPARTURE.date()).days + 1
+    paths = []
+    for _ in range(count):
+        if rng.random() < history_ratio:
+            kind = rng.choice(["reservation", "reservation", "cancellation"])
+            paths.append(("history", f"/api/history?type={kind}&page_size=20"))
+            continue
+        day = FIRST_DEPARTURE.date() + timedelta(days=rng.randrange(days))
+        route = rng.choice([("ICN", "JFK"), ("JFK", "ICN")])
+        paths.append(
+            (
+                "search",
+                f"/api/search?departure_date={day:%Y-%m-%d}"
+                f"&departure_airport={route[0]}&arrival_airport={route[1]}"
+                f"&seat_class={rng.choice(['Economy', 'Business'])}"
+                f"&sort={rng.choice(['price', 'time'])}&page_size=20",
+            )
+        )
+    return paths
+
+
+async def read_response(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    version, status = lines[0].split(" ", 2)[:2]
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    if "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    elif headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.read()
+        return int(status), False
+
+    keep_alive = version == "HTTP/1.1" and headers.get("connection") != "close"
+    return int(status), keep_alive
+
+
+async def client(port, cookie, paths, deadline, results, timeout):
+    reader = writer = None
+    index = random.randrange(len(paths))
+    while time.monotonic() < deadline:
+        name, path = paths[index % len(paths)]
+        index += 1
+        started = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection("127.0.0.1", port), timeout
+                )
+            writer.write(
+                (
+                    f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\n"
+                    f"Accept: application/json\r\nCookie: {cookie}\r\n\r\n"
+                ).encode("ascii")
+            )
+            status, keep_alive = await asyncio.wait_for(read_response(reader), timeout)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+            results.append((name, time.perf_counter() - started, False))
+            if writer is not None:
+                writer.close()
+            reader = writer = None
+            continue
+        results.append((name, time.perf_counter() - started, status == 200))
+        if not keep_alive:
+            writer.close()
+            reader = writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def run_load(port, cookie, paths, clients, duration, timeout):
+    results = []
+    deadline = time.monotonic() + duration
+    started = time.perf_counter()
+    await asyncio.gather(
+        *[
+            client(port, cookie, paths, deadline, results, timeout)
+            for _ in range(clients)
+        ]
+    )
+    return results, time.perf_counter() - started
+
+
+def percentile(values, rate):
+    if not values:
+        return 0.0
+    return values[min(int(len(values) * rate), len(values) - 1)]
+
+
+def summarize(results, elapsed):
+    summary = {}
+    for name in (None, "search", "history"):
+        selected = [r for r in results if name is None or r[0] == name]
+        latencies = sorted(latency for _, latency, ok in selected if ok)
+        summary[name or "all"] = {
+            "requests": len(selected),
+            "errors": sum(1 for _, _, ok in selected if not ok),
+            "rps": len(latencies) / elapsed,
+            "p50": percentile(latencies, 0.50) * 1000,
+            "p99": percentile(latencies, 0.99) * 1000,
+            "max": (latencies[-1] * 1000) if latencies else 0.0,
+        }
+    return summary
+
+
+def run(args):
+    workdir = tempfile.mkdtemp(prefix="c-air-load-")
+    db_path = os.path.join(workdir, "load.db")
+    seed(db_path, args.flights, args.reservations)
+    paths = make_request_paths(args.flights, 10000, args.history_ratio)
+
+    summaries = {}
+    for kind in args.servers:
+        process, port = start_server(kind, db_path, args)
+        try:
+            cookie = login(port)
+            # 준비 운동 (커넥션 풀/문장 캐시 채우기)
+            asyncio.run(run_load(port, cookie, paths, 50, 2, args.timeout))
+            results, elapsed = asyncio.run(
+                run_load(port, cookie, paths, args.clients, args.duration, args.timeout)
+            )
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+        summaries[kind] = summarize(results, elapsed)
+
+    print(
+        f"동시 클라이언트 {args.clients:,}개, {args.duration}초, "
+        f"항공편 {args.flights:,}개, 검색 캐시 {'사용' if args.search_cache else '사용 안 함'}, "
+        f"DB 풀 {args.pool_size}+{args.max_overflow}"
+    )
+    print(
+        f"{'서버':<6}{'요청':<10}{'요청수':>9}{'오류':>8}{'req/s':>10}"
+        f"{'p50(ms)':>10}{'p99(ms)':>10}{'max(ms)':>10}"
+    )
+    for kind, summary in summaries.items():
+        for name, row in summary.items():
+            print(
+                f"{kind:<6}{name:<10}{row['requests']:>9,}{row['errors']:>8,}"
+                f"{row['rps']:>10,.1f}{row['p50']:>10.1f}{row['p99']:>10.1f}"
+                f"{row['max']:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--flights", type=int, default=20000)
+    parser.add_argument("--reservations", type=int, default=2000)
+    parser.add_argument("--history-ratio", type=float, default=0.2)
+    parser.add_argument("--search-cache", action="store_true")
+    parser.add_argument("--pool-size", type=int, default=Config.DB_POOL_SIZE)
+    parser.add_argument("--max-overflow", type=int, default=Config.DB_POOL_MAX_OVERFLOW)
+    parser.add_argument("--servers", nargs="+", choices=SERVERS, default=SERVERS)
+    # 서버 프로세스 실행용 (부하 테스트가 내부적으로 사용)
+    parser.add_argument("--serve", choices=SERVERS)
+    parser.add_argument("--db")
+    parser.add_argument("--port", type=int)
+    args = parser.parse_args()
+    if args.serve:
+        serve(args.serve, args.db, args.port, args.pool_size, args.max_overflow)
+    else:
+        run(args)
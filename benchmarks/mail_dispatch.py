@@ -0,0 +1,216 @@
+"""
+메일 발송기 동작 확인 (로컬 대역 SMTP 서버 사용)
+
+1. 재시도: SMTP 서버가 처음 몇 통을 일시 오류(451)로 거절해도 백오프 후 모두 발송되는지
+2. 실패 보관: 항상 거절(550)되는 수신자는 최대 재시도 후 .failed 파일로 보관되는지
+3. 다중 프로세스: 여러 프로세스가 같은 outbox를 적재해도 메일마다 한 번만 발송되는지
+   (종료된 프로세스가 선점한 채 남긴 메일도 다시 발송)
+
+실행: python -m benchmarks.mail_dispatch --messages 200 --processes 4
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import socketserver
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+
+from mailer import MailDispatcher
+
+
+class StandInSMTPServer(socketserver.ThreadingTCPServer):
+    """
+    수신한 메일의 제목을 세는 최소 SMTP 서버
+    (transient_failures통은 DATA를 451로 거절, bounce 주소는 RCPT를 550으로 거절)
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, transient_failures=0, bounce="bounce@example.com"):
+        super().__init__(("127.0.0.1", 0), StandInSMTPHandler)
+        self.transient_failures = transient_failures
+        self.bounce = bounce
+        self.received = Counter()
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+
+class StandInSMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        server = self.server
+        self.reply("220 stand-in ESMTP")
+        while True:
+            line = self.rfile.readline().decode(errors="replace").strip()
+            if not line:
+                return
+            command = line.split(" ", 1)[0].upper()
+            if command in ("EHLO", "HELO"):
+                self.reply("250 stand-in")
+            elif command == "MAIL":
+                self.reply("250 OK")
+            elif command == "RCPT":
+                self.reply("550 no such user" if server.bounce in line else "250 OK")
+            elif command == "DATA":
+                self.reply("354 end with .")
+                subject = None
+                while True:
+                    data = self.rfile.readline().decode(errors="replace")
+                    if data in ("", ".\r\n", ".\n"):
+                        break
+                    if data.startswith("Subject:"):
+                        subject = data[len("Subject:") :].strip()
+                with server.lock:
+                    if server.rejected < server.transient_failures:
+                        server.rejected += 1
+                        self.reply("451 try again later")
+                        continue
+                    server.received[subject] += 1
+                self.reply("250 queued")
+            elif command == "RSET" or command == "NOOP":
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("502 not implemented")
+
+
+def start_server(**kwargs):
+    server = StandInSMTPServer(**kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_dispatcher(outbox_dir, port, **kwargs):
+    return MailDispatcher(
+        outbox_dir=outbox_dir,
+        smtp_server="127.0.0.1",
+        smtp_port=port,
+        sender_email="c-air@example.com",
+        sender_password="",
+        security="none",
+        retry_backoff=0.05,
+        **kwargs,
+    )
+
+
+def outbox_files(outbox_dir, suffix):
+    return [name for name in os.listdir(outbox_dir) if name.endswith(suffix)]
+
+
+def check_retries(messages, transient_failures):
+    server = start_server(transient_failures=transient_failures)
+    outbox_dir = tempfile.mkdtemp(prefix="c-air-outbox-")
+    dispatcher = make_dispatcher(outbox_dir, server.port, max_retries=3)
+    for n in range(messages):
+        dispatcher.enqueue("user@example.com", f"retry-{n}", "<p>예약 확인</p>")
+    assert dispatcher.wait_until_idle(timeout=30), "재시도 처리 시간 초과"
+    dispatcher.stop()
+    stats = dispatcher.stats()
+    print(
+        f"재시도: 발송 {stats['sent']}통, 재시도 {stats['retried']}회, "
+        f"서버 수신 {sum(server.received.values())}통"
+    )
+    assert stats["sent"] == messages and stats["retried"] == transient_failures
+    assert all(count == 1 for count in server.received.values())
+    assert not outbox_files(outbox_dir, ".json"), "발송한 메일이 outbox에 남음"
+    server.shutdown()
+
+
+def check_failed(max_retries):
+    server = start_server()
+    outbox_dir = tempfile.mkdtemp(prefix="c-air-outbox-")
+    dispatcher = make_dispatcher(outbox_dir, server.port, max_retries=max_retries)
+    message_id = dispatcher.enqueue(server.bounce, "bounce", "<p>예약 확인</p>")
+    assert dispatcher.wait_until_idle(timeout=30), "실패 처리 시간 초과"
+    dispatcher.stop()
+    with open(os.path.join(outbox_dir, message_id + ".failed"), encoding="utf-8") as f:
+        parked = json.load(f)
+    print(
+        f"실패 보관: 시도 {parked['attempts']}회 후 {message_id}.failed "
+        f"({parked['last_error'][:40]}...)"
+    )
+    assert parked["attempts"] == max_retries + 1
+    assert dispatcher.stats()["failed"] == 1
+    assert not outbox_files(outbox_dir, ".json")
+    server.shutdown()
+
+
+def write_message(directory, subject):
+    message = {
+        "id": uuid.uuid4().hex,
+        "to": "user@example.com",
+        "subject": subject,
+        "html": "<p>예약 확인</p>",
+        "attempts": 0,
+    }
+    with open(os.path.join(directory, message["id"] + ".json"), "w") as f:
+        json.dump(message, f)
+
+
+def drain_outbox(outbox_dir, port):
+    dispatcher = make_dispatcher(outbox_dir, port)
+    dispatcher.start()
+    dispatcher.wait_until_idle(timeout=30)
+    dispatcher.stop()
+
+
+def check_processes(messages, processes):
+    server = start_server()
+    outbox_dir = tempfile.mkdtemp(prefix="c-air-outbox-")
+    for n in range(messages):
+        write_message(outbox_dir, f"shared-{n}")
+
+    # 종료된 프로세스가 선점한 채 남긴 메일
+    finished = multiprocessing.Process(target=time.sleep, args=(0,))
+    finished.start()
+    finished.join()
+    orphan_dir = os.path.join(outbox_dir, "sending", str(finished.pid))
+    os.makedirs(orphan_dir)
+    write_message(orphan_dir, "orphan")
+
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=drain_outbox, args=(outbox_dir, server.port))
+        for _ in range(processes)
+    ]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    duplicates = sum(count - 1 for count in server.received.values())
+    print(
+        f"다중 프로세스 {processes}개: {messages + 1}통 중 수신 "
+        f"{len(server.received)}통, 중복 발송 {duplicates}통 ({elapsed:.2f}s)"
+    )
+    assert len(server.received) == messages + 1 and duplicates == 0
+    assert server.received["orphan"] == 1, "종료된 프로세스의 메일 미발송"
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--transient-failures", type=int, default=3)
+    parser.add_argument("--max-retries", type=int, default=2)
+    args = parser.parse_args()
+    check_retries(args.messages, args.transient_failures)
+    check_failed(args.max_retries)
+    check_processes(args.messages, args.processes)
@@ -0,0 +1,107 @@
+"""
+엔드포인트별 SQL 실행 횟수 측정
+
+로그인/예약/예약 취소 API를 고객/항공편 조회 캐시 없이 호출할 때와
+캐시를 사용할 때(같은 고객/항공편을 다시 조회하는 일반적인 경우) 실행되는 SQL 문 수를 비교
+메일 발송 큐 등록은 측정에서 제외
+
+실행: python -m benchmarks.query_counts
+"""
+
+from sqlalchemy import event
+
+from benchmarks.common import create_sqlite_app, seed_flights
+from models.customer import Customer, db
+from models.lookup_cache import customer_cache, flight_cache
+from routes import api as api_routes
+
+
+class QueryCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._count)
+
+    def _count(self, *args):
+        self.count += 1
+
+
+def measure(app, counter, flights, use_cache):
+    for cache in (customer_cache, flight_cache):
+        cache.clear()
+        cache.max_size = 10000 if use_cache else 0
+
+    client = app.test_client()
+    counts = {}
+
+    def call(name, path, body):
+        before = counter.count
+        response = client.post(path, json=body)
+        assert response.get_json()["success"], response.get_json()
+        counts.setdefault(name, []).append(counter.count - before)
+
+    for flight in flights:
+        call("login", "/api/login", {"cno": "C100", "password": "pw"})
+        item = {
+            "flight_number": flight["flight_number"],
+            "departure_date_time": flight["departure_date_time"].strftime(
+                "%Y-%m-%d %H:%M"
+            ),
+            "seat_class": "Economy",
+        }
+        call("reserve", "/api/reserve", {**item, "price": 900000})
+        call(
+            "cancel-reservation",
+            "/api/cancel-reservation",
+            {**item, "departure_date_time": flight["departure_date_time"].isoformat()},
+        )
+        # 같은 항공편을 다시 예약 (취소 기록과 겹치지 않도록 다른 좌석등급)
+        call(
+            "reserve",
+            "/api/reserve",
+            {**item, "seat_class": "Business", "price": 2500000},
+        )
+    return {name: sum(values) / len(values) for name, values in counts.items()}
+
+
+def run(flight_count):
+    app = create_sqlite_app(SECRET_KEY="bench")
+    app.register_blueprint(api_routes.api, url_prefix="/api")
+    # 외부 SMTP 서버로 메일이 나가지 않도록 발송 큐 등록을 생략
+    api_routes.send_reservation_email = lambda *args: (False, "벤치마크: 발송 생략")
+
+    with app.app_context():
+        first = seed_flights(flight_count * 2)
+        db.session.add(
+            Customer(
+                cno="C100",
+                password="pw",
+                name="C100",
+                email="C100@example.com",
+                passport="PC100",
+            )
+        )
+        db.session.commit()
+        counter = QueryCounter(db.engine)
+
+    from models.airplane import Airplane
+
+    with app.app_context():
+        flights = [
+            {
+                "flight_number": airplane.flight_number,
+                "departure_date_time": airplane.departure_date_time,
+            }
+            for airplane in Airplane.query.order_by(Airplane.flight_number)
+        ]
+    assert flights[0]["flight_number"] == first["flight_number"]
+
+    before = measure(app, counter, flights[:flight_count], use_cache=False)
+    after = measure(app, counter, flights[flight_count:], use_cache=True)
+
+    print(f"{'엔드포인트':<22}{'캐시 없음':>10}{'캐시 사용':>10}")
+    for name in before:
+        print(f"{name:<24}{before[name]:>10.1f}{after[name]:>10.1f}")
+
+
+if __name__ == "__main__":
+    run(20)
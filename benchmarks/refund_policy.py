@@ -0,0 +1,87 @@
+"""
+환불 정책 엔진 벤치마크
+
+가상의 취소 N건(결제금액, 출발까지 남은 일수, 좌석등급)에 환불 정책을 적용하여
+한 건씩 계산(refund)과 배열 단위 계산(refunds)의 처리 속도를 비교하고
+좌석등급/남은 일수 구간별 위약금 수입을 집계 (수익 시뮬레이션)
+
+실행: python -m benchmarks.refund_policy --rows 5000000 --policy data/refund_policy.json
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+from models.refund_policy import RefundPolicy
+
+
+def make_cancellations(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    seat_classes = np.where(rng.random(rows) < 0.2, "Business", "Economy")
+    base = np.where(seat_classes == "Business", 2500000, 900000)
+    payments = base + rng.integers(-50, 50, rows) * 10000
+    days = rng.integers(0, 120, rows)
+    return payments, days, seat_classes.astype(object)
+
+
+def run(rows, sample, policy_path):
+    policy = RefundPolicy.from_file(policy_path)
+    payments, days, seat_classes = make_cancellations(rows)
+
+    # 배열 단위 계산
+    started = time.perf_counter()
+    refunds = policy.refunds(payments, days, seat_classes)
+    vector_elapsed = time.perf_counter() - started
+
+    # 한 건씩 계산 (표본만 측정)
+    sample = min(sample, rows)
+    started = time.perf_counter()
+    row_refunds = [
+        policy.refund(int(payment), int(day), seat_class)
+        for payment, day, seat_class in zip(
+            payments[:sample], days[:sample], seat_classes[:sample]
+        )
+    ]
+    row_elapsed = time.perf_counter() - started
+    assert row_refunds == refunds[:sample].tolist(), "계산 결과 불일치"
+
+    print(f"가상 취소 {rows:,}건")
+    print(f"배열 단위: {vector_elapsed:.3f}s ({rows / vector_elapsed:,.0f} rows/sec)")
+    print(
+        f"한 건씩(표본 {sample:,}건): {row_elapsed:.3f}s "
+        f"({sample / row_elapsed:,.0f} rows/sec)"
+    )
+    speedup = (rows / vector_elapsed) / (sample / row_elapsed)
+    print(f"속도 향상: {speedup:,.0f}x")
+
+    # 수익 시뮬레이션 (좌석등급 x 남은 일수 구간별 위약금 수입)
+    frame = pd.DataFrame(
+        {
+            "seat_class": seat_classes,
+            "days": pd.cut(
+                days,
+                [-1, 0, 3, 14, np.inf],
+                labels=["당일", "1~3일", "4~14일", "15일 이상"],
+            ),
+            "payment": payments,
+            "refund": refunds,
+        }
+    )
+    frame["penalty"] = frame["payment"] - frame["refund"]
+    summary = frame.groupby(["seat_class", "days"], observed=True)[
+        ["payment", "refund", "penalty"]
+    ].sum()
+    print(summary.to_string())
+    print(f"위약금 수입 합계: {int(frame['penalty'].sum()):,}원")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--sample", type=int, default=200_000)
+    parser.add_argument("--policy", default=Config.REFUND_POLICY_FILE)
+    args = parser.parse_args()
+    run(args.rows, args.sample, args.policy)
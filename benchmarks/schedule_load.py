@@ -0,0 +1,123 @@
+"""
+운항 스케줄 대량 적재 벤치마크
+
+1. 적재 속도: N행 CSV 파일을 load_schedule()(flask load-schedule)로 적재할 때 초당 행 수
+2. 검증: 잘못된 행(빈 필수값, 길이 초과, 음수, 도착일시 오류)이 모두 제외 건수/오류 목록에
+   나오고 정상 행만 적재되는지
+3. 재적재: 같은 파일을 다시 적재해도 판매로 줄어든 잔여좌석수가 초기화되지 않는지
+
+실행: python -m benchmarks.schedule_load --rows 100000
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+from benchmarks.common import create_sqlite_app
+from models.customer import db
+from models.schedule_loader import load_schedule
+from models.seat import Seat
+
+HEADER = [
+    "airline",
+    "flight_number",
+    "departure_date_time",
+    "departure_airport",
+    "arrival_date_time",
+    "arrival_airport",
+    "seat_class",
+    "price",
+    "number_of_seats",
+]
+
+# (컬럼, 잘못된 값, 오류 메시지에 포함될 내용)
+INVALID_VALUES = [
+    ("flight_number", "", "flight_number: 값 없음"),
+    ("airline", "   ", "airline: 값 없음"),
+    ("flight_number", "X" * 50, "flight_number: "),
+    ("price", "-1", "price: 음수"),
+    ("number_of_seats", "1.5", "number_of_seats: 정수가 아님"),
+    ("arrival_date_time", "2000-01-01 00:00", "arrival_date_time: 출발일시보다 이전"),
+]
+
+
+def schedule_rows(count):
+    start = datetime(2031, 1, 1, 9, 0)
+    for i in range(count):
+        departure = start + timedelta(minutes=37 * (i // 2))
+        yield {
+            "airline": "C-AIR",
+            "flight_number": f"KE{i // 2:07d}",
+            "departure_date_time": departure.strftime("%Y-%m-%d %H:%M"),
+            "departure_airport": "ICN",
+            "arrival_date_time": (departure + timedelta(hours=14)).strftime(
+                "%Y-%m-%d %H:%M"
+            ),
+            "arrival_airport": "JFK",
+            "seat_class": "Business" if i % 2 else "Economy",
+            "price": str(2500000 if i % 2 else 900000),
+            "number_of_seats": "100",
+        }
+
+
+def write_schedule(path, count):
+    """
+    정상 행 count개 + 잘못된 행을 섞은 CSV 생성, 잘못된 행의 (파일 행 번호, 오류 내용) 반환
+    """
+    rows = list(schedule_rows(count))
+    invalid = []
+    for n, (name, value, message) in enumerate(INVALID_VALUES):
+        row = dict(rows[2 * n])  # 앞에 끼워 넣은 잘못된 행이 아닌 정상 행 복사
+        row[name] = value
+        row["flight_number"] = value if name == "flight_number" else f"BAD{n:04d}"
+        # 앞쪽 행 사이에 끼워 넣음 (파일 행 번호는 헤더 제외 1부터)
+        position = 2 * n + 1
+        rows.insert(position, row)
+        invalid.append((position + 1, message))
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=HEADER)
+        writer.writeheader()
+        writer.writerows(rows)
+    return invalid
+
+
+def run(count, batch_size):
+    app = create_sqlite_app()
+    path = os.path.join(tempfile.mkdtemp(prefix="c-air-schedule-"), "schedule.csv")
+    invalid = write_schedule(path, count)
+
+    with app.app_context():
+        result = load_schedule(path, batch_size=batch_size, max_errors=len(invalid))
+        print(
+            f"{result['rows']:,}행 적재: {result['seconds']}s "
+            f"({result['rows_per_sec']:,}행/초, 항공편 {result['flights']:,}건, "
+            f"좌석 {result['seats']:,}건, 제외 {result['rejected']}건)"
+        )
+        for error in result["errors"]:
+            print(f"  제외: {error}")
+        assert result["rejected"] == len(invalid), "잘못된 행이 제외 건수에서 누락"
+        assert result["seats"] == count, "정상 행 적재 누락"
+        for line, message in invalid:
+            assert any(
+                error.startswith(f"{line}행 {message}") for error in result["errors"]
+            ), f"{line}행 오류 누락: {message}"
+
+        # 좌석 판매 후 같은 파일 재적재
+        seat = Seat.query.first()
+        seat.number_of_seats -= 7
+        db.session.commit()
+        key = (seat.flight_number, seat.departure_date_time, seat.seat_class)
+        load_schedule(path, batch_size=batch_size)
+        remaining = Seat.get_available_seats(*key)
+        print(f"재적재 후 잔여좌석 {remaining} (판매 7석 반영 유지)")
+        assert remaining == 93, "재적재 시 잔여좌석 초기화"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+    run(args.rows, args.batch_size)
@@ -0,0 +1,103 @@
+"""
+항공편 검색 인덱스 벤치마크
+
+출발일 조건을 함수로 감싼 기존 방식(인덱스 사용 불가)과
+[day, day + 1) 범위 조건 + 복합 인덱스 방식의 검색 지연시간 비교
+
+실행: python -m benchmarks.search_index --flights 1000000
+"""
+
+import argparse
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, func, text
+
+from benchmarks.common import create_sqlite_app, seed_flights
+from models.airplane import Airplane
+from models.customer import db
+from models.search_cache import search_cache
+from models.seat import Seat
+
+
+def legacy_search(search_date, seat_class):
+    """
+    기존 검색 조건 (TRUNC(DEPARTURE_DATE_TIME) = :day, SQLite에서는 DATE() 사용)
+    """
+    return (
+        db.session.query(Airplane.flight_number, Seat.price)
+        .join(
+            Seat,
+            and_(
+                Airplane.flight_number == Seat.flight_number,
+                Airplane.departure_date_time == Seat.departure_date_time,
+            ),
+        )
+        .filter(
+            func.date(Airplane.departure_date_time) == search_date.isoformat(),
+            Airplane.departure_airport.in_(["ICN"]),
+            Airplane.arrival_airport.in_(["JFK"]),
+            Seat.seat_class == seat_class,
+            Seat.number_of_seats > 0,
+        )
+        .order_by(Seat.price.asc())
+        .all()
+    )
+
+
+def indexed_search(search_date, seat_class):
+    search_cache.clear()
+    return Airplane.search_flights(search_date.isoformat(), "ICN", "JFK", seat_class)
+
+
+def measure(fn, days, repeat):
+    timings = []
+    for _ in range(repeat):
+        for day in days:
+            started = time.perf_counter()
+            fn(day, "Economy")
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), max(timings)
+
+
+def run(flights, repeat):
+    app = create_sqlite_app()
+    with app.app_context():
+        started = time.perf_counter()
+        seed_flights(flights)
+        print(f"{flights:,}개 항공편 생성: {time.perf_counter() - started:.1f}s")
+
+        first_day = datetime(2030, 1, 1).date()
+        last_day = first_day + timedelta(minutes=37 * flights)
+        span = max((last_day - first_day).days, 1)
+        days = [first_day + timedelta(days=span * k // 20) for k in range(20)]
+
+        assert sorted(r[0] for r in legacy_search(days[0], "Economy")) == sorted(
+            r[1] for r in indexed_search(days[0], "Economy")
+        ), "검색 결과 불일치"
+
+        plan = db.session.execute(
+            text(
+                'EXPLAIN QUERY PLAN SELECT 1 FROM "AIRPLANE" '
+                'WHERE "DEPARTURE_AIRPORT" = :d AND "ARRIVAL_AIRPORT" = :a '
+                'AND "DEPARTURE_DATE_TIME" >= :s AND "DEPARTURE_DATE_TIME" < :e'
+            ),
+            {"d": "ICN", "a": "JFK", "s": "2030-01-02", "e": "2030-01-03"},
+        ).fetchall()
+        print("실행 계획:", " / ".join(row[-1] for row in plan))
+
+        for name, fn in (
+            ("기존(함수 조건)", legacy_search),
+            ("범위 조건", indexed_search),
+        ):
+            median, worst = measure(fn, days, repeat)
+            print(f"{name}: median {median:.2f}ms, max {worst:.2f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--flights", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.flights, args.repeat)
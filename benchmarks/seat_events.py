@@ -0,0 +1,118 @@
+"""
+잔여좌석 알림 브로커 벤치마크
+
+대기 중인 구독 S개(검색 결과 한 페이지의 항공편 P개씩 구독)가 있을 때
+- 구독 1개당 메모리
+- 잔여좌석 변경 발행 처리량 (구독 중인 항공편/구독 없는 항공편 혼합)
+- 구독을 기다리는 스레드 W개가 발행 후 깨어나기까지 걸리는 시간
+을 측정 (DB 없이 브로커만 측정)
+
+실행: python -m benchmarks.seat_events --subscribers 10000 --waiters 200
+"""
+
+import argparse
+import random
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from models.seat_events import SeatEventBroker
+
+
+def make_flights(count):
+    start = datetime(2030, 1, 1, 9, 0)
+    return [(f"KE{i:07d}", start + timedelta(minutes=37 * i)) for i in range(count)]
+
+
+def run(subscribers, flights_per_page, flight_count, changes, waiters):
+    rng = random.Random(0)
+    flights = make_flights(flight_count)
+    broker = SeatEventBroker(max_subscribers=subscribers + waiters)
+
+    # 대기 중인 구독 등록 (구독자별 스레드 없음)
+    tracemalloc.start()
+    started = time.perf_counter()
+    subscriptions = [
+        broker.subscribe(rng.sample(flights, flights_per_page))
+        for _ in range(subscribers)
+    ]
+    subscribe_elapsed = time.perf_counter() - started
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"구독 {subscribers:,}개 (항공편 {flights_per_page}개씩, 전체 항공편 {flight_count:,}개)"
+    )
+    print(
+        f"등록: {subscribe_elapsed:.2f}s, 구독당 메모리 {memory / subscribers:,.0f} bytes"
+    )
+
+    # 발행 처리량 (구독 없는 항공편 포함)
+    seat_keys = [
+        (flight_number, departure, seat_class)
+        for flight_number, departure in flights + make_flights(flight_count * 2)
+        for seat_class in ("Business", "Economy")
+    ]
+    started = time.perf_counter()
+    woken = 0
+    for n in range(changes):
+        woken += broker.publish({rng.choice(seat_keys): n % 100})
+    publish_elapsed = time.perf_counter() - started
+    print(
+        f"발행 {changes:,}건: {publish_elapsed:.2f}s "
+        f"({changes / publish_elapsed:,.0f} changes/sec, 깨운 구독 {woken:,}회)"
+    )
+    pending = sum(len(subscription.wait(0)) for subscription in subscriptions)
+    print(f"구독에 쌓인 알림(좌석별 최신 값만 보관): {pending:,}건")
+
+    # 대기 중인 스레드를 깨우는 시간
+    hot_flight = flights[0]
+    waiting = [broker.subscribe([hot_flight]) for _ in range(waiters)]
+    woke_at = []
+    ready = threading.Barrier(waiters + 1)
+
+    def waiter(subscription):
+        ready.wait()
+        if subscription.wait(10):
+            woke_at.append(time.perf_counter())
+
+    threads = [
+        threading.Thread(target=waiter, args=(subscription,))
+        for subscription in waiting
+    ]
+    for thread in threads:
+        thread.start()
+    ready.wait()
+    time.sleep(0.2)
+    published_at = time.perf_counter()
+    broker.publish({(*hot_flight, "Economy"): 0})
+    for thread in threads:
+        thread.join()
+    latencies = sorted(at - published_at for at in woke_at)
+    print(
+        f"대기 스레드 {waiters}개 깨우기: 모두 깨어날 때까지 {latencies[-1] * 1000:.1f}ms "
+        f"(중앙값 {latencies[len(latencies) // 2] * 1000:.1f}ms)"
+    )
+    assert len(latencies) == waiters, "깨어나지 않은 구독이 있습니다."
+
+    for subscription in subscriptions + waiting:
+        broker.unsubscribe(subscription)
+    assert broker.stats()["subscribers"] == 0
+    print(broker.stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--subscribers", type=int, default=10_000)
+    parser.add_argument("--flights-per-page", type=int, default=20)
+    parser.add_argument("--flights", type=int, default=2_000)
+    parser.add_argument("--changes", type=int, default=100_000)
+    parser.add_argument("--waiters", type=int, default=200)
+    args = parser.parse_args()
+    run(
+        args.subscribers,
+        args.flights_per_page,
+        args.flights,
+        args.changes,
+        args.waiters,
+    )
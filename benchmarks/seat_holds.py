@@ -0,0 +1,142 @@
+"""
+좌석 선점 벤치마크
+
+1. 동시 선점: 여러 스레드가 같은 항공편/좌석등급을 선점 후 일부는 예약 전환, 일부는 방치(만료)
+   - 선점 + 예약 수가 잔여좌석 수를 넘지 않는지(초과 판매 없음)
+   - 선점에 성공한 고객은 결제(예약 전환)에서 실패하지 않는지
+   - 만료된 선점의 좌석이 모두 반환되는지 확인
+2. 만료 처리: 유효한 선점 N개 중 M개가 만료됐을 때 스위퍼 1회 처리 시간
+   (힙에서 만료된 선점만 꺼내 배치 단위로 삭제 + 좌석 반환)
+
+실행: python -m benchmarks.seat_holds --threads 16 --seats 200 --holds 100000 --expired 10000
+"""
+
+import argparse
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from benchmarks.common import create_sqlite_app, seed_flights
+from config import Config
+from models.customer import db
+from models.reservation import Reservation
+from models.seat import Seat
+from models.seat_hold import SeatHold, SeatHoldSweeper, seat_hold_sweeper
+
+
+def run_contention(threads, seats, attempts_per_thread, ttl):
+    Config.SEAT_HOLD_TTL = ttl
+    app = create_sqlite_app()
+    with app.app_context():
+        flight = seed_flights(1, seats_per_class=seats)
+    flight_number = flight["flight_number"]
+    departure = flight["departure_date_time"]
+    counts = {"held": 0, "sold_out": 0, "reserved": 0, "confirm_failed": 0}
+    lock = threading.Lock()
+
+    def worker(worker_id):
+        with app.app_context():
+            for i in range(attempts_per_thread):
+                cno = f"C{worker_id:03d}{i:05d}"
+                hold, _ = SeatHold.create_hold(cno, flight_number, departure, "Economy")
+                if hold is None:
+                    with lock:
+                        counts["sold_out"] += 1
+                    continue
+                # 세 명 중 한 명은 결제하지 않고 떠남 (선점 만료)
+                if i % 3 == 2:
+                    with lock:
+                        counts["held"] += 1
+                    continue
+                reservation, _ = Reservation.create_reservation_from_hold(
+                    cno, hold.hold_id
+                )
+                with lock:
+                    counts["reserved" if reservation else "confirm_failed"] += 1
+            db.session.remove()
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    started = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    with app.app_context():
+        remaining = Seat.get_available_seats(flight_number, departure, "Economy")
+        print(
+            f"시도 {threads * attempts_per_thread}회 ({elapsed:.2f}s): "
+            f"예약 {counts['reserved']}, 방치된 선점 {counts['held']}, "
+            f"매진 {counts['sold_out']}, 결제 실패 {counts['confirm_failed']}, "
+            f"잔여좌석 {remaining}"
+        )
+        assert counts["confirm_failed"] == 0, "선점 후 결제 실패"
+        assert counts["reserved"] + counts["held"] + remaining == seats, "초과 판매"
+
+        time.sleep(ttl)
+        expired = seat_hold_sweeper.sweep()
+        remaining = Seat.get_available_seats(flight_number, departure, "Economy")
+        booked = Reservation.query.filter_by(flight_number=flight_number).count()
+        print(f"만료 선점 {expired}건 반환 후 잔여좌석 {remaining}, 예약 행 {booked}")
+        assert remaining + booked == seats, "만료 선점 좌석 반환 누락"
+
+
+def run_sweep(holds, expired, batch_size):
+    app = create_sqlite_app()
+    with app.app_context():
+        seed_flights(1000)
+        flights = [
+            (f"KE{i:07d}", datetime(2030, 1, 1, 9, 0) + timedelta(minutes=37 * i))
+            for i in range(1000)
+        ]
+        now = datetime.now()
+        sweeper = SeatHoldSweeper(batch_size=batch_size)
+        rows = []
+        for n in range(holds):
+            flight_number, departure = flights[n % len(flights)]
+            expires_at = now + timedelta(
+                seconds=(-1 - n % 60) if n < expired else 600 + n % 60
+            )
+            rows.append(
+                {
+                    "hold_id": f"{n:032d}",
+                    "cno": f"C{n:07d}",
+                    "flight_number": flight_number,
+                    "departure_date_time": departure,
+                    "seat_class": "Economy",
+                    "price": 900000,
+                    "created_at": now,
+                    "expires_at": expires_at,
+                }
+            )
+            sweeper.schedule(rows[-1]["hold_id"], expires_at)
+        db.session.execute(insert(SeatHold), rows)
+        db.session.commit()
+
+        started = time.perf_counter()
+        returned = sweeper.sweep(now)
+        elapsed = time.perf_counter() - started
+        stats = sweeper.stats()
+        print(
+            f"선점 {holds:,}개 중 만료 {returned:,}개 반환: {elapsed * 1000:.0f}ms "
+            f"(배치 {stats['sweeps']}회, 남은 힙 {stats['heap']:,}개, "
+            f"남은 선점 {SeatHold.query.count():,}개)"
+        )
+        assert returned == expired
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--seats", type=int, default=200)
+    parser.add_argument("--attempts", type=int, default=30)
+    parser.add_argument("--ttl", type=int, default=2)
+    parser.add_argument("--holds", type=int, default=100000)
+    parser.add_argument("--expired", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    run_contention(args.threads, args.seats, args.attempts, args.ttl)
+    run_sweep(args.holds, args.expired, args.batch_size)
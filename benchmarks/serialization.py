@@ -0,0 +1,161 @@
+"""
+검색 응답 직렬화 벤치마크
+
+검색 결과 1k/10k행을 JSON 응답으로 만드는 시간 비교
+- 조회: ORM 객체(Airplane + Seat) vs SELECT 열 tuple
+- 변환 + 인코딩: 행마다 strftime + 딕셔너리 + jsonify (기존) vs 열 단위 일시 변환 + orjson
+- 압축: gzip/brotli(설치된 경우) 압축 시간과 본문 크기
+
+실행: python -m benchmarks.serialization --rows 1000 10000
+"""
+
+import argparse
+import gzip
+import json
+import statistics
+import time
+
+from flask import jsonify
+from sqlalchemy import and_, select
+
+from benchmarks.common import create_sqlite_app, seed_flights
+from config import Config
+from json_response import brotli, dumps, orjson, search_results
+from models.airplane import Airplane
+from models.customer import db
+from models.seat import Seat
+
+
+def legacy_search_result(row):
+    # 기존 Airplane.to_search_result() (행마다 strftime)
+    return {
+        "airline": row[0],
+        "flight_number": row[1],
+        "departure_date_time": row[2].strftime("%Y-%m-%d %H:%M") if row[2] else None,
+        "departure_airport": row[3],
+        "arrival_date_time": row[4].strftime("%Y-%m-%d %H:%M") if row[4] else None,
+        "arrival_airport": row[5],
+        "seat_class": row[6],
+        "number_of_seats": row[7],
+        "price": row[8],
+    }
+
+
+def join_condition():
+    return and_(
+        Airplane.flight_number == Seat.flight_number,
+        Airplane.departure_date_time == Seat.departure_date_time,
+    )
+
+
+def fetch_entities(count):
+    db.session.expunge_all()
+    return (
+        db.session.query(Airplane, Seat)
+        .join(Seat, join_condition())
+        .order_by(Seat.price)
+        .limit(count)
+        .all()
+    )
+
+
+def fetch_rows(count):
+    statement = (
+        select(
+            Airplane.airline,
+            Airplane.flight_number,
+            Airplane.departure_date_time,
+            Airplane.departure_airport,
+            Airplane.arrival_date_time,
+            Airplane.arrival_airport,
+            Seat.seat_class,
+            Seat.number_of_seats,
+            Seat.price,
+        )
+        .join(Seat, join_condition())
+        .order_by(Seat.price)
+        .limit(count)
+    )
+    return [tuple(row) for row in db.session.execute(statement)]
+
+
+def payload(flights):
+    return {"success": True, "flights": flights, "count": len(flights)}
+
+
+def legacy_encode(rows):
+    return jsonify(payload([legacy_search_result(row) for row in rows])).get_data()
+
+
+def fast_encode(rows):
+    return dumps(payload(search_results(rows)))
+
+
+def measure(fn, arg, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(arg)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), result
+
+
+def run(row_counts, repeat):
+    app = create_sqlite_app()
+    with app.app_context():
+        seed_flights((max(row_counts) + 1) // 2)
+        print(
+            f"JSON 인코더: {'orjson' if orjson is not None else 'json'}, "
+            f"brotli: {'사용' if brotli is not None else '미설치'}"
+        )
+        for count in row_counts:
+            print(f"\n[{count:,}행]")
+            for name, fn in (
+                ("조회: ORM 객체", fetch_entities),
+                ("조회: SELECT 열 tuple", fetch_rows),
+            ):
+                elapsed, _ = measure(fn, count, repeat)
+                print(f"{name}: median {elapsed:.2f}ms")
+
+            rows = fetch_rows(count)
+            legacy_time, legacy_body = measure(legacy_encode, rows, repeat)
+            fast_time, fast_body = measure(fast_encode, rows, repeat)
+            assert json.loads(legacy_body) == json.loads(fast_body), "응답 불일치"
+            print(
+                f"변환 + 인코딩: 기존 {legacy_time:.2f}ms ({len(legacy_body):,} bytes), "
+                f"열 단위 + {'orjson' if orjson is not None else 'json'} "
+                f"{fast_time:.2f}ms ({len(fast_body):,} bytes)"
+            )
+
+            compressors = [
+                (
+                    "gzip",
+                    lambda body: gzip.compress(
+                        body, compresslevel=Config.RESPONSE_GZIP_LEVEL, mtime=0
+                    ),
+                )
+            ]
+            if brotli is not None:
+                compressors.append(
+                    (
+                        "brotli",
+                        lambda body: brotli.compress(
+                            body, quality=Config.RESPONSE_BROTLI_QUALITY
+                        ),
+                    )
+                )
+            for name, compress in compressors:
+                elapsed, compressed = measure(compress, fast_body, repeat)
+                print(
+                    f"{name}: {elapsed:.2f}ms, {len(compressed):,} bytes "
+                    f"({len(compressed) / len(fast_body):.1%})"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
@@ -0,0 +1,104 @@
+"""
+통계 내보내기 메모리 벤치마크
+
+예약 N건에 대한 window01 통계를 전체 DataFrame으로 읽는 방식(기존)과
+청크 스트리밍(iter_stats) 방식의 최대 메모리 사용량(peak RSS) 비교
+(모드마다 별도 프로세스에서 실행하여 peak RSS가 섞이지 않도록 함)
+
+실행: python -m benchmarks.stats_export --rows 10000000
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from benchmarks.common import create_sqlite_app
+from models.customer import db
+from models.reservation import Reservation
+from models.statistics import get_window01_stats, iter_stats
+
+
+def seed_reservations(rows, batch_size=50000):
+    start = datetime(2030, 1, 1, 9, 0)
+    for batch_start in range(0, rows, batch_size):
+        batch = []
+        for i in range(batch_start, min(batch_start + batch_size, rows)):
+            batch.append(
+                {
+                    "cno": f"C{i:09d}",
+                    "flight_number": f"KE{i % 5000:07d}",
+                    "departure_date_time": start + timedelta(hours=i % 5000),
+                    "seat_class": "Economy",
+                    "payment": 900000 + (i % 97) * 1000,
+                    "reserve_date_time": start - timedelta(minutes=i),
+                }
+            )
+        db.session.execute(insert(Reservation), batch)
+        db.session.commit()
+
+
+def peak_rss_mb():
+    # Linux에서 ru_maxrss 단위는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_mode(db_path, mode, chunksize):
+    app = create_sqlite_app(db_path)
+    with app.app_context():
+        started = time.perf_counter()
+        rows = 0
+        if mode == "full":
+            df = get_window01_stats()
+            records = df.to_dict(orient="records")
+            rows = len(records)
+        else:
+            for chunk in iter_stats("window01", chunksize=chunksize):
+                chunk.to_csv(index=False)
+                rows += len(chunk)
+        elapsed = time.perf_counter() - started
+    print(f"{mode}: {rows:,}행, {elapsed:.1f}s, peak RSS {peak_rss_mb():,.0f}MB")
+
+
+def run(rows, chunksize):
+    db_path = os.path.join(tempfile.mkdtemp(prefix="c-air-bench-"), "bench.db")
+    app = create_sqlite_app(db_path)
+    with app.app_context():
+        started = time.perf_counter()
+        seed_reservations(rows)
+        print(f"예약 {rows:,}건 생성: {time.perf_counter() - started:.1f}s")
+
+    for mode in ("stream", "full"):
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.stats_export",
+                "--mode",
+                mode,
+                "--db",
+                db_path,
+                "--chunksize",
+                str(chunksize),
+            ],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000000)
+    parser.add_argument("--chunksize", type=int, default=10000)
+    parser.add_argument("--mode", choices=["stream", "full"])
+    parser.add_argument("--db")
+    args = parser.parse_args()
+    if args.mode:
+        run_mode(args.db, args.mode, args.chunksize)
+    else:
+        run(args.rows, args.chunksize)
@@ -3,6 +3,8 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 
 class Config:
     # Oracle DB 설정 (환경변수에서 값 읽어옴)
@@ -16,11 +18,119 @@ class Config:
     SQLALCHEMY_DATABASE_URI = f"oracle+oracledb://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/?service_name={DB_SERVICE}"
     SQLALCHEMY_TRACK_MODIFICATIONS = False  # SQLAlchemy 이벤트 시스템 비활성화(권장)
 
+    # 커넥션 풀 설정 (SQLAlchemy와 직접 쿼리용 연결이 같은 풀을 사용)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))  # 유지할 최소 커넥션 수
+    DB_POOL_MAX_OVERFLOW = int(os.getenv("DB_POOL_MAX_OVERFLOW", "10"))  # 추가 허용 수
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))  # 대기 제한시간(초)
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # 재연결 주기(초)
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    DB_STMT_CACHE_SIZE = int(os.getenv("DB_STMT_CACHE_SIZE", "50"))  # 문장 캐시 크기
+
     # Flask SECRET_KEY (세션 암호화용)
     SECRET_KEY = os.getenv("SECRET_KEY")
 
+    # 요청 계측 설정 (/metrics 노출 여부, 요청별 기록할 느린 SQL 수, N+1 판정 반복 횟수)
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_SLOWEST_SIZE = int(os.getenv("METRICS_SLOWEST_SIZE", "5"))
+    METRICS_N_PLUS_ONE_THRESHOLD = int(os.getenv("METRICS_N_PLUS_ONE_THRESHOLD", "5"))
+
+    # 세션 저장 방식: sqlite(기본, 여러 워커 공유) / cookie(Flask 기본)
+    # / memory(워커 프로세스가 하나일 때만 사용, 프로세스마다 세션을 따로 보관)
+    SESSION_BACKEND = os.getenv("SESSION_BACKEND", "sqlite").lower()
+    SESSION_MEMORY_MAX = int(os.getenv("SESSION_MEMORY_MAX", "10000"))
+    SESSION_SQLITE_PATH = os.getenv(
+        "SESSION_SQLITE_PATH", os.path.join(BASE_DIR, "sessions.db")
+    )
+
+    # 항공편 검색 결과 캐시 설정 (최대 항목 수, 유효시간(초))
+    SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "1024"))
+    SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "30"))
+
+    # 고객/항공편 정보 조회 캐시 설정 (최대 항목 수, 유효시간(초), 0이면 캐시 사용 안 함)
+    LOOKUP_CACHE_SIZE = int(os.getenv("LOOKUP_CACHE_SIZE", "10000"))
+    LOOKUP_CACHE_TTL = int(os.getenv("LOOKUP_CACHE_TTL", "300"))
+
+    # 검색 결과 페이지 크기
+    SEARCH_PAGE_SIZE = int(os.getenv("SEARCH_PAGE_SIZE", "20"))
+
+    # JSON 응답 압축 설정 (압축할 최소 본문 크기(bytes), gzip 압축 레벨, brotli 품질)
+    RESPONSE_COMPRESS_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESS_MIN_BYTES", "1024"))
+    RESPONSE_GZIP_LEVEL = int(os.getenv("RESPONSE_GZIP_LEVEL", "6"))
+    RESPONSE_BROTLI_QUALITY = int(os.getenv("RESPONSE_BROTLI_QUALITY", "4"))
+
+    # 통계 캐시를 다른 프로세스의 예약/취소와 맞추기 위해 DB 집계 값을 확인하는 주기(초)
+    STATS_CHECK_SECONDS = float(os.getenv("STATS_CHECK_SECONDS", "10"))
+
+    # 요금 달력 설정 (한 번에 조회할 수 있는 최대 일수, 출발일 전후 기본 검색 일수)
+    FARE_CALENDAR_MAX_DAYS = int(os.getenv("FARE_CALENDAR_MAX_DAYS", "62"))
+    FARE_CALENDAR_FLEX_DAYS = int(os.getenv("FARE_CALENDAR_FLEX_DAYS", "3"))
+
+    # 결제 전 좌석 선점 설정 (선점 유지 시간(초), 고객당 최대 선점 수,
+    # 만료 선점을 한 번에 반환할 최대 건수, 다른 프로세스의 선점을 다시 읽는 주기(초),
+    # 다른 프로세스와 겹쳐 반환하지 못한 선점을 다시 시도할 때까지 대기 시간(초))
+    SEAT_HOLD_TTL = int(os.getenv("SEAT_HOLD_TTL", "600"))
+    SEAT_HOLD_MAX_PER_CUSTOMER = int(os.getenv("SEAT_HOLD_MAX_PER_CUSTOMER", "4"))
+    SEAT_HOLD_SWEEP_BATCH = int(os.getenv("SEAT_HOLD_SWEEP_BATCH", "500"))
+    SEAT_HOLD_RESYNC_SECONDS = int(os.getenv("SEAT_HOLD_RESYNC_SECONDS", "60"))
+    SEAT_HOLD_RETRY_SECONDS = int(os.getenv("SEAT_HOLD_RETRY_SECONDS", "5"))
+
+    # 항공편 검색용 메모리 재고 스냅샷 설정 (사용 여부, 스냅샷 최대 유지 시간(초, 이후 다시 적재),
+    # 적재 시 한 번에 읽을 행 수)
+    INVENTORY_ENABLED = os.getenv("INVENTORY_ENABLED", "false").lower() == "true"
+    INVENTORY_MAX_AGE = int(os.getenv("INVENTORY_MAX_AGE", "60"))
+    INVENTORY_LOAD_BATCH = int(os.getenv("INVENTORY_LOAD_BATCH", "50000"))
+
+    # 경유 항공편 검색 설정 (노선 그래프에 보관할 최대 출발일 수, 출발일 버킷 유효시간(초),
+    # 최소/최대 환승 시간, 검색 1회당 최대 탐색 구간 수)
+    ROUTE_GRAPH_MAX_DAYS = int(os.getenv("ROUTE_GRAPH_MAX_DAYS", "400"))
+    ROUTE_GRAPH_TTL = int(os.getenv("ROUTE_GRAPH_TTL", "300"))
+    CONNECTION_MIN_MINUTES = int(os.getenv("CONNECTION_MIN_MINUTES", "60"))
+    CONNECTION_MAX_HOURS = int(os.getenv("CONNECTION_MAX_HOURS", "24"))
+    ITINERARY_MAX_EXPANSIONS = int(os.getenv("ITINERARY_MAX_EXPANSIONS", "200000"))
+
+    # 잔여좌석 실시간 알림(SSE) 설정 (최대 구독자 수, 스트림당 최대 항공편 수,
+    # keep-alive 주석 전송 간격(초), 스트림 최대 유지 시간(초, 이후 브라우저가 자동 재연결))
+    SEAT_EVENTS_MAX_SUBSCRIBERS = int(os.getenv("SEAT_EVENTS_MAX_SUBSCRIBERS", "5000"))
+    SEAT_EVENTS_MAX_FLIGHTS = int(os.getenv("SEAT_EVENTS_MAX_FLIGHTS", "100"))
+    SEAT_EVENTS_HEARTBEAT = int(os.getenv("SEAT_EVENTS_HEARTBEAT", "15"))
+    SEAT_EVENTS_STREAM_TIMEOUT = int(os.getenv("SEAT_EVENTS_STREAM_TIMEOUT", "600"))
+
+    # 예약/취소 내역 조회 페이지 크기 (목록별 한 페이지 항목 수)
+    HISTORY_PAGE_SIZE = int(os.getenv("HISTORY_PAGE_SIZE", "50"))
+
+    # 공항/좌석등급 별칭 데이터 파일 ({코드: [별칭, ...]} 형식의 JSON)
+    AIRPORT_ALIAS_FILE = os.getenv(
+        "AIRPORT_ALIAS_FILE", os.path.join(BASE_DIR, "data", "airports.json")
+    )
+    SEAT_CLASS_ALIAS_FILE = os.getenv(
+        "SEAT_CLASS_ALIAS_FILE", os.path.join(BASE_DIR, "data", "seat_classes.json")
+    )
+
+    # 환불(위약금) 정책 데이터 파일 ({좌석등급: {days, fares, penalties}} 형식의 JSON)
+    REFUND_POLICY_FILE = os.getenv(
+        "REFUND_POLICY_FILE", os.path.join(BASE_DIR, "data", "refund_policy.json")
+    )
+
+    # 일괄 예약 API 한 번에 허용하는 최대 항목 수
+    RESERVATION_BATCH_MAX = int(os.getenv("RESERVATION_BATCH_MAX", "50"))
+
+    # 운항 스케줄 대량 적재 배치 크기 (행 수, executemany 1회 단위)
+    SCHEDULE_LOAD_BATCH_SIZE = int(os.getenv("SCHEDULE_LOAD_BATCH_SIZE", "5000"))
+
     # 이메일 설정 (기본값: 네이버 SMTP)
     SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.naver.com")
     SMTP_PORT = int(os.getenv("SMTP_PORT", "465"))
     SENDER_EMAIL = os.getenv("SENDER_EMAIL", "scw0629@naver.com")
     SENDER_PASSWORD = os.getenv("SENDER_PASSWORD", "singsung9206")
+    # 연결 보안 방식: ssl / starttls / none (기본값: 465번 포트는 ssl, 그 외 starttls)
+    SMTP_SECURITY = os.getenv(
+        "SMTP_SECURITY", "ssl" if SMTP_PORT == 465 else "starttls"
+    ).lower()
+
+    # 메일 발송 큐 설정 (outbox 디렉터리, 큐 크기, 워커 수, 배치 크기, 재시도)
+    MAIL_OUTBOX_DIR = os.getenv("MAIL_OUTBOX_DIR", os.path.join(BASE_DIR, "outbox"))
+    MAIL_QUEUE_SIZE = int(os.getenv("MAIL_QUEUE_SIZE", "1000"))
+    MAIL_WORKERS = int(os.getenv("MAIL_WORKERS", "2"))
+    MAIL_BATCH_SIZE = int(os.getenv("MAIL_BATCH_SIZE", "20"))
+    MAIL_MAX_RETRIES = int(os.getenv("MAIL_MAX_RETRIES", "5"))
+    MAIL_RETRY_BACKOFF = float(os.getenv("MAIL_RETRY_BACKOFF", "2"))  # 초 단위
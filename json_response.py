@@ -0,0 +1,98 @@
+import gzip
+import json
+
+from werkzeug.http import parse_accept_header
+
+from config import Config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 대용량 JSON 응답 인코딩 (항공편 검색 결과)
+# - 결과 행(tuple)을 열 단위로 변환하여 일시 열은 한 번에 문자열로 변환
+# - orjson이 설치되어 있으면 orjson으로, 없으면 표준 json으로 인코딩
+# - Accept-Encoding에 따라 brotli(설치된 경우)/gzip으로 압축 (작은 응답은 압축하지 않음)
+
+# 검색 결과 행(Airplane.search_statement() SELECT 열 순서)의 응답 필드 이름
+SEARCH_RESULT_FIELDS = (
+    "airline",
+    "flight_number",
+    "departure_date_time",
+    "departure_airport",
+    "arrival_date_time",
+    "arrival_airport",
+    "seat_class",
+    "number_of_seats",
+    "price",
+)
+DATE_TIME_COLUMNS = (2, 4)
+
+
+def format_date_times(values):
+    """
+    일시 열을 "YYYY-MM-DD HH:MM" 문자열 리스트로 변환 (strftime보다 빠른 isoformat 사용)
+    """
+    return [
+        value.isoformat(" ", "minutes") if value is not None else None
+        for value in values
+    ]
+
+
+def search_results(rows):
+    """
+    검색 결과 행 리스트를 응답/화면용 딕셔너리 리스트로 변환
+    """
+    if not rows:
+        return []
+    columns = list(zip(*rows))
+    for index in DATE_TIME_COLUMNS:
+        columns[index] = format_date_times(columns[index])
+    return [dict(zip(SEARCH_RESULT_FIELDS, values)) for values in zip(*columns)]
+
+
+def dumps(payload):
+    """
+    JSON 인코딩 (bytes 반환)
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def negotiate_encoding(accept_encoding):
+    """
+    Accept-Encoding 헤더에서 사용할 압축 방식 선택 (br > gzip, 지원하지 않으면 None)
+    """
+    accepted = parse_accept_header(accept_encoding)
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.quality(encoding) > 0:
+            return encoding
+    return None
+
+
+def encode_json_response(payload, accept_encoding=None):
+    """
+    JSON 응답 본문과 헤더 생성, (본문 bytes, 헤더 딕셔너리) 반환
+    """
+    body = dumps(payload)
+    headers = {"Vary": "Accept-Encoding"}
+    if len(body) < Config.RESPONSE_COMPRESS_MIN_BYTES:
+        return body, headers
+
+    encoding = negotiate_encoding(accept_encoding)
+    if encoding == "br":
+        body = brotli.compress(body, quality=Config.RESPONSE_BROTLI_QUALITY)
+    elif encoding == "gzip":
+        body = gzip.compress(body, compresslevel=Config.RESPONSE_GZIP_LEVEL, mtime=0)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return body, headers
@@ -0,0 +1,341 @@
+import json
+import os
+import queue
+import smtplib
+import threading
+import time
+import uuid
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+from config import Config
+
+# 예약 확인 메일 등 외부 메일 발송을 요청 처리와 분리하는 백그라운드 발송기
+# - 메일은 먼저 outbox 디렉터리에 JSON 파일로 저장되므로 서버가 재시작되어도 유실되지 않음
+# - 워커 스레드가 SMTP 연결을 유지/재사용하며 여러 통을 한 번에 발송
+# - 실패 시 지수 백오프로 재시도, 최대 횟수를 넘기면 .failed 파일로 보관
+# - 여러 워커 프로세스가 outbox를 공유하므로 메일 파일을 프로세스별 sending/<pid> 디렉터리로
+#   옮겨(rename) 선점한 프로세스만 발송 (종료된 프로세스가 선점한 메일은 outbox로 되돌림)
+
+
+class MailDispatcher:
+    def __init__(
+        self,
+        outbox_dir,
+        smtp_server,
+        smtp_port,
+        sender_email,
+        sender_password,
+        security="ssl",
+        queue_size=1000,
+        workers=2,
+        batch_size=20,
+        max_retries=5,
+        retry_backoff=2.0,
+        idle_timeout=60.0,
+    ):
+        self.outbox_dir = outbox_dir
+        self.sending_dir = os.path.join(outbox_dir, "sending")
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.sender_email = sender_email
+        self.sender_password = sender_password
+        self.security = security
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.idle_timeout = idle_timeout
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._queued_ids = set()  # 큐 또는 재시도 대기 중인 메일 ID
+        self._lock = threading.Lock()
+        self._threads = []
+        self._stopping = threading.Event()
+        self._overflowed = threading.Event()  # 큐가 가득 차 outbox에만 남은 메일 존재
+        self.sent = 0
+        self.failed = 0
+        self.retried = 0
+
+    # ---------------------------------------------------------------- 공개 API
+
+    def start(self):
+        """
+        워커 스레드 시작 (outbox에 남아 있던 메일도 다시 큐에 넣음)
+        """
+        with self._lock:
+            if self._threads:
+                return
+            os.makedirs(self._claim_dir(), exist_ok=True)
+            self._stopping.clear()
+            for n in range(self.workers):
+                thread = threading.Thread(
+                    target=self._worker, name=f"mail-worker-{n}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+        # 같은 pid를 쓰던 이전 프로세스(컨테이너 재시작 등)가 남긴 메일도 다시 적재
+        with self._lock:
+            pending = set(self._queued_ids)
+        for name in os.listdir(self._claim_dir()):
+            if name.endswith(".json") and name[: -len(".json")] not in pending:
+                self._release(name[: -len(".json")])
+        self._load_outbox()
+
+    def stop(self, timeout=10):
+        """
+        워커 종료 (남은 메일은 outbox에 보존)
+        """
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def enqueue(self, to_email, subject, html_content):
+        """
+        메일을 outbox에 저장하고 발송 큐에 추가 (즉시 반환), 메일 ID 반환
+        """
+        self.start()
+        message = {
+            "id": uuid.uuid4().hex,
+            "to": to_email,
+            "subject": subject,
+            "html": html_content,
+            "attempts": 0,
+        }
+        self._write(message)
+        self._put(message)
+        return message["id"]
+
+    def wait_until_idle(self, timeout=None):
+        """
+        큐와 재시도 대기 메일이 모두 처리될 때까지 대기 (테스트/종료용)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if not self._queued_ids:
+                    return True
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.05)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "queued": len(self._queued_ids),
+                "sent": self.sent,
+                "failed": self.failed,
+                "retried": self.retried,
+                "workers": len(self._threads),
+            }
+
+    # ---------------------------------------------------------------- outbox
+
+    def _path(self, message_id, suffix=".json"):
+        return os.path.join(self.outbox_dir, message_id + suffix)
+
+    def _claim_dir(self, pid=None):
+        # 이 프로세스가 선점한 메일 디렉터리 (fork된 워커마다 달라지도록 매번 pid로 계산)
+        return os.path.join(self.sending_dir, str(pid or os.getpid()))
+
+    def _claimed_path(self, message_id):
+        return os.path.join(self._claim_dir(), message_id + ".json")
+
+    def _write(self, message):
+        # 임시 파일에 쓴 뒤 교체 (쓰는 도중 종료되어도 파일이 깨지지 않도록)
+        os.makedirs(self._claim_dir(), exist_ok=True)
+        path = self._claimed_path(message["id"])
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(message, f, ensure_ascii=False)
+        os.replace(path + ".tmp", path)
+
+    def _release(self, message_id):
+        # 선점한 메일을 outbox로 되돌림 (다른 프로세스 또는 다음 적재 때 다시 선점)
+        try:
+            os.replace(self._claimed_path(message_id), self._path(message_id))
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _process_alive(pid):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    def _recover_orphans(self):
+        # 종료된 프로세스가 선점한 채 남긴 메일을 outbox로 되돌림
+        try:
+            names = os.listdir(self.sending_dir)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if not name.isdigit() or int(name) == os.getpid():
+                continue
+            if self._process_alive(int(name)):
+                continue
+            orphan_dir = self._claim_dir(int(name))
+            for file_name in os.listdir(orphan_dir):
+                if file_name.endswith(".json"):
+                    os.replace(
+                        os.path.join(orphan_dir, file_name),
+                        os.path.join(self.outbox_dir, file_name),
+                    )
+
+    def _load_outbox(self):
+        self._recover_orphans()
+        for name in sorted(os.listdir(self.outbox_dir)):
+            if not name.endswith(".json"):
+                continue
+            # rename은 원자적이므로 같은 파일을 선점한 프로세스는 하나뿐 (실패하면 다른 프로세스가 선점)
+            claimed = os.path.join(self._claim_dir(), name)
+            try:
+                os.rename(os.path.join(self.outbox_dir, name), claimed)
+            except FileNotFoundError:
+                continue
+            try:
+                with open(claimed, encoding="utf-8") as f:
+                    message = json.load(f)
+            except (OSError, ValueError):
+                # 읽을 수 없는 메일은 다시 선점하지 않도록 .failed 파일로 보관
+                os.replace(claimed, self._path(name[: -len(".json")], ".failed"))
+                continue
+            self._put(message)
+
+    def _put(self, message):
+        with self._lock:
+            if message["id"] in self._queued_ids:
+                return
+            self._queued_ids.add(message["id"])
+        self._requeue(message)
+
+    def _requeue(self, message):
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            # 큐가 가득 차면 outbox로 되돌려두고 큐가 비었을 때 다시 적재
+            with self._lock:
+                self._queued_ids.discard(message["id"])
+            self._release(message["id"])
+            self._overflowed.set()
+
+    def _done(self, message):
+        try:
+            os.remove(self._claimed_path(message["id"]))
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self._queued_ids.discard(message["id"])
+            self.sent += 1
+
+    def _retry(self, message, error):
+        message["attempts"] += 1
+        message["last_error"] = str(error)
+        self._write(message)
+
+        if message["attempts"] > self.max_retries:
+            # 최대 재시도 초과 시 .failed 파일로 보관
+            os.replace(
+                self._claimed_path(message["id"]), self._path(message["id"], ".failed")
+            )
+            with self._lock:
+                self._queued_ids.discard(message["id"])
+                self.failed += 1
+            return
+
+        with self._lock:
+            self.retried += 1
+        delay = self.retry_backoff * (2 ** (message["attempts"] - 1))
+        timer = threading.Timer(delay, self._requeue, args=(message,))
+        timer.daemon = True
+        timer.start()
+
+    # ---------------------------------------------------------------- SMTP
+
+    def _connect(self):
+        if self.security == "ssl":
+            server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, timeout=30)
+        else:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=30)
+            if self.security == "starttls":
+                server.starttls()
+        if self.sender_password:
+            server.login(self.sender_email, self.sender_password)
+        return server
+
+    def _build(self, message):
+        msg = MIMEMultipart("alternative")
+        msg["From"] = self.sender_email
+        msg["To"] = message["to"]
+        msg["Subject"] = message["subject"]
+        msg.attach(MIMEText(message["html"], "html", "utf-8"))
+        return msg.as_string()
+
+    @staticmethod
+    def _close(server):
+        try:
+            server.quit()
+        except Exception:
+            pass
+
+    def _worker(self):
+        server = None
+        last_used = time.monotonic()
+        while not self._stopping.is_set():
+            try:
+                batch = [self._queue.get(timeout=1)]
+            except queue.Empty:
+                if self._overflowed.is_set():
+                    self._overflowed.clear()
+                    self._load_outbox()
+                # 오래 사용하지 않은 SMTP 연결은 닫음
+                if server and time.monotonic() - last_used > self.idle_timeout:
+                    self._close(server)
+                    server = None
+                continue
+
+            # 대기 중인 메일을 모아서 같은 연결로 발송
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for message in batch:
+                try:
+                    if server is None:
+                        server = self._connect()
+                    server.sendmail(
+                        self.sender_email, message["to"], self._build(message)
+                    )
+                    self._done(message)
+                except Exception as e:
+                    # 연결 문제일 수 있으므로 다음 메일은 새 연결로 발송
+                    if server is not None:
+                        self._close(server)
+                        server = None
+                    self._retry(message, e)
+            last_used = time.monotonic()
+
+        if server is not None:
+            self._close(server)
+
+
+# 애플리케이션 전역 메일 발송기 (첫 enqueue 시 워커 시작)
+mail_dispatcher = MailDispatcher(
+    outbox_dir=Config.MAIL_OUTBOX_DIR,
+    smtp_server=Config.SMTP_SERVER,
+    smtp_port=Config.SMTP_PORT,
+    sender_email=Config.SENDER_EMAIL,
+    sender_password=Config.SENDER_PASSWORD,
+    security=Config.SMTP_SECURITY,
+    queue_size=Config.MAIL_QUEUE_SIZE,
+    workers=Config.MAIL_WORKERS,
+    batch_size=Config.MAIL_BATCH_SIZE,
+    max_retries=Config.MAIL_MAX_RETRIES,
+    retry_backoff=Config.MAIL_RETRY_BACKOFF,
+)
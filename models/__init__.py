@@ -3,12 +3,18 @@ from .cancellation import Cancellation
 from .customer import Customer, db
 from .reservation import Reservation
 from .seat import Seat
+from .seat_hold import SeatHold
+from .stats_summary import CustomerPayment, CustomerRefund, FlightRevenue
 
 __all__ = [
     "Airplane",
     "Cancellation",
     "Customer",
+    "CustomerPayment",
+    "CustomerRefund",
     "db",
+    "FlightRevenue",
     "Reservation",
     "Seat",
+    "SeatHold",
 ]
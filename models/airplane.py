@@ -1,18 +1,54 @@
 from sqlalchemy import Column, String, DateTime
 from models.customer import db
 from models.seat import Seat
-from sqlalchemy import func, and_, text
-from datetime import datetime
+from models.search_cache import search_cache
+from models.lookup_cache import flight_cache, row_snapshot
+from models.alias_resolver import airport_resolver
+from models.route_graph import route_graph
+from models.inventory import flight_inventory
+from config import Config
+from sqlalchemy import Date, func, and_, event, select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from datetime import date, datetime, timedelta
+
+
+class day_of(FunctionElement):
+    """
+    일시 컬럼의 날짜 부분 (일 단위 GROUP BY용, DB별 함수로 변환)
+    """
+
+    type = Date()
+    name = "day_of"
+    inherit_cache = True
+
+
+@compiles(day_of)
+def _compile_day_of(element, compiler, **kw):
+    return "CAST(%s AS DATE)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(day_of, "oracle")
+def _compile_day_of_oracle(element, compiler, **kw):
+    return "TRUNC(%s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(day_of, "sqlite")
+def _compile_day_of_sqlite(element, compiler, **kw):
+    return "date(%s)" % compiler.process(element.clauses, **kw)
 
 
 class Airplane(db.Model):
     __tablename__ = "AIRPLANE"
-
-    # 공항 코드와 공항명 매핑 (검색 시 한글/영문 모두 지원)
-    AIRPORT_MAPPING = {
-        "ICN": ["인천", "인천공항", "ICN"],
-        "JFK": ["뉴욕", "JFK", "JFK공항"],
-    }
+    __table_args__ = (
+        # 노선 + 출발일시 검색용 복합 인덱스
+        db.Index(
+            "IDX_AIRPLANE_ROUTE_DATE",
+            "DEPARTURE_AIRPORT",
+            "ARRIVAL_AIRPORT",
+            "DEPARTURE_DATE_TIME",
+        ),
+    )
 
     # 항공편 정보 컬럼 정의
     airline = Column("AIRLINE", String(100), nullable=False)  # 항공사명
@@ -31,30 +67,33 @@ class Airplane(db.Model):
     def __repr__(self):
         return f"<Airplane {self.flight_number} {self.departure_date_time}>"
 
+    @classmethod
+    def get_cached(cls, flight_number, departure_date_time):
+        """
+        항공편 정보 조회 (조회 캐시 사용, 컬럼 값 스냅샷 반환)
+        """
+        return flight_cache.get_or_load(
+            (flight_number, departure_date_time),
+            lambda: row_snapshot(
+                cls.query.filter_by(
+                    flight_number=flight_number,
+                    departure_date_time=departure_date_time,
+                ).first()
+            ),
+        )
+
     @classmethod
     def _get_airport_codes(cls, airport_name):
         """
         공항명이나 코드를 받아서 해당하는 공항 코드 리스트 반환 (검색 편의)
         """
-        airport_codes = []
-        for code, names in cls.AIRPORT_MAPPING.items():
-            if any(
-                name.lower() in airport_name.lower()
-                or airport_name.lower() in name.lower()
-                for name in names
-            ):
-                airport_codes.append(code)
-        return airport_codes
+        return airport_resolver.resolve(airport_name)
 
     @classmethod
-    def search_flights(
-        cls, departure_date, departure_airport, arrival_airport, seat_class
-    ):
+    def _get_route_codes(cls, departure_airport, arrival_airport):
         """
-        항공편 검색 메서드 (날짜, 출발/도착공항, 좌석등급)
+        출발/도착 공항 입력값을 공항 코드 리스트로 변환, (출발 코드들, 도착 코드들) 반환
         """
-        search_date = datetime.strptime(departure_date, "%Y-%m-%d").date()
-
         # 공항 코드들 가져오기 (한글/영문 모두 지원)
         departure_codes = cls._get_airport_codes(departure_airport)
         arrival_codes = cls._get_airport_codes(arrival_airport)
@@ -64,13 +103,64 @@ class Airplane(db.Model):
             departure_codes = [departure_airport]
         if not arrival_codes:
             arrival_codes = [arrival_airport]
+        return departure_codes, arrival_codes
+
+    @classmethod
+    def search_key(
+        cls,
+        departure_date,
+        departure_airport,
+        arrival_airport,
+        seat_class,
+        sort="price",
+        order="asc",
+        limit=None,
+        offset=0,
+    ):
+        """
+        검색 조건 정규화 (검색 캐시 키: 출발일, 출발/도착 공항 코드들, 좌석등급, 정렬, 방향, limit, offset)
+        """
+        search_date = datetime.strptime(departure_date, "%Y-%m-%d").date()
+        departure_codes, arrival_codes = cls._get_route_codes(
+            departure_airport, arrival_airport
+        )
 
         # 좌석 등급 매핑 적용 (한글/영문 입력 모두 지원)
         mapped_seat_class = Seat._get_seat_class(seat_class)
 
+        return search_cache.make_key(
+            search_date,
+            departure_codes,
+            arrival_codes,
+            mapped_seat_class,
+            sort,
+            order,
+            limit,
+            offset,
+        )
+
+    @classmethod
+    def search_statement(cls, cache_key):
+        """
+        정규화된 검색 조건(search_key())으로 SELECT 문 생성 (동기/비동기 세션 공용)
+        """
+        (
+            search_date,
+            departure_codes,
+            arrival_codes,
+            seat_class,
+            sort,
+            order,
+            limit,
+            offset,
+        ) = cache_key
+        # 출발일 하루 범위 [day, day + 1) (컬럼에 함수를 씌우지 않아 인덱스 사용 가능)
+        day_start = datetime.combine(search_date, datetime.min.time())
+        day_end = day_start + timedelta(days=1)
+
         # 항공편 + 좌석 정보 조인 후 조건 검색
-        query = (
-            db.session.query(
+        statement = (
+            select(
                 cls.airline,
                 cls.flight_number,
                 cls.departure_date_time,
@@ -88,16 +178,336 @@ class Airplane(db.Model):
                     cls.departure_date_time == Seat.departure_date_time,
                 ),
             )
-            .filter(
+            .where(
+                and_(
+                    cls.departure_date_time >= day_start,
+                    cls.departure_date_time < day_end,
+                    cls.departure_airport.in_(departure_codes),
+                    cls.arrival_airport.in_(arrival_codes),
+                    Seat.seat_class == seat_class,
+                    Seat.number_of_seats > 0,
+                )
+            )
+        )
+
+        # 정렬 (같은 값이면 다른 기준/운항편명 순으로 고정하여 페이지 간 순서 유지)
+        if sort == "time":
+            order_columns = [cls.departure_date_time, Seat.price]
+        else:
+            order_columns = [Seat.price, cls.departure_date_time]
+        direction = "desc" if order == "desc" else "asc"
+        statement = statement.order_by(
+            *[getattr(column, direction)() for column in order_columns],
+            cls.flight_number.asc(),
+        )
+        if offset:
+            statement = statement.offset(offset)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return statement
+
+    @classmethod
+    def search_flights(
+        cls,
+        departure_date,
+        departure_airport,
+        arrival_airport,
+        seat_class,
+        sort="price",
+        order="asc",
+        limit=None,
+        offset=0,
+    ):
+        """
+        항공편 검색 메서드 (날짜, 출발/도착공항, 좌석등급)
+        sort: price(요금순) / time(시간순), order: asc / desc
+        limit/offset: 페이지 단위 조회 (SQL OFFSET/FETCH로 처리)
+        """
+        cache_key = cls.search_key(
+            departure_date,
+            departure_airport,
+            arrival_airport,
+            seat_class,
+            sort=sort,
+            order=order,
+            limit=limit,
+            offset=offset,
+        )
+
+        # 메모리 재고 스냅샷을 쓸 수 있으면 DB 조회 없이 검색
+        rows = flight_inventory.search(*cache_key)
+        if rows is not None:
+            return rows
+
+        # 캐시 조회 (같은 날짜/노선/좌석등급 검색은 DB 조회 생략)
+        cached = search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        results = [
+            tuple(row) for row in db.session.execute(cls.search_statement(cache_key))
+        ]
+        search_cache.set(cache_key, results)
+        return results
+
+    @classmethod
+    def fare_calendar_statement(
+        cls, start_date, end_date, departure_codes, arrival_codes, seat_class
+    ):
+        """
+        출발일별 최저가/예약 가능 항공편 수/잔여좌석 합계 SELECT 문 (GROUP BY 출발일)
+        조회 범위: start_date ~ end_date (date, 양 끝 포함)
+        """
+        day = day_of(cls.departure_date_time)
+        range_start = datetime.combine(start_date, datetime.min.time())
+        range_end = datetime.combine(end_date, datetime.min.time()) + timedelta(days=1)
+        return (
+            select(
+                day,
+                func.min(Seat.price),
+                func.count(),
+                func.sum(Seat.number_of_seats),
+            )
+            .join(
+                Seat,
+                and_(
+                    cls.flight_number == Seat.flight_number,
+                    cls.departure_date_time == Seat.departure_date_time,
+                ),
+            )
+            .where(
                 and_(
-                    func.trunc(cls.departure_date_time) == search_date,
+                    cls.departure_date_time >= range_start,
+                    cls.departure_date_time < range_end,
                     cls.departure_airport.in_(departure_codes),
                     cls.arrival_airport.in_(arrival_codes),
-                    Seat.seat_class == mapped_seat_class,
+                    Seat.seat_class == seat_class,
                     Seat.number_of_seats > 0,
                 )
             )
-            .order_by(Seat.price.asc())
+            .group_by(day)
+        )
+
+    @classmethod
+    def fare_calendar(
+        cls, start_date, end_date, departure_airport, arrival_airport, seat_class
+    ):
+        """
+        요금 달력 조회 (출발일 범위의 날짜별 최저가/예약 가능 여부)
+        [(날짜, 최저가, 예약 가능 항공편 수, 잔여좌석 합계)] 반환, 항공편이 없는 날은 (날짜, None, 0, 0)
+        날짜별 결과는 검색 캐시에 보관하여 좌석 변경 시 해당 날짜만 무효화되고,
+        캐시에 없는 날짜들만 GROUP BY 쿼리 한 번으로 조회
+        """
+        departure_codes, arrival_codes = cls._get_route_codes(
+            departure_airport, arrival_airport
+        )
+        mapped_seat_class = Seat._get_seat_class(seat_class)
+
+        days = [
+            start_date + timedelta(days=n)
+            for n in range((end_date - start_date).days + 1)
+        ]
+        keys = {
+            day: search_cache.make_key(
+                day, departure_codes, arrival_codes, mapped_seat_class, "calendar"
+            )
+            for day in days
+        }
+        fares = {}
+        for day in days:
+            cached = search_cache.get(keys[day])
+            if cached is not None:
+                fares[day] = cached
+
+        missing = [day for day in days if day not in fares]
+        if missing:
+            statement = cls.fare_calendar_statement(
+                missing[0],
+                missing[-1],
+                departure_codes,
+                arrival_codes,
+                mapped_seat_class,
+            )
+            loaded = {
+                cls._to_date(row[0]): (row[1], row[2], row[3] or 0)
+                for row in db.session.execute(statement)
+            }
+            for day in missing:
+                fares[day] = loaded.get(day, (None, 0, 0))
+                search_cache.set(keys[day], fares[day])
+
+        return [(day, *fares[day]) for day in days]
+
+    @classmethod
+    def route_graph_statement(cls, start_day, end_day):
+        """
+        노선 그래프 적재용 SELECT 문 (출발일 범위의 항공편 + 좌석등급별 잔여좌석/가격)
+        """
+        range_start = datetime.combine(start_day, datetime.min.time())
+        range_end = datetime.combine(end_day, datetime.min.time()) + timedelta(days=1)
+        return (
+            select(
+                cls.airline,
+                cls.flight_number,
+                cls.departure_date_time,
+                cls.departure_airport,
+                cls.arrival_date_time,
+                cls.arrival_airport,
+                Seat.seat_class,
+                Seat.number_of_seats,
+                Seat.price,
+            )
+            .join(
+                Seat,
+                and_(
+                    cls.flight_number == Seat.flight_number,
+                    cls.departure_date_time == Seat.departure_date_time,
+                ),
+            )
+            .where(
+                cls.departure_date_time >= range_start,
+                cls.departure_date_time < range_end,
+            )
         )
 
-        return query.all()
+    @classmethod
+    def search_itineraries(
+        cls,
+        departure_date,
+        departure_airport,
+        arrival_airport,
+        seat_class,
+        max_stops=2,
+        sort="price",
+        limit=10,
+    ):
+        """
+        직항/경유 일정 검색 (최대 2회 경유, 최소 환승 시간 적용)
+        sort: price(구간 가격 합계순) / duration(총 소요시간순)
+        반환: ([(구간 Leg 튜플, 잔여좌석(구간별 최솟값))], 탐색 한도 도달 여부)
+        """
+        search_date = datetime.strptime(departure_date, "%Y-%m-%d").date()
+        departure_codes, arrival_codes = cls._get_route_codes(
+            departure_airport, arrival_airport
+        )
+        mapped_seat_class = Seat._get_seat_class(seat_class)
+        min_connection = timedelta(minutes=Config.CONNECTION_MIN_MINUTES)
+        max_connection = timedelta(hours=Config.CONNECTION_MAX_HOURS)
+
+        # 출발일 ~ 마지막 구간이 출발할 수 있는 날까지의 버킷 적재 (구간 비행시간 최대 1일 가정)
+        last_day = search_date + timedelta(days=max_stops * (max_connection.days + 2))
+        missing = route_graph.missing_days(search_date, last_day)
+        if missing:
+            days = [
+                missing[0] + timedelta(days=n)
+                for n in range((missing[-1] - missing[0]).days + 1)
+            ]
+            route_graph.add_rows(
+                days,
+                db.session.execute(cls.route_graph_statement(days[0], days[-1])),
+            )
+
+        # 그래프의 잔여좌석은 적재 시점 값이므로 후보 일정의 좌석을 DB에서 다시 확인
+        # (매진된 구간이 있으면 그래프를 갱신하고 다시 검색)
+        for _ in range(3):
+            itineraries, truncated = route_graph.search(
+                departure_codes,
+                arrival_codes,
+                search_date,
+                mapped_seat_class,
+                max_stops=max_stops,
+                sort=sort,
+                limit=limit * 2,
+                min_connection=min_connection,
+                max_connection=max_connection,
+                max_expansions=Config.ITINERARY_MAX_EXPANSIONS,
+            )
+            flights = list(
+                {
+                    (leg.flight_number, leg.departure_date_time)
+                    for legs in itineraries
+                    for leg in legs
+                }
+            )
+            if flights:
+                route_graph.update_seats(Seat.get_flight_seat_counts(flights))
+            results = [
+                (legs, route_graph.seats_of(legs, mapped_seat_class))
+                for legs in itineraries
+            ]
+            results = [result for result in results if result[1] > 0]
+            if len(results) >= limit or len(results) == len(itineraries):
+                break
+        return results[:limit], truncated
+
+    @staticmethod
+    def to_itinerary_result(legs, number_of_seats, seat_class):
+        """
+        경유 일정(구간 Leg 튜플)을 응답용 딕셔너리로 변환
+        """
+        departure = legs[0].departure_date_time
+        arrival = legs[-1].arrival_date_time
+        return {
+            "legs": [
+                {
+                    "airline": leg.airline,
+                    "flight_number": leg.flight_number,
+                    "departure_date_time": leg.departure_date_time.strftime(
+                        "%Y-%m-%d %H:%M"
+                    ),
+                    "departure_airport": leg.departure_airport,
+                    "arrival_date_time": leg.arrival_date_time.strftime(
+                        "%Y-%m-%d %H:%M"
+                    ),
+                    "arrival_airport": leg.arrival_airport,
+                    "price": leg.fares[seat_class],
+                }
+                for leg in legs
+            ],
+            "stops": len(legs) - 1,
+            "seat_class": seat_class,
+            "price": sum(leg.fares[seat_class] for leg in legs),
+            "number_of_seats": number_of_seats,
+            "departure_date_time": departure.strftime("%Y-%m-%d %H:%M"),
+            "arrival_date_time": arrival.strftime("%Y-%m-%d %H:%M"),
+            "duration_minutes": int((arrival - departure).total_seconds() // 60),
+        }
+
+    @staticmethod
+    def _to_date(value):
+        # DB 드라이버에 따라 날짜가 datetime/문자열로 올 수 있어 date로 통일
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return datetime.strptime(str(value)[:10], "%Y-%m-%d").date()
+
+    @staticmethod
+    def to_calendar_result(row):
+        """
+        요금 달력 행(tuple)을 응답용 딕셔너리로 변환
+        """
+        return {
+            "date": row[0].strftime("%Y-%m-%d"),
+            "min_price": row[1],
+            "flights": row[2],
+            "number_of_seats": row[3],
+            "available": row[2] > 0,
+        }
+
+
+@event.listens_for(Airplane, "after_update")
+@event.listens_for(Airplane, "after_delete")
+def _invalidate_flight_cache(mapper, connection, target):
+    # ORM으로 항공편 정보가 바뀌면 조회 캐시에서 바로 제거
+    flight_cache.invalidate((target.flight_number, target.departure_date_time))
+
+
+@event.listens_for(Airplane, "after_insert")
+@event.listens_for(Airplane, "after_update")
+@event.listens_for(Airplane, "after_delete")
+def _invalidate_route_graph(mapper, connection, target):
+    # ORM으로 항공편이 추가/변경/삭제되면 해당 출발일의 노선 그래프만 다시 적재
+    route_graph.invalidate_days([target.departure_date_time.date()])
+    # 재고 스냅샷은 다시 적재할 때까지 SQL로 검색
+    flight_inventory.invalidate()
@@ -0,0 +1,74 @@
+import json
+
+from config import Config
+
+
+class AliasResolver:
+    """
+    공항명/좌석등급 등의 별칭을 코드로 변환하는 인덱스 (시작 시 한 번만 생성)
+    - 입력값이 별칭(또는 별칭 내 단어)의 앞부분이면 매칭 (예: "인" -> ICN)
+    - 입력값 안에 별칭이 포함되어 있으면 매칭 (예: "인천 국제선" -> ICN)
+    """
+
+    def __init__(self, mapping):
+        # 코드 순서 (결과를 데이터 파일 순서대로 반환하기 위해 사용)
+        self._order = {code: i for i, code in enumerate(mapping)}
+        self._prefixes = {}  # 정규화된 접두사 -> 코드 집합
+        self._trie = {}  # 별칭 문자 트라이 (None 키에 코드 집합 저장)
+
+        for code, names in mapping.items():
+            for name in names:
+                alias = self.normalize(name)
+                if not alias:
+                    continue
+
+                # 별칭 전체 및 별칭 내 각 단어의 접두사 등록
+                for word in {alias, *alias.split(" ")}:
+                    for end in range(1, len(word) + 1):
+                        self._prefixes.setdefault(word[:end], set()).add(code)
+
+                node = self._trie
+                for char in alias:
+                    node = node.setdefault(char, {})
+                node.setdefault(None, set()).add(code)
+
+    @staticmethod
+    def normalize(value):
+        """
+        비교용 정규화 (대소문자, 앞뒤/연속 공백 무시)
+        """
+        return " ".join(str(value).lower().split())
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        JSON 데이터 파일({코드: [별칭, ...]})에서 인덱스 생성
+        """
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def resolve(self, query):
+        """
+        입력값에 해당하는 코드 리스트 반환 (없으면 빈 리스트)
+        """
+        text = self.normalize(query)
+        if not text:
+            return []
+
+        codes = set(self._prefixes.get(text, ()))
+
+        # 입력값의 각 위치에서 트라이를 따라가며 포함된 별칭 탐색
+        for start in range(len(text)):
+            node = self._trie
+            for char in text[start:]:
+                node = node.get(char)
+                if node is None:
+                    break
+                codes.update(node.get(None, ()))
+
+        return sorted(codes, key=self._order.__getitem__)
+
+
+# 애플리케이션 전역 별칭 인덱스 (데이터 파일에서 로드)
+airport_resolver = AliasResolver.from_file(Config.AIRPORT_ALIAS_FILE)
+seat_class_resolver = AliasResolver.from_file(Config.SEAT_CLASS_ALIAS_FILE)
@@ -0,0 +1,51 @@
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+# 비동기(asyncio) DB 엔진 (ASGI 비동기 조회 라우트용)
+# - 모델/쿼리는 동기 앱과 공유하고, 연결만 비동기 드라이버를 사용
+#   (오라클: python-oracledb 비동기 모드, SQLite: aiosqlite)
+
+# 동기 드라이버 -> 같은 DB의 비동기 드라이버
+ASYNC_DRIVERS = {
+    "oracle+oracledb": "oracle+oracledb_async",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+def async_database_uri(database_uri):
+    """
+    동기 앱의 DB 연결 문자열을 비동기 드라이버 연결 문자열로 변환
+    """
+    url = make_url(database_uri)
+    driver = ASYNC_DRIVERS.get(url.drivername)
+    if driver is None:
+        raise ValueError(f"비동기 드라이버를 지원하지 않는 DB입니다: {url.drivername}")
+    return url.set(drivername=driver)
+
+
+def async_engine_options(config):
+    """
+    Config 값으로 비동기 엔진(커넥션 풀) 옵션 구성 (동기 풀과 같은 크기/재연결 설정 사용)
+    """
+    options = {
+        "pool_size": config["DB_POOL_SIZE"],
+        "max_overflow": config["DB_POOL_MAX_OVERFLOW"],
+        "pool_timeout": config["DB_POOL_TIMEOUT"],
+        "pool_recycle": config["DB_POOL_RECYCLE"],
+        "pool_pre_ping": config["DB_POOL_PRE_PING"],
+    }
+    if make_url(config["SQLALCHEMY_DATABASE_URI"]).get_backend_name() == "oracle":
+        # python-oracledb 커넥션별 문장 캐시 크기
+        options["connect_args"] = {"stmtcachesize": config["DB_STMT_CACHE_SIZE"]}
+    return options
+
+
+def create_async_db(database_uri, **engine_options):
+    """
+    비동기 엔진과 세션 생성기 생성, (엔진, async_sessionmaker) 반환
+    """
+    engine = create_async_engine(async_database_uri(database_uri), **engine_options)
+    return engine, async_sessionmaker(engine, expire_on_commit=False)
@@ -1,10 +1,32 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey
+import time
+
+import numpy as np
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    DateTime,
+    ForeignKey,
+    and_,
+    bindparam,
+    delete,
+    insert,
+    select,
+)
 from models.customer import db
+from models.refund_policy import refund_policy
+from models.search_cache import search_cache
+from models.stats_cache import stats_cache
+from models.stats_summary import record_cancellation, record_cancellations
 from datetime import datetime
 
 
 class Cancellation(db.Model):
     __tablename__ = "CANCELLATION"
+    __table_args__ = (
+        # 고객별 취소 내역 조회(취소일시 내림차순 키셋 페이지)용 복합 인덱스
+        db.Index("IDX_CANCELLATION_CNO_CANCEL", "CNO", "CANCEL_DATE_TIME"),
+    )
 
     cno = Column("CNO", String(20), primary_key=True)
     flight_number = Column("FLIGHT_NUMBER", String(20), primary_key=True)
@@ -32,42 +54,190 @@ class Cancellation(db.Model):
         )
 
     @classmethod
-    def _calculate_refund_amount(cls, original_payment, days_before_departure):
+    def _calculate_refund_amount(
+        cls, original_payment, days_before_departure, seat_class=None
+    ):
+        """
+        환불 금액 계산 (환불 정책 데이터 파일의 위약금 규정 적용)
+        """
+        return refund_policy.refund(original_payment, days_before_departure, seat_class)
+
+    @classmethod
+    def _calculate_refund_amounts(
+        cls, payments, days_before_departure, seat_classes=None
+    ):
+        """
+        환불 금액 일괄 계산 (_calculate_refund_amount와 같은 정책을 배열 단위로 적용)
+        """
+        return refund_policy.refunds(payments, days_before_departure, seat_classes)
+
+    @classmethod
+    def cancel_flights(
+        cls, flight_number=None, start=None, end=None, full_refund=False
+    ):
         """
-        환불 금액 계산 (고정 위약금 정책)
+        운항 취소 등으로 항공편의 예약을 일괄 취소 (운항편명 또는 출발일시 범위 [start, end))
+        환불 금액은 배열 단위로 계산, 취소 기록/예약 삭제/좌석 복구를 하나의 트랜잭션으로 처리
+        full_refund가 True면 위약금 없이 전액 환불
         """
-        # 위약금 정책: 15일 이전 150,000원, 14일~4일 180,000원, 3일 이내 250,000원, 당일 전액
-        if days_before_departure >= 15:
-            penalty = 150000  # 150,000원
-        elif days_before_departure >= 4:
-            penalty = 180000  # 180,000원
-        elif days_before_departure >= 1:
-            penalty = 250000  # 250,000원
-        else:
-            penalty = original_payment  # 당일 취소시 전액 위약금
-
-        refund_amount = max(
-            0, original_payment - penalty
-        )  # 환불 금액이 음수가 되지 않도록
-        return refund_amount
+        from models.reservation import Reservation
+        from models.seat import Seat
+
+        conditions = []
+        if flight_number:
+            conditions.append(Reservation.flight_number == flight_number)
+        if start:
+            conditions.append(Reservation.departure_date_time >= start)
+        if end:
+            conditions.append(Reservation.departure_date_time < end)
+        if not conditions:
+            raise ValueError("운항편명 또는 출발일시 범위를 지정해야 합니다.")
+
+        started = time.perf_counter()
+        try:
+            # 대상 예약을 잠그고 한 번에 조회
+            rows = db.session.execute(
+                select(
+                    Reservation.cno,
+                    Reservation.flight_number,
+                    Reservation.departure_date_time,
+                    Reservation.seat_class,
+                    Reservation.payment,
+                )
+                .where(*conditions)
+                .with_for_update()
+            ).all()
+            if not rows:
+                db.session.rollback()
+                return {"reservations": 0, "refund_total": 0, "seconds": 0.0}
+
+            # 같은 좌석을 예전에 취소한 기록이 있으면 CANCELLATION 기본키가 겹침
+            conflicts = db.session.execute(
+                select(db.func.count())
+                .select_from(Reservation)
+                .join(
+                    cls,
+                    and_(
+                        cls.cno == Reservation.cno,
+                        cls.flight_number == Reservation.flight_number,
+                        cls.departure_date_time == Reservation.departure_date_time,
+                        cls.seat_class == Reservation.seat_class,
+                    ),
+                )
+                .where(*conditions)
+            ).scalar()
+            if conflicts:
+                raise ValueError(
+                    f"이미 취소 기록이 있는 좌석의 예약이 {conflicts}건 있어 일괄 취소할 수 없습니다."
+                )
+
+            cnos, flight_numbers, departures, seat_classes, payments = zip(*rows)
+            cancelled_at = datetime.now()
+            if full_refund:
+                refunds = np.asarray(payments, dtype=np.int64)
+            else:
+                # 출발일까지 남은 일수 (timedelta.days와 같이 내림)
+                remaining = np.array(
+                    departures, dtype="datetime64[us]"
+                ) - np.datetime64(cancelled_at, "us")
+                days = remaining // np.timedelta64(1, "D")
+                refunds = cls._calculate_refund_amounts(payments, days, seat_classes)
+            refunds = refunds.tolist()
+
+            # 취소 기록 일괄 INSERT, 예약 일괄 DELETE (기본키 기준 executemany)
+            columns = cls.__table__.c
+            db.session.execute(
+                insert(cls.__table__),
+                [
+                    {
+                        columns.CNO.key: cno,
+                        columns.FLIGHT_NUMBER.key: fn,
+                        columns.DEPARTURE_DATE_TIME.key: departure,
+                        columns.SEAT_CLASS.key: seat_class,
+                        columns.REFUND.key: refund,
+                        columns.CANCEL_DATE_TIME.key: cancelled_at,
+                    }
+                    for cno, fn, departure, seat_class, refund in zip(
+                        cnos, flight_numbers, departures, seat_classes, refunds
+                    )
+                ],
+            )
+            table = Reservation.__table__
+            db.session.execute(
+                delete(table).where(
+                    table.c.CNO == bindparam("cno"),
+                    table.c.FLIGHT_NUMBER == bindparam("flight_number"),
+                    table.c.DEPARTURE_DATE_TIME == bindparam("departure_date_time"),
+                    table.c.SEAT_CLASS == bindparam("seat_class"),
+                ),
+                [
+                    {
+                        "cno": cno,
+                        "flight_number": fn,
+                        "departure_date_time": departure,
+                        "seat_class": seat_class,
+                    }
+                    for cno, fn, departure, seat_class in zip(
+                        cnos, flight_numbers, departures, seat_classes
+                    )
+                ],
+            )
+
+            # 좌석별 취소 건수만큼 잔여좌석 복구
+            counts = {}
+            for key in zip(flight_numbers, departures, seat_classes):
+                counts[key] = counts.get(key, 0) + 1
+            # 복구되지 않은 좌석 행이 있으면 예약 삭제까지 모두 롤백
+            if not Seat.restore_seats(counts):
+                raise ValueError(
+                    "잔여좌석을 복구할 수 없는 좌석이 있어 일괄 취소할 수 없습니다."
+                )
+
+            # 통계 집계 테이블 일괄 반영
+            record_cancellations(
+                list(zip(cnos, flight_numbers, departures, payments, refunds))
+            )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        # 커밋 전에 다시 채워졌을 수 있는 검색 캐시 무효화
+        for _, departure, seat_class in counts:
+            search_cache.invalidate(departure, seat_class)
+        stats_cache.bump()
+
+        return {
+            "reservations": len(rows),
+            "refund_total": int(sum(refunds)),
+            "seconds": round(time.perf_counter() - started, 3),
+        }
 
     @classmethod
     def cancel_reservation_with_fee(
-        cls, cno, flight_number, departure_date_time, seat_class, original_payment
+        cls,
+        cno,
+        flight_number,
+        departure_date_time,
+        seat_class,
+        original_payment,
+        reservation=None,
     ):
         """
         수수료를 적용한 예약 취소
+        reservation: 호출한 쪽에서 이미 조회한 예약 객체 (없으면 다시 조회)
         """
         from models.reservation import Reservation
         from models.seat import Seat
 
         # 예약 존재 확인
-        reservation = Reservation.query.filter_by(
-            cno=cno,
-            flight_number=flight_number,
-            departure_date_time=departure_date_time,
-            seat_class=seat_class,
-        ).first()
+        if reservation is None:
+            reservation = Reservation.query.filter_by(
+                cno=cno,
+                flight_number=flight_number,
+                departure_date_time=departure_date_time,
+                seat_class=seat_class,
+            ).first()
 
         if not reservation:
             return None, "해당 예약을 찾을 수 없습니다."
@@ -77,7 +247,7 @@ class Cancellation(db.Model):
 
         # 환불 금액 계산
         refund_amount = cls._calculate_refund_amount(
-            original_payment, days_before_departure
+            original_payment, days_before_departure, seat_class
         )
 
         try:
@@ -98,7 +268,22 @@ class Cancellation(db.Model):
             # 좌석 수 증가
             Seat.update_seat_count(flight_number, departure_date_time, seat_class, 1)
 
+            # 통계 집계 테이블 증분 반영
+            record_cancellation(
+                cno,
+                flight_number,
+                departure_date_time,
+                reservation.payment,
+                refund_amount,
+            )
+
             db.session.commit()
+            # 커밋 전에 다시 채워졌을 수 있는 검색 캐시 무효화
+            search_cache.invalidate(
+                departure_date_time, Seat._get_seat_class(seat_class)
+            )
+            # 통계 데이터 버전 갱신 (캐시된 통계/차트 폐기 후 사전 렌더링)
+            stats_cache.bump()
 
             return (
                 cancellation,
@@ -1,7 +1,9 @@
 from config import Config
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Column, String
+from sqlalchemy import Column, String, event
+import hmac
+from models.lookup_cache import customer_cache, row_snapshot
 
 # Flask 앱과 DB 객체는 app.py에서 생성된다고 가정
 # 여기서는 모델 클래스만 정의
@@ -22,3 +24,31 @@ class Customer(db.Model):
 
     def __repr__(self):
         return f"<Customer {self.cno}>"
+
+    @classmethod
+    def get_cached(cls, cno):
+        """
+        회원번호로 고객 정보 조회 (조회 캐시 사용, 컬럼 값 스냅샷 반환)
+        """
+        return customer_cache.get_or_load(
+            cno, lambda: row_snapshot(cls.query.filter_by(cno=cno).first())
+        )
+
+    @classmethod
+    def authenticate(cls, cno, password):
+        """
+        회원번호/비밀번호 확인 (조회 캐시 사용), 일치하면 고객 정보 스냅샷 반환
+        """
+        customer = cls.get_cached(cno)
+        if customer and hmac.compare_digest(
+            customer.password.encode("utf-8"), password.encode("utf-8")
+        ):
+            return customer
+        return None
+
+
+@event.listens_for(Customer, "after_update")
+@event.listens_for(Customer, "after_delete")
+def _invalidate_customer_cache(mapper, connection, target):
+    # ORM으로 고객 정보가 바뀌면 조회 캐시에서 바로 제거
+    customer_cache.invalidate(target.cno)
@@ -0,0 +1,78 @@
+import threading
+import time
+
+from sqlalchemy.pool import QueuePool
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    대기 횟수/대기 시간을 함께 기록하는 SQLAlchemy 커넥션 풀
+    (유휴 커넥션도 없고 overflow 한도에도 도달해 반납을 기다려야 하는 경우를 대기로 집계)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def _do_get(self):
+        must_wait = self.checkedin() == 0 and self._overflow >= self._max_overflow > -1
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._stats_lock:
+                self.checkouts += 1
+                if must_wait:
+                    self.waits += 1
+                    self.wait_time_total += elapsed
+                    self.wait_time_max = max(self.wait_time_max, elapsed)
+
+    def statistics(self):
+        """
+        풀 상태 통계 (튜닝용)
+        """
+        with self._stats_lock:
+            return {
+                "pool_size": self.size(),
+                "max_overflow": self._max_overflow,
+                "max_connections": self.size() + max(self._max_overflow, 0),
+                "checked_out": self.checkedout(),
+                "idle": self.checkedin(),
+                "overflow": max(self.overflow(), 0),
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "wait_time_ms_total": round(self.wait_time_total * 1000, 3),
+                "wait_time_ms_max": round(self.wait_time_max * 1000, 3),
+            }
+
+
+def engine_options(config):
+    """
+    Config 값으로 SQLAlchemy 엔진(커넥션 풀) 옵션 구성
+    (min = DB_POOL_SIZE, max = DB_POOL_SIZE + DB_POOL_MAX_OVERFLOW)
+    """
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": config["DB_POOL_SIZE"],
+        "max_overflow": config["DB_POOL_MAX_OVERFLOW"],
+        "pool_timeout": config["DB_POOL_TIMEOUT"],
+        "pool_recycle": config["DB_POOL_RECYCLE"],
+        "pool_pre_ping": config["DB_POOL_PRE_PING"],
+        # python-oracledb 커넥션별 문장 캐시 크기
+        "connect_args": {"stmtcachesize": config["DB_STMT_CACHE_SIZE"]},
+    }
+
+
+def pool_statistics(engine):
+    """
+    엔진의 풀 통계 반환 (InstrumentedQueuePool이 아니면 기본 상태 문자열만 반환)
+    """
+    pool = engine.pool
+    if isinstance(pool, InstrumentedQueuePool):
+        return pool.statistics()
+    return {"status": pool.status()}
@@ -0,0 +1,120 @@
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import contains_eager
+
+from models.cancellation import Cancellation
+from models.customer import db
+from models.reservation import Reservation
+from models.statistics import _keyset_after, encode_cursor
+
+# 고객 예약/취소 내역 조회
+# - 항공편 정보(출발/도착 공항, 도착일시, 항공사)를 JOIN으로 함께 읽어 목록당 쿼리 1번으로 조회
+#   (지연 로딩이면 화면에서 항목마다 AIRPLANE 조회가 한 번씩 발생)
+# - 정렬 키 기준 키셋 페이지 (OFFSET 없이 마지막 항목 다음부터 조회)
+
+# 내역 종류별 (모델, 정렬 키 속성 이름), 정렬 키는 회원번호 안에서 유일하도록 기본키 나머지 컬럼 포함
+HISTORY_KEYS = {
+    "reservation": (
+        Reservation,
+        ["departure_date_time", "flight_number", "seat_class"],
+    ),
+    "cancellation": (
+        Cancellation,
+        ["cancel_date_time", "departure_date_time", "flight_number", "seat_class"],
+    ),
+}
+
+
+def history_statement(kind, cno, start=None, end=None, page_size=50, after=None):
+    """
+    예약/취소 내역 키셋 페이지 SELECT 문 (정렬 키 내림차순, 항공편 정보 JOIN 포함)
+    다음 페이지 존재 여부 확인을 위해 page_size + 1건 조회 (동기/비동기 세션 공용)
+    """
+    model, key_names = HISTORY_KEYS[kind]
+    keys = [getattr(model, name) for name in key_names]
+
+    statement = (
+        select(model)
+        .join(model.airplane)
+        .options(contains_eager(model.airplane))
+        .where(model.cno == cno)
+    )
+    if start:
+        statement = statement.where(model.departure_date_time >= start)
+    if end:
+        statement = statement.where(model.departure_date_time <= end)
+    if after:
+        statement = statement.where(_keyset_after(keys, after, descending=True))
+    return statement.order_by(*[key.desc() for key in keys]).limit(page_size + 1)
+
+
+def split_history_page(kind, rows, page_size):
+    """
+    page_size + 1건 조회 결과를 (한 페이지 행 리스트, 다음 페이지 정렬 키 값 또는 None)으로 분리
+    """
+    _, key_names = HISTORY_KEYS[kind]
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    return rows, [getattr(rows[-1], name) for name in key_names]
+
+
+def get_history_page(kind, cno, start=None, end=None, page_size=50, after=None):
+    """
+    예약/취소 내역 키셋 페이지 조회 (정렬 키 내림차순, 항공편 정보 JOIN 포함)
+    (행 리스트, 다음 페이지 정렬 키 값 또는 None) 반환
+    """
+    statement = history_statement(kind, cno, start, end, page_size, after)
+    rows = db.session.execute(statement).scalars().all()
+    return split_history_page(kind, rows, page_size)
+
+
+def encode_history_cursor(values):
+    """
+    내역 페이지 정렬 키 값을 URL에 넣을 수 있는 커서 문자열로 변환
+    """
+    return encode_cursor(values) if values else None
+
+
+def decode_history_cursor(kind, cursor):
+    """
+    encode_history_cursor()로 만든 커서 문자열을 정렬 키 값으로 복원 (형식이 틀리면 ValueError)
+    """
+    _, key_names = HISTORY_KEYS[kind]
+    values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    if not isinstance(values, list) or len(values) != len(key_names):
+        raise ValueError("잘못된 커서입니다.")
+    try:
+        return [
+            datetime.fromisoformat(value) if name.endswith("date_time") else str(value)
+            for name, value in zip(key_names, values)
+        ]
+    except TypeError:
+        raise ValueError("잘못된 커서입니다.")
+
+
+def history_item(kind, row):
+    """
+    예약/취소 내역 행을 API 응답용 딕셔너리로 변환
+    """
+    airplane = row.airplane
+    item = {
+        "type": kind,
+        "flight_number": row.flight_number,
+        "airline": airplane.airline,
+        "departure_date_time": row.departure_date_time.isoformat(),
+        "departure_airport": airplane.departure_airport,
+        "arrival_date_time": airplane.arrival_date_time.isoformat(),
+        "arrival_airport": airplane.arrival_airport,
+        "seat_class": row.seat_class,
+    }
+    if kind == "reservation":
+        item["payment"] = row.payment
+        item["reserve_date_time"] = row.reserve_date_time.isoformat()
+    else:
+        item["refund"] = row.refund
+        item["cancel_date_time"] = row.cancel_date_time.isoformat()
+    return item
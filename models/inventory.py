@@ -0,0 +1,472 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_, event, select
+from sqlalchemy.orm import Session
+
+from config import Config
+
+# 항공편 검색용 메모리 재고 스냅샷 (선택 기능, INVENTORY_ENABLED)
+# - AIRPLANE ⋈ SEAT 행(항공편 x 좌석등급)을 NumPy 열 배열로 보관하여 검색을 DB 없이 처리
+#   (공항/항공사/좌석등급은 정수 코드, 출발/도착일시는 1970-01-01 기준 분 단위 정수)
+# - 예약/취소 커밋 시 잔여좌석 변경분(delta)을 바로 반영
+# - 스냅샷이 오래되었거나 스케줄이 바뀌면 검색은 SQL로 처리하고 백그라운드에서 다시 적재
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECONDS_PER_MINUTE = 60 * 10**6
+
+
+def to_epoch_minutes(value):
+    return (value - EPOCH) // timedelta(minutes=1)
+
+
+def from_epoch_minutes(minutes):
+    return EPOCH + timedelta(minutes=int(minutes))
+
+
+class _Interner:
+    """
+    문자열 <-> 정수 코드 변환표
+    """
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class InventorySnapshot:
+    """
+    항공편 x 좌석등급 행의 열 배열 (출발일시, 운항편명 순 정렬)
+    """
+
+    def __init__(self, columns, airlines, airports, seat_classes):
+        order = np.lexsort((columns["flight_number"], columns["departure"]))
+        self.departure = columns["departure"][order]
+        self.arrival = columns["arrival"][order]
+        self.flight_number = columns["flight_number"][order]
+        self.airline = columns["airline"][order]
+        self.departure_airport = columns["departure_airport"][order]
+        self.arrival_airport = columns["arrival_airport"][order]
+        self.seat_class = columns["seat_class"][order]
+        self.number_of_seats = columns["number_of_seats"][order]
+        self.price = columns["price"][order]
+        self.airlines = airlines
+        self.airports = airports
+        self.seat_classes = seat_classes
+        self.loaded_at = time.monotonic()
+
+    @property
+    def rows(self):
+        return len(self.departure)
+
+    @property
+    def nbytes(self):
+        return sum(
+            array.nbytes
+            for array in (
+                self.departure,
+                self.arrival,
+                self.flight_number,
+                self.airline,
+                self.departure_airport,
+                self.arrival_airport,
+                self.seat_class,
+                self.number_of_seats,
+                self.price,
+            )
+        )
+
+    def find(self, flight_number, departure_date_time, seat_class):
+        """
+        좌석 키의 행 번호 (없으면 None)
+        """
+        code = self.seat_classes.codes.get(seat_class)
+        if code is None:
+            return None
+        minutes = to_epoch_minutes(departure_date_time)
+        start, end = np.searchsorted(self.departure, [minutes, minutes + 1])
+        matches = np.nonzero(
+            (self.flight_number[start:end] == flight_number.encode())
+            & (self.seat_class[start:end] == code)
+        )[0]
+        return start + int(matches[0]) if len(matches) else None
+
+    def search(
+        self,
+        search_date,
+        departure_codes,
+        arrival_codes,
+        seat_class,
+        sort,
+        order,
+        limit,
+        offset,
+    ):
+        """
+        Airplane.search_statement()와 같은 조건/정렬로 검색, 결과 행(tuple) 리스트 반환
+        """
+        class_code = self.seat_classes.codes.get(seat_class)
+        departure_ids = [
+            self.airports.codes[code]
+            for code in departure_codes
+            if code in self.airports.codes
+        ]
+        arrival_ids = [
+            self.airports.codes[code]
+            for code in arrival_codes
+            if code in self.airports.codes
+        ]
+        if class_code is None or not departure_ids or not arrival_ids:
+            return []
+
+        # 출발일 하루 범위를 이분 탐색으로 자른 뒤 나머지 조건은 배열 마스크로 처리
+        day_start = to_epoch_minutes(datetime.combine(search_date, datetime.min.time()))
+        start, end = np.searchsorted(self.departure, [day_start, day_start + 24 * 60])
+        window = slice(start, end)
+        mask = (
+            (self.seat_class[window] == class_code)
+            & (self.number_of_seats[window] > 0)
+            & np.isin(self.departure_airport[window], departure_ids)
+            & np.isin(self.arrival_airport[window], arrival_ids)
+        )
+        rows = np.nonzero(mask)[0] + start
+
+        # 정렬 (같은 출발일시 안에서는 행 순서가 운항편명 순이므로 행 번호로 동점 처리)
+        price = self.price[rows].astype(np.int64)
+        departure = self.departure[rows].astype(np.int64)
+        if order == "desc":
+            price, departure = -price, -departure
+        if sort == "time":
+            keys = (rows, price, departure)
+        else:
+            keys = (rows, departure, price)
+        rows = rows[np.lexsort(keys)]
+        if offset:
+            rows = rows[offset:]
+        if limit is not None:
+            rows = rows[:limit]
+
+        return [
+            (
+                self.airlines.values[self.airline[row]],
+                self.flight_number[row].decode(),
+                from_epoch_minutes(self.departure[row]),
+                self.airports.values[self.departure_airport[row]],
+                from_epoch_minutes(self.arrival[row]),
+                self.airports.values[self.arrival_airport[row]],
+                self.seat_classes.values[self.seat_class[row]],
+                int(self.number_of_seats[row]),
+                int(self.price[row]),
+            )
+            for row in rows
+        ]
+
+
+def _intern_column(interner, values, dtype):
+    # 배치의 고유값만 변환표에 등록하고 나머지는 배열 인덱싱으로 코드 변환
+    inverse, uniques = pd.factorize(pd.Series(values, dtype=object))
+    codes = np.array([interner.code(value) for value in uniques], dtype=dtype)
+    return codes[inverse]
+
+
+def _minutes_column(values, flight_numbers):
+    # datetime 리스트 -> 분 단위 정수 배열 (초 단위 값이 있으면 ValueError)
+    microseconds = (
+        pd.DatetimeIndex(values).values.astype("datetime64[us]").astype(np.int64)
+    )
+    invalid = np.nonzero(microseconds % MICROSECONDS_PER_MINUTE)[0]
+    if len(invalid):
+        row = invalid[0]
+        raise ValueError(
+            f"분 단위가 아닌 출발/도착일시가 있습니다: {flight_numbers[row]} {values[row]}"
+        )
+    return (microseconds // MICROSECONDS_PER_MINUTE).astype(np.int32)
+
+
+def load_snapshot(connection, batch_size=50000):
+    """
+    AIRPLANE ⋈ SEAT 전체를 배치 단위로 읽어 스냅샷 생성 (배치마다 열 배열로 변환)
+    분 단위가 아닌 출발/도착일시가 있으면 ValueError (분 단위 정수로 표현할 수 없음)
+    """
+    from models.airplane import Airplane
+    from models.seat import Seat
+
+    airlines, airports, seat_classes = _Interner(), _Interner(), _Interner()
+    batches = []
+    statement = select(
+        Airplane.airline,
+        Airplane.flight_number,
+        Airplane.departure_date_time,
+        Airplane.departure_airport,
+        Airplane.arrival_date_time,
+        Airplane.arrival_airport,
+        Seat.seat_class,
+        Seat.number_of_seats,
+        Seat.price,
+    ).join(
+        Seat,
+        and_(
+            Airplane.flight_number == Seat.flight_number,
+            Airplane.departure_date_time == Seat.departure_date_time,
+        ),
+    )
+    result = connection.execution_options(yield_per=batch_size).execute(statement)
+    for rows in result.partitions():
+        (
+            airline,
+            flight_number,
+            departure,
+            departure_airport,
+            arrival,
+            arrival_airport,
+            seat_class,
+            number_of_seats,
+            price,
+        ) = zip(*rows)
+        batches.append(
+            {
+                "airline": _intern_column(airlines, airline, np.int16),
+                # 고정 길이 바이트 문자열 (운항편명 최대 길이만큼만 사용)
+                "flight_number": np.char.encode(np.array(flight_number), "utf-8"),
+                "departure": _minutes_column(departure, flight_number),
+                "departure_airport": _intern_column(
+                    airports, departure_airport, np.int16
+                ),
+                "arrival": _minutes_column(arrival, flight_number),
+                "arrival_airport": _intern_column(airports, arrival_airport, np.int16),
+                "seat_class": _intern_column(seat_classes, seat_class, np.int8),
+                "number_of_seats": np.array(number_of_seats, dtype=np.int32),
+                "price": np.array(price, dtype=np.int64),
+            }
+        )
+
+    columns = {
+        "airline": np.int16,
+        "flight_number": np.bytes_,
+        "departure": np.int32,
+        "departure_airport": np.int16,
+        "arrival": np.int32,
+        "arrival_airport": np.int16,
+        "seat_class": np.int8,
+        "number_of_seats": np.int32,
+        "price": np.int64,
+    }
+    arrays = {
+        name: (
+            np.concatenate([batch[name] for batch in batches])
+            if batches
+            else np.array([], dtype=dtype)
+        )
+        for name, dtype in columns.items()
+    }
+    # 가격이 int32 범위 안이면 int32로 보관
+    if not len(arrays["price"]) or arrays["price"].max() < 2**31:
+        arrays["price"] = arrays["price"].astype(np.int32)
+    return InventorySnapshot(arrays, airlines, airports, seat_classes)
+
+
+class FlightInventory:
+    """
+    검색용 재고 스냅샷 관리 (적재/변경분 반영/만료 판단)
+    - search()가 None을 반환하면 호출한 쪽에서 SQL로 검색
+    - 다른 프로세스의 예약/취소는 max_age 후 다시 적재할 때 반영
+    """
+
+    def __init__(self, enabled=False, max_age=60, batch_size=50000):
+        self.enabled = enabled
+        self.max_age = max_age
+        self.batch_size = batch_size
+        self._snapshot = None
+        self._stale = False
+        self._lock = threading.Lock()
+        self._reload = threading.Event()
+        self._thread = None
+        self._changed_during_load = None  # 적재 중 바뀐 좌석 키
+        self.served = 0
+        self.fallbacks = 0
+        self.deltas = 0
+        self.reloads = 0
+        self.errors = 0
+        self.last_error = None
+
+    def init_app(self, app):
+        """
+        백그라운드 적재 스레드 시작 (시작 시 1회 + 만료/무효화될 때마다 다시 적재)
+        """
+        if self._thread is not None:
+            return
+        self.enabled = True
+        self._reload.set()
+        self._thread = threading.Thread(
+            target=self._reload_loop, args=(app,), daemon=True
+        )
+        self._thread.start()
+
+    def _reload_loop(self, app):
+        while True:
+            self._reload.wait()
+            self._reload.clear()
+            try:
+                with app.app_context():
+                    from models.customer import db
+
+                    self.reload(db.engine)
+            except Exception as e:
+                self.errors += 1
+                self.last_error = str(e)
+                print(f"재고 스냅샷 적재 오류 : {e}")
+
+    def reload(self, engine):
+        """
+        DB에서 스냅샷을 다시 적재하고 교체
+        적재 중 커밋된 좌석은 스냅샷에 반영됐는지 알 수 없으므로 교체 후 현재 값을 다시 읽어 덮어씀
+        (적재 중 스케줄이 바뀌었으면 교체 후에도 만료 상태를 유지하여 한 번 더 적재)
+        """
+        from models.seat_events import read_seat_counts
+
+        with self._lock:
+            self._changed_during_load = set()
+            self._stale = False
+        try:
+            with engine.connect() as connection:
+                snapshot = load_snapshot(connection, self.batch_size)
+        except Exception:
+            with self._lock:
+                self._changed_during_load = None
+                self._stale = True
+            raise
+
+        with self._lock:
+            changed = self._changed_during_load
+            self._changed_during_load = None
+            self._snapshot = snapshot
+            self.reloads += 1
+        if changed:
+            with engine.connect() as connection:
+                counts = read_seat_counts(connection, changed)
+            with self._lock:
+                for key, count in counts.items():
+                    row = snapshot.find(*key)
+                    if row is not None:
+                        snapshot.number_of_seats[row] = count
+
+    def _usable(self):
+        snapshot = self._snapshot
+        if snapshot is None or self._stale:
+            return None
+        if time.monotonic() - snapshot.loaded_at >= self.max_age:
+            self._stale = True
+            self._reload.set()
+            return None
+        return snapshot
+
+    def search(self, *conditions):
+        """
+        스냅샷으로 항공편 검색 (conditions: 검색 캐시 키와 같은 정규화된 조건)
+        스냅샷을 쓸 수 없으면 None 반환
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            snapshot = self._usable()
+            if snapshot is None:
+                self.fallbacks += 1
+                return None
+            self.served += 1
+            return snapshot.search(*conditions)
+
+    def apply_deltas(self, deltas):
+        """
+        커밋된 잔여좌석 변경분 반영 (deltas: {(운항편명, 출발일시, 좌석등급): 변경 수})
+        스냅샷에 없는 좌석이면 스냅샷을 만료 처리하고 다시 적재
+        """
+        with self._lock:
+            if self._changed_during_load is not None:
+                self._changed_during_load.update(deltas)
+            snapshot = self._snapshot
+            if snapshot is None:
+                return
+            for key, change in deltas.items():
+                row = snapshot.find(*key)
+                if row is None:
+                    self._stale = True
+                    self._reload.set()
+                    continue
+                snapshot.number_of_seats[row] += change
+                self.deltas += 1
+
+    def invalidate(self):
+        """
+        스케줄이 바뀌면 스냅샷 만료 처리 (다시 적재할 때까지 SQL로 검색)
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._stale = True
+        self._reload.set()
+
+    def stats(self):
+        with self._lock:
+            snapshot = self._snapshot
+            stats = {
+                "enabled": self.enabled,
+                "ready": snapshot is not None and not self._stale,
+                "served": self.served,
+                "fallbacks": self.fallbacks,
+                "deltas": self.deltas,
+                "reloads": self.reloads,
+                "errors": self.errors,
+                "last_error": self.last_error,
+            }
+            if snapshot is not None:
+                stats.update(
+                    {
+                        "rows": snapshot.rows,
+                        "bytes": snapshot.nbytes,
+                        "age": round(time.monotonic() - snapshot.loaded_at, 1),
+                    }
+                )
+            return stats
+
+
+def record_seat_deltas(session, deltas):
+    """
+    현재 트랜잭션의 잔여좌석 변경분 기록 (커밋 후 재고 스냅샷에 반영)
+    """
+    if not flight_inventory.enabled:
+        return
+    pending = session.info.setdefault("seat_deltas", {})
+    for key, change in deltas.items():
+        pending[key] = pending.get(key, 0) + change
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_seat_deltas(session):
+    # SAVEPOINT 해제(begin_nested 종료)에서도 호출되므로 바깥 트랜잭션 커밋에서만 반영
+    if session.in_nested_transaction():
+        return
+    deltas = session.info.pop("seat_deltas", None)
+    if deltas:
+        flight_inventory.apply_deltas(deltas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_seat_deltas(session):
+    if not session.in_nested_transaction():
+        session.info.pop("seat_deltas", None)
+
+
+# 애플리케이션 전역 재고 스냅샷 (app.py에서 INVENTORY_ENABLED일 때 init_app)
+flight_inventory = FlightInventory(
+    max_age=Config.INVENTORY_MAX_AGE, batch_size=Config.INVENTORY_LOAD_BATCH
+)
@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from sqlalchemy import inspect
+
+from config import Config
+
+
+class LookupCache:
+    """
+    자주 다시 조회하는 행(고객, 항공편 정보)의 읽기 캐시 (LRU + TTL)
+    - 캐시에 없으면 loader()로 DB에서 읽어 저장 (read-through)
+    - 값이 바뀌는 곳에서 invalidate()/clear()로 즉시 폐기
+    - ORM 객체 대신 컬럼 값 스냅샷(row_snapshot)을 저장하여 세션과 무관하게 사용
+    """
+
+    def __init__(self, max_size=10000, ttl=300):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (저장 시각, 값)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get_or_load(self, key, loader):
+        """
+        캐시된 값 반환, 없거나 만료되었으면 loader() 결과를 저장 후 반환 (None은 저장하지 않음)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = loader()
+        if value is not None and self.max_size > 0:
+            with self._lock:
+                self._entries[key] = (time.monotonic(), value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, key):
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self):
+        """
+        캐시 통계 (항목 수, 적중/미스 횟수, 적중률)
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_snapshot_types = {}
+
+
+def row_snapshot(instance):
+    """
+    ORM 객체의 컬럼 값을 읽기 전용 namedtuple로 복사 (속성 이름은 모델과 동일)
+    """
+    if instance is None:
+        return None
+    model = type(instance)
+    snapshot_type = _snapshot_types.get(model)
+    if snapshot_type is None:
+        names = [prop.key for prop in inspect(model).column_attrs]
+        snapshot_type = namedtuple(f"{model.__name__}Row", names)
+        _snapshot_types[model] = snapshot_type
+    return snapshot_type(*(getattr(instance, name) for name in snapshot_type._fields))
+
+
+# 애플리케이션 전역 조회 캐시 (고객 정보, 항공편 정보)
+customer_cache = LookupCache(
+    max_size=Config.LOOKUP_CACHE_SIZE, ttl=Config.LOOKUP_CACHE_TTL
+)
+flight_cache = LookupCache(
+    max_size=Config.LOOKUP_CACHE_SIZE, ttl=Config.LOOKUP_CACHE_TTL
+)
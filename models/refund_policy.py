@@ -0,0 +1,106 @@
+import json
+from bisect import bisect_right
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+
+
+class RefundPolicy:
+    """
+    데이터로 정의한 환불(위약금) 정책
+    - 좌석등급별로 출발일까지 남은 일수 구간(days)과 결제금액 구간(fares)을 나누고
+      구간마다 위약금(고정 금액 amount 또는 결제금액 대비 비율 rate)을 지정
+    - 구간 탐색은 이분 탐색(bisect / np.searchsorted)으로 수행하며,
+      한 건씩(refund) 또는 배열 단위(refunds)로 같은 정책을 적용
+    - "*" 항목은 정책이 따로 없는 좌석등급에 적용
+    """
+
+    DEFAULT_CLASS = "*"
+
+    def __init__(self, rules):
+        self._rules = {}
+        for seat_class, rule in rules.items():
+            days = [int(bound) for bound in rule["days"]]
+            fares = [int(bound) for bound in rule.get("fares", [])]
+            penalties = rule["penalties"]
+            if days != sorted(days) or fares != sorted(fares):
+                raise ValueError(f"{seat_class}: 구간 경계는 오름차순이어야 합니다.")
+            if len(penalties) != len(fares) + 1 or any(
+                len(row) != len(days) + 1 for row in penalties
+            ):
+                raise ValueError(
+                    f"{seat_class}: 위약금 표 크기가 구간 수와 맞지 않습니다."
+                )
+            amounts = [[cell.get("amount", 0) for cell in row] for row in penalties]
+            rates = [[cell.get("rate", 0.0) for cell in row] for row in penalties]
+            self._rules[seat_class] = (
+                days,
+                fares,
+                amounts,
+                rates,
+                np.array(days),
+                np.array(fares),
+                np.array(amounts, dtype=np.int64),
+                np.array(rates, dtype=np.float64),
+            )
+        if self.DEFAULT_CLASS not in self._rules:
+            raise ValueError('기본 정책("*")이 필요합니다.')
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        JSON 정책 파일({좌석등급: {days, fares, penalties}})에서 정책 생성
+        """
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _rule(self, seat_class):
+        return self._rules.get(seat_class) or self._rules[self.DEFAULT_CLASS]
+
+    def refund(self, payment, days_before_departure, seat_class=None):
+        """
+        환불 금액 계산 (한 건)
+        """
+        days, fares, amounts, rates = self._rule(seat_class)[:4]
+        fare_tier = bisect_right(fares, payment)
+        day_tier = bisect_right(days, days_before_departure)
+        penalty = amounts[fare_tier][day_tier] + round(
+            rates[fare_tier][day_tier] * payment
+        )
+        return max(0, payment - penalty)  # 환불 금액이 음수가 되지 않도록
+
+    def refunds(self, payments, days_before_departure, seat_classes=None):
+        """
+        환불 금액 일괄 계산 (NumPy 배열/pandas Series 입력, int64 배열 반환)
+        """
+        payments = np.asarray(payments, dtype=np.int64)
+        days_before_departure = np.asarray(days_before_departure)
+        penalties = np.zeros(len(payments), dtype=np.int64)
+
+        if seat_classes is None:
+            groups = [(None, slice(None))]
+        else:
+            # 좌석등급 문자열을 정수 코드로 바꾼 뒤 등급별로 나누어 계산
+            codes, uniques = pd.factorize(np.asarray(seat_classes, dtype=object))
+            groups = [
+                (seat_class, codes == code) for code, seat_class in enumerate(uniques)
+            ]
+            if (codes < 0).any():
+                # 좌석등급이 없는 행(None)은 기본 정책 적용
+                groups.append((None, codes < 0))
+
+        for seat_class, mask in groups:
+            _, _, _, _, days, fares, amounts, rates = self._rule(seat_class)
+            fare_tier = np.searchsorted(fares, payments[mask], side="right")
+            day_tier = np.searchsorted(days, days_before_departure[mask], side="right")
+            penalties[mask] = amounts[fare_tier, day_tier] + np.round(
+                rates[fare_tier, day_tier] * payments[mask]
+            ).astype(np.int64)
+
+        return np.maximum(payments - penalties, 0)
+
+
+# 애플리케이션 전역 환불 정책 (데이터 파일에서 로드)
+refund_policy = RefundPolicy.from_file(Config.REFUND_POLICY_FILE)
@@ -1,11 +1,31 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, insert, tuple_
+from sqlalchemy.exc import IntegrityError
 from models.customer import db
 from models.seat import Seat
+from models.seat_hold import SeatHold, seat_hold_sweeper
+from models.search_cache import search_cache
+from models.stats_cache import stats_cache
+from models.stats_summary import record_reservation, record_reservations
 from datetime import datetime
 
 
+def _mark_failed(results, message="다른 항목의 오류로 예약되지 않았습니다."):
+    """
+    일괄 예약 실패 시 아직 성공으로 표시된 항목을 실패로 변경
+    """
+    for result in results:
+        if result["success"]:
+            result.update(success=False, message=message)
+        result.pop("payment", None)
+    return results
+
+
 class Reservation(db.Model):
     __tablename__ = "RESERVATION"
+    __table_args__ = (
+        # 고객별 예약 내역 조회(출발일시 내림차순 키셋 페이지)용 복합 인덱스
+        db.Index("IDX_RESERVATION_CNO_DEPARTURE", "CNO", "DEPARTURE_DATE_TIME"),
+    )
 
     # 예약 정보 컬럼 정의
     cno = Column("CNO", String(20), primary_key=True)  # 회원번호
@@ -48,44 +68,215 @@ class Reservation(db.Model):
     ):
         """
         새로운 예약 생성 (좌석 가용성, 중복 예약 체크 포함)
+        좌석 차감(조건부 UPDATE)과 예약 INSERT를 하나의 트랜잭션으로 처리
         """
-        # 좌석 가용성 확인
-        available_seats = Seat.get_available_seats(
-            flight_number, departure_date_time, seat_class
-        )
-        if available_seats <= 0:
-            return None, "해당 좌석 등급의 가용 좌석이 없습니다."
-
-        # 중복 예약 확인
-        existing_reservation = cls.query.filter_by(
-            cno=cno,
-            flight_number=flight_number,
-            departure_date_time=departure_date_time,
-            seat_class=seat_class,
-        ).first()
-
-        if existing_reservation:
-            return None, "이미 예약된 항공편입니다."
+        try:
+            # 좌석 차감 (잔여좌석이 있을 때만 UPDATE, rowcount로 성공 여부 판단)
+            if not Seat.reserve_seat(flight_number, departure_date_time, seat_class):
+                db.session.rollback()
+                return None, "해당 좌석 등급의 가용 좌석이 없습니다."
 
-        # 예약 생성
-        reservation = cls(
-            cno=cno,
-            flight_number=flight_number,
-            departure_date_time=departure_date_time,
-            seat_class=seat_class,
-            payment=payment,
-        )
+            # 예약 생성 (중복 예약은 기본키 제약조건으로 확인)
+            reservation = cls(
+                cno=cno,
+                flight_number=flight_number,
+                departure_date_time=departure_date_time,
+                seat_class=seat_class,
+                payment=payment,
+            )
+            db.session.add(reservation)
+            db.session.flush()
+            # 통계 집계 테이블 증분 반영
+            record_reservation(cno, flight_number, departure_date_time, payment)
+            db.session.commit()
+            # 커밋 전에 다시 채워졌을 수 있는 검색 캐시 무효화
+            search_cache.invalidate(
+                departure_date_time, Seat._get_seat_class(seat_class)
+            )
+            # 통계 데이터 버전 갱신 (캐시된 통계/차트 폐기 후 사전 렌더링)
+            stats_cache.bump()
+            return reservation, "예약이 성공적으로 완료되었습니다."
+        except IntegrityError:
+            db.session.rollback()
+            return None, "이미 예약된 항공편입니다."
+        except Exception as e:
+            db.session.rollback()
+            return None, f"예약 중 오류가 발생했습니다: {str(e)}"
 
+    @classmethod
+    def create_reservation_from_hold(cls, cno, hold_id):
+        """
+        좌석 선점을 예약으로 전환 (선점 삭제 + 예약 INSERT를 하나의 트랜잭션으로 처리)
+        좌석은 선점 시 이미 차감되어 있으므로 다시 차감하지 않으며, 결제금액은 선점 시점 가격 사용
+        """
         try:
+            hold = SeatHold.claim(cno, hold_id)
+            if hold is None:
+                db.session.rollback()
+                return (
+                    None,
+                    "좌석 선점이 만료되었거나 찾을 수 없습니다. 항공편을 다시 선택해주세요.",
+                )
+
+            reservation = cls(
+                cno=cno,
+                flight_number=hold.flight_number,
+                departure_date_time=hold.departure_date_time,
+                seat_class=hold.seat_class,
+                payment=hold.price,
+            )
             db.session.add(reservation)
-            # 좌석 수 감소
-            Seat.update_seat_count(flight_number, departure_date_time, seat_class, -1)
+            db.session.flush()
+            # 통계 집계 테이블 증분 반영
+            record_reservation(
+                cno, hold.flight_number, hold.departure_date_time, hold.price
+            )
+            # 커밋 후 예약 객체를 다시 읽지 않도록 세션에서 분리
+            db.session.expunge(reservation)
             db.session.commit()
+            seat_hold_sweeper.discard(hold_id)
+            # 통계 데이터 버전 갱신 (캐시된 통계/차트 폐기 후 사전 렌더링)
+            stats_cache.bump()
             return reservation, "예약이 성공적으로 완료되었습니다."
+        except IntegrityError:
+            db.session.rollback()
+            return None, "이미 예약된 항공편입니다."
         except Exception as e:
             db.session.rollback()
             return None, f"예약 중 오류가 발생했습니다: {str(e)}"
 
+    @classmethod
+    def create_reservations(cls, items):
+        """
+        여러 좌석 일괄 예약 (하나라도 실패하면 전체 취소)
+        items: cno, flight_number, departure_date_time, seat_class 키를 가진 dict 리스트
+        결제금액은 SEAT 테이블의 현재 가격을 사용
+        (성공 여부, 항목별 결과 리스트, 메시지) 반환
+        """
+        results = []
+        demand = {}  # (운항편명, 출발일시, 좌석등급) -> 필요한 좌석 수
+        seen = set()
+        for item in items:
+            seat_key = (
+                item["flight_number"],
+                item["departure_date_time"],
+                Seat._get_seat_class(item["seat_class"]),
+            )
+            result = {
+                "cno": item["cno"],
+                "flight_number": seat_key[0],
+                "departure_date_time": seat_key[1],
+                "seat_class": seat_key[2],
+                "success": True,
+                "message": None,
+            }
+            if (item["cno"],) + seat_key in seen:
+                result.update(
+                    success=False,
+                    message="한 회원은 같은 항공편/좌석등급을 한 좌석만 예약할 수 있습니다.",
+                )
+            seen.add((item["cno"],) + seat_key)
+            demand[seat_key] = demand.get(seat_key, 0) + 1
+            results.append(result)
+
+        try:
+            # 관련 좌석 행을 한 번에 잠그고 잔여좌석/가격 확인
+            seats = Seat.lock_seats(list(demand))
+            booked = {
+                row
+                for row in db.session.query(
+                    cls.cno, cls.flight_number, cls.departure_date_time, cls.seat_class
+                ).filter(
+                    tuple_(
+                        cls.cno,
+                        cls.flight_number,
+                        cls.departure_date_time,
+                        cls.seat_class,
+                    ).in_(list(seen))
+                )
+            }
+
+            for result in results:
+                if not result["success"]:
+                    continue
+                seat_key = (
+                    result["flight_number"],
+                    result["departure_date_time"],
+                    result["seat_class"],
+                )
+                if seat_key not in seats:
+                    message = "항공편 또는 좌석 등급을 찾을 수 없습니다."
+                elif seats[seat_key][0] < demand[seat_key]:
+                    message = (
+                        f"가용 좌석이 부족합니다. (잔여 {seats[seat_key][0]}석, "
+                        f"요청 {demand[seat_key]}석)"
+                    )
+                elif (result["cno"],) + seat_key in booked:
+                    message = "이미 예약된 항공편입니다."
+                else:
+                    result["payment"] = seats[seat_key][1]
+                    continue
+                result.update(success=False, message=message)
+
+            if not all(result["success"] for result in results):
+                db.session.rollback()
+                return (
+                    False,
+                    _mark_failed(results),
+                    "예약할 수 없는 항목이 있어 전체 예약이 취소되었습니다.",
+                )
+
+            # 좌석 일괄 차감 후 예약 일괄 INSERT
+            if not Seat.decrement_seats(demand):
+                db.session.rollback()
+                message = "해당 좌석 등급의 가용 좌석이 없습니다."
+                return False, _mark_failed(results, message), message
+
+            reserved_at = datetime.now()
+            db.session.execute(
+                insert(cls),
+                [
+                    {
+                        "cno": result["cno"],
+                        "flight_number": result["flight_number"],
+                        "departure_date_time": result["departure_date_time"],
+                        "seat_class": result["seat_class"],
+                        "payment": result["payment"],
+                        "reserve_date_time": reserved_at,
+                    }
+                    for result in results
+                ],
+            )
+            # 통계 집계 테이블 증분 반영
+            record_reservations(
+                [
+                    (
+                        result["cno"],
+                        result["flight_number"],
+                        result["departure_date_time"],
+                        result["payment"],
+                    )
+                    for result in results
+                ]
+            )
+            db.session.commit()
+
+            for flight_number, departure_date_time, seat_class in demand:
+                search_cache.invalidate(departure_date_time, seat_class)
+            stats_cache.bump()
+
+            for result in results:
+                result["message"] = "예약이 성공적으로 완료되었습니다."
+            return True, results, f"{len(results)}건의 예약이 완료되었습니다."
+        except IntegrityError:
+            db.session.rollback()
+            message = "이미 예약된 항공편이 포함되어 있습니다."
+            return False, _mark_failed(results, message), message
+        except Exception as e:
+            db.session.rollback()
+            message = f"예약 중 오류가 발생했습니다: {str(e)}"
+            return False, _mark_failed(results, message), message
+
     @classmethod
     def get_customer_reservations(cls, cno):
         """
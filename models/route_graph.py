@@ -0,0 +1,332 @@
+import heapq
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict, namedtuple
+from datetime import datetime, timedelta
+
+from config import Config
+
+# 경유 항공편 검색용 시간 확장 노선 그래프 (메모리)
+# - 노드: (공항, 시각), 간선: 항공편 구간(leg) + 공항에서의 환승 대기
+# - 출발일별 버킷으로 보관하여 스케줄이 바뀐 날짜만 다시 적재 (나머지 날짜는 그대로 사용)
+# - 잔여좌석은 적재 시점 값으로 후보를 거르고, 최종 결과는 DB에서 다시 확인
+
+# 항공편 구간 (fares: 좌석등급 -> 가격)
+Leg = namedtuple(
+    "Leg",
+    [
+        "airline",
+        "flight_number",
+        "departure_date_time",
+        "departure_airport",
+        "arrival_date_time",
+        "arrival_airport",
+        "fares",
+    ],
+)
+
+
+def _departure_time(leg):
+    return leg.departure_date_time
+
+
+class DayBucket:
+    """
+    출발일 하루의 항공편 구간 색인
+    - departures: 출발공항 -> 출발시각순 구간 리스트 (환승 가능한 다음 구간 탐색)
+    - routes: (출발공항, 도착공항) -> 출발시각순 구간 리스트 (목적지로 가는 마지막 구간 탐색)
+    """
+
+    def __init__(self, legs, loaded_at):
+        self.loaded_at = loaded_at
+        self.departures = {}
+        self.routes = {}
+        for leg in sorted(legs, key=_departure_time):
+            self.departures.setdefault(leg.departure_airport, []).append(leg)
+            self.routes.setdefault(
+                (leg.departure_airport, leg.arrival_airport), []
+            ).append(leg)
+        self.size = len(legs)
+
+
+def _window(legs, start, end):
+    # 출발시각순 리스트에서 start <= 출발시각 < end 구간
+    index = bisect_left(legs, start, key=_departure_time)
+    while index < len(legs) and legs[index].departure_date_time < end:
+        yield legs[index]
+        index += 1
+
+
+class RouteGraph:
+    """
+    시간 확장 노선 그래프 + 경유 일정 검색 (직항/1회/2회 경유)
+    - 출발일 버킷 LRU + TTL (다른 프로세스의 스케줄 변경도 TTL 후 반영)
+    - 좌석 수는 (운항편명, 출발일시, 좌석등급) -> 잔여좌석으로 따로 보관하여 갱신
+    """
+
+    def __init__(self, max_days=400, ttl=300):
+        self.max_days = max_days
+        self.ttl = ttl
+        self._days = OrderedDict()  # 출발일 -> DayBucket
+        self._seats = {}  # (운항편명, 출발일시, 좌석등급) -> 잔여좌석
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.invalidations = 0
+
+    def missing_days(self, start_day, end_day):
+        """
+        start_day ~ end_day 중 적재되지 않았거나 만료된 출발일 리스트
+        """
+        now = time.monotonic()
+        days = []
+        day = start_day
+        with self._lock:
+            while day <= end_day:
+                bucket = self._days.get(day)
+                if bucket is None or now - bucket.loaded_at >= self.ttl:
+                    days.append(day)
+                else:
+                    self._days.move_to_end(day)
+                day += timedelta(days=1)
+        return days
+
+    def add_rows(self, days, rows):
+        """
+        DB 조회 결과로 출발일 버킷 교체
+        rows: (항공사, 운항편명, 출발일시, 출발공항, 도착일시, 도착공항, 좌석등급, 잔여좌석, 가격)
+        """
+        legs = {}
+        seats = {}
+        for row in rows:
+            key = (row[1], row[2])
+            leg = legs.get(key)
+            if leg is None:
+                leg = legs[key] = Leg(*row[:6], {})
+            leg.fares[row[6]] = row[8]
+            seats[(row[1], row[2], row[6])] = row[7]
+
+        by_day = {day: [] for day in days}
+        for leg in legs.values():
+            by_day.setdefault(leg.departure_date_time.date(), []).append(leg)
+
+        loaded_at = time.monotonic()
+        with self._lock:
+            for day, day_legs in by_day.items():
+                self._drop_seats(self._days.pop(day, None))
+                self._days[day] = DayBucket(day_legs, loaded_at)
+            self._seats.update(seats)
+            while len(self._days) > self.max_days:
+                _, bucket = self._days.popitem(last=False)
+                self._drop_seats(bucket)
+            self.loads += 1
+
+    def _drop_seats(self, bucket):
+        if bucket is None:
+            return
+        for legs in bucket.departures.values():
+            for leg in legs:
+                for seat_class in leg.fares:
+                    self._seats.pop(
+                        (leg.flight_number, leg.departure_date_time, seat_class), None
+                    )
+
+    def update_seats(self, counts):
+        """
+        잔여좌석 갱신 (counts: (운항편명, 출발일시, 좌석등급) -> 잔여좌석)
+        """
+        with self._lock:
+            for key, count in counts.items():
+                if key in self._seats:
+                    self._seats[key] = count
+
+    def invalidate_days(self, days):
+        """
+        스케줄이 바뀐 출발일 버킷 삭제 (다음 검색 시 해당 날짜만 다시 적재)
+        """
+        with self._lock:
+            for day in days:
+                bucket = self._days.pop(day, None)
+                if bucket is not None:
+                    self._drop_seats(bucket)
+                    self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._days)
+            self._days.clear()
+            self._seats.clear()
+
+    def _legs_from(self, airport, start, end):
+        # 공항에서 [start, end) 사이에 출발하는 구간 (날짜 버킷을 넘나들며 조회)
+        day = start.date()
+        while day <= end.date():
+            bucket = self._days.get(day)
+            if bucket is not None:
+                yield from _window(bucket.departures.get(airport, ()), start, end)
+            day += timedelta(days=1)
+
+    def _legs_between(self, departure_airport, arrival_airport, start, end):
+        day = start.date()
+        while day <= end.date():
+            bucket = self._days.get(day)
+            if bucket is not None:
+                yield from _window(
+                    bucket.routes.get((departure_airport, arrival_airport), ()),
+                    start,
+                    end,
+                )
+            day += timedelta(days=1)
+
+    def search(
+        self,
+        departure_codes,
+        arrival_codes,
+        departure_date,
+        seat_class,
+        max_stops=2,
+        sort="price",
+        limit=10,
+        min_connection=timedelta(minutes=60),
+        max_connection=timedelta(hours=24),
+        max_expansions=200000,
+    ):
+        """
+        경유 일정 검색 (분기 한정: 현재까지의 비용이 상위 limit개 중 가장 나쁜 값 이상이면 더 탐색하지 않음)
+        sort: price(가격 합계순) / duration(출발~최종 도착 소요시간순)
+        반환: (일정 리스트(비용순, 각 일정은 Leg 튜플), 탐색 한도 도달 여부)
+        """
+        origins = set(departure_codes)
+        destinations = set(arrival_codes)
+        day_start = datetime.combine(departure_date, datetime.min.time())
+        day_end = day_start + timedelta(days=1)
+
+        def cost(legs):
+            if sort == "duration":
+                return legs[-1].arrival_date_time - legs[0].departure_date_time
+            return sum(leg.fares[seat_class] for leg in legs)
+
+        def available(leg):
+            return (
+                seat_class in leg.fares
+                and self._seats.get(
+                    (leg.flight_number, leg.departure_date_time, seat_class), 0
+                )
+                > 0
+            )
+
+        best = []  # (-비용, 순번, 일정) 최대 힙 (상위 limit개 유지)
+        counter = 0
+        expansions = 0
+
+        def bound():
+            return -best[0][0] if len(best) >= limit else None
+
+        def pruned(legs):
+            worst = bound()
+            return worst is not None and cost(legs) >= worst
+
+        def offer(legs):
+            nonlocal counter
+            counter += 1
+            item = (-cost(legs), counter, tuple(legs))
+            if len(best) < limit:
+                heapq.heappush(best, item)
+            elif item[0] > best[0][0]:
+                heapq.heapreplace(best, item)
+
+        with self._lock:
+            first_legs = [
+                leg
+                for code in origins
+                for leg in self._legs_from(code, day_start, day_end)
+                if available(leg)
+            ]
+            # 비용이 작은 첫 구간부터 탐색하여 한정 조건이 빨리 좁혀지도록 함
+            first_legs.sort(key=lambda leg: cost([leg]))
+
+            for first in first_legs:
+                expansions += 1
+                if expansions > max_expansions:
+                    break
+                path = [first]
+                if pruned(path):
+                    continue
+                if first.arrival_airport in destinations:
+                    offer(path)
+                    continue
+                if max_stops < 1 or first.arrival_airport in origins:
+                    continue
+
+                visited = {first.departure_airport, first.arrival_airport}
+                window_start = first.arrival_date_time + min_connection
+                window_end = first.arrival_date_time + max_connection
+
+                # 1회 경유: 환승 공항 -> 목적지 구간
+                for destination in destinations:
+                    for second in self._legs_between(
+                        first.arrival_airport, destination, window_start, window_end
+                    ):
+                        expansions += 1
+                        if available(second) and not pruned(path + [second]):
+                            offer(path + [second])
+                if max_stops < 2:
+                    continue
+
+                # 2회 경유: 환승 공항 -> 다른 공항 -> 목적지 구간
+                for second in self._legs_from(
+                    first.arrival_airport, window_start, window_end
+                ):
+                    expansions += 1
+                    if expansions > max_expansions:
+                        break
+                    if (
+                        second.arrival_airport in visited
+                        or second.arrival_airport in destinations
+                        or not available(second)
+                    ):
+                        continue
+                    path2 = path + [second]
+                    if pruned(path2):
+                        continue
+                    for destination in destinations:
+                        for third in self._legs_between(
+                            second.arrival_airport,
+                            destination,
+                            second.arrival_date_time + min_connection,
+                            second.arrival_date_time + max_connection,
+                        ):
+                            expansions += 1
+                            if available(third) and not pruned(path2 + [third]):
+                                offer(path2 + [third])
+
+        itineraries = [item[2] for item in sorted(best, key=lambda item: -item[0])]
+        return itineraries, expansions > max_expansions
+
+    def seats_of(self, legs, seat_class):
+        """
+        일정의 잔여좌석 (구간별 잔여좌석 중 최솟값)
+        """
+        with self._lock:
+            return min(
+                self._seats.get(
+                    (leg.flight_number, leg.departure_date_time, seat_class), 0
+                )
+                for leg in legs
+            )
+
+    def stats(self):
+        with self._lock:
+            return {
+                "days": len(self._days),
+                "legs": sum(bucket.size for bucket in self._days.values()),
+                "max_days": self.max_days,
+                "loads": self.loads,
+                "invalidations": self.invalidations,
+            }
+
+
+# 애플리케이션 전역 노선 그래프
+route_graph = RouteGraph(
+    max_days=Config.ROUTE_GRAPH_MAX_DAYS, ttl=Config.ROUTE_GRAPH_TTL
+)
@@ -0,0 +1,229 @@
+import os
+import time
+
+import pandas as pd
+from sqlalchemy import DateTime, Integer, String, inspect, text
+from models.customer import db
+from models.airplane import Airplane
+from models.seat import Seat
+from models.search_cache import search_cache
+from models.lookup_cache import flight_cache
+from models.route_graph import route_graph
+from models.inventory import flight_inventory
+
+# 운항 스케줄 대량 적재
+# - CSV/Parquet 파일을 배치 단위로 읽어 메모리 사용량을 일정하게 유지 (RAM보다 큰 파일도 적재)
+# - 한 행 = 항공편 1개 + 좌석등급 1개 (항공편 컬럼은 좌석등급마다 반복)
+# - AIRPLANE/SEAT 컬럼 정의(타입, 길이, NOT NULL)로 검증 후 executemany(배열 바인딩)로 MERGE
+
+
+def _column_map(model):
+    """
+    모델 속성명 -> 테이블 컬럼 매핑 (파일 헤더는 속성명/DB 컬럼명 모두 허용)
+    """
+    return {prop.key: prop.columns[0] for prop in inspect(model).column_attrs}
+
+
+AIRPLANE_COLUMNS = _column_map(Airplane)
+SEAT_COLUMNS = _column_map(Seat)
+SCHEDULE_COLUMNS = {**AIRPLANE_COLUMNS, **SEAT_COLUMNS}
+
+
+def _normalize_headers(df):
+    renamed = {name: str(name).strip().lower() for name in df.columns}
+    df = df.rename(columns=renamed)
+    missing = [name for name in SCHEDULE_COLUMNS if name not in df.columns]
+    if missing:
+        raise ValueError(f"스케줄 파일에 필요한 컬럼이 없습니다: {', '.join(missing)}")
+    return df[list(SCHEDULE_COLUMNS)]
+
+
+def validate_schedule(df):
+    """
+    컬럼 정의에 맞게 형 변환/검증, (정상 행 DataFrame, 오류 메시지 리스트) 반환
+    """
+    df = _normalize_headers(df)
+    invalid = pd.Series(False, index=df.index)
+    reasons = pd.Series("", index=df.index)
+
+    def reject(mask, reason):
+        nonlocal invalid
+        # 빈 값(<NA>)끼리 비교한 결과는 NA이므로 False로 바꿔 이후 검사가 무시되지 않게 함
+        mask = mask.fillna(False).astype(bool) & ~invalid
+        reasons[mask] = reason
+        invalid |= mask
+
+    for name, column in SCHEDULE_COLUMNS.items():
+        values = df[name]
+        if isinstance(column.type, DateTime):
+            converted = pd.to_datetime(values, errors="coerce")
+        elif isinstance(column.type, Integer):
+            converted = pd.to_numeric(values, errors="coerce")
+            # 소수/음수 좌석수·가격은 허용하지 않음
+            reject(converted.notna() & (converted % 1 != 0), f"{name}: 정수가 아님")
+            reject(converted < 0, f"{name}: 음수")
+        else:
+            converted = values.astype("string").str.strip()
+            converted = converted.mask(converted == "")
+            if isinstance(column.type, String) and column.type.length:
+                reject(
+                    converted.str.len() > column.type.length,
+                    f"{name}: {column.type.length}자 초과",
+                )
+        if not column.nullable:
+            reject(converted.isna(), f"{name}: 값 없음")
+        df[name] = converted
+
+    reject(
+        df["arrival_date_time"] < df["departure_date_time"],
+        "arrival_date_time: 출발일시보다 이전",
+    )
+
+    errors = [f"{index}행 {reasons[index]}" for index in df.index[invalid]]
+    valid = df[~invalid].copy()
+    for name, column in SCHEDULE_COLUMNS.items():
+        if isinstance(column.type, Integer):
+            valid[name] = valid[name].astype("int64")
+    return valid, errors
+
+
+def _records(df, columns):
+    """
+    DataFrame -> executemany용 파라미터 리스트 (DB 컬럼명 키, 파이썬 기본 타입)
+    """
+    records = []
+    for row in df[list(columns)].itertuples(index=False, name=None):
+        record = {}
+        for (name, column), value in zip(columns.items(), row):
+            if isinstance(value, pd.Timestamp):
+                value = value.to_pydatetime()
+            elif hasattr(value, "item"):
+                value = value.item()
+            record[column.name] = value
+        records.append(record)
+    return records
+
+
+def _merge_statement(model, columns, insert_only=()):
+    """
+    기본키 기준 MERGE(UPSERT) 문장 생성 (DB 종류별)
+    insert_only: 새 행에만 넣고 이미 있는 행에서는 갱신하지 않을 컬럼
+    """
+    table = model.__table__
+    keys = [column.name for column in table.primary_key.columns]
+    names = [column.name for column in columns.values()]
+    fixed = set(keys) | set(insert_only)
+    dialect = db.engine.dialect.name
+
+    if dialect == "oracle":
+        # executemany 시 oracledb가 배열 바인딩으로 한 번에 전송
+        source = ", ".join(f":{name} AS {name}" for name in names)
+        on = " AND ".join(f"t.{name} = s.{name}" for name in keys)
+        updates = ", ".join(
+            f"t.{name} = s.{name}" for name in names if name not in fixed
+        )
+        return text(
+            f"MERGE INTO {table.name} t USING (SELECT {source} FROM DUAL) s "
+            f"ON ({on}) "
+            f"WHEN MATCHED THEN UPDATE SET {updates} "
+            f"WHEN NOT MATCHED THEN INSERT ({', '.join(names)}) "
+            f"VALUES ({', '.join(f's.{name}' for name in names)})"
+        )
+
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        statement = insert(table)
+        return statement.on_conflict_do_update(
+            index_elements=keys,
+            set_={
+                name: statement.excluded[name] for name in names if name not in fixed
+            },
+        )
+
+    raise ValueError(f"지원하지 않는 데이터베이스입니다: {dialect}")
+
+
+def iter_schedule_file(path, batch_size):
+    """
+    스케줄 파일을 batch_size 행씩 DataFrame으로 읽음 (CSV/Parquet)
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".parquet":
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            yield batch.to_pandas()
+    elif extension in (".csv", ".txt"):
+        # 형 변환은 validate_schedule()에서 수행하므로 문자열로 읽음
+        yield from pd.read_csv(
+            path, dtype=str, keep_default_na=False, chunksize=batch_size
+        )
+    else:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {extension}")
+
+
+def load_schedule(path, batch_size=5000, max_errors=20):
+    """
+    스케줄 파일 적재 (배치마다 커밋), 적재 결과 통계 반환
+    - 이미 있는 항공편/좌석은 파일 값으로 갱신 (가격 포함)
+    - 잔여좌석수는 새 좌석에만 넣음 (이미 판매된 좌석 차감분을 덮어쓰지 않음)
+    """
+    airplane_merge = _merge_statement(Airplane, AIRPLANE_COLUMNS)
+    seat_merge = _merge_statement(Seat, SEAT_COLUMNS, insert_only=("NUMBER_OF_SEATS",))
+    airplane_keys = [column.name for column in Airplane.__table__.primary_key]
+
+    result = {"rows": 0, "flights": 0, "seats": 0, "rejected": 0, "errors": []}
+    changed_days = set()
+    started = time.perf_counter()
+    offset = 0
+    try:
+        for chunk in iter_schedule_file(path, batch_size):
+            # 오류 메시지에 파일 기준 행 번호(헤더 제외, 1부터)가 나오도록 인덱스 재설정
+            chunk.index = pd.RangeIndex(offset + 1, offset + len(chunk) + 1)
+            offset += len(chunk)
+            valid, errors = validate_schedule(chunk)
+            result["rows"] += len(chunk)
+            result["rejected"] += len(errors)
+            room = max_errors - len(result["errors"])
+            result["errors"].extend(errors[:room])
+            if valid.empty:
+                continue
+
+            # 좌석등급마다 반복되는 항공편 정보는 배치 안에서 한 번만 MERGE
+            airplanes = _records(valid, AIRPLANE_COLUMNS)
+            airplanes = list(
+                {
+                    tuple(record[key] for key in airplane_keys): record
+                    for record in airplanes
+                }.values()
+            )
+            seats = _records(valid, SEAT_COLUMNS)
+            changed_days.update(
+                record["DEPARTURE_DATE_TIME"].date() for record in airplanes
+            )
+
+            db.session.execute(airplane_merge, airplanes)
+            db.session.execute(seat_merge, seats)
+            db.session.commit()
+            result["flights"] += len(airplanes)
+            result["seats"] += len(seats)
+    except Exception:
+        db.session.rollback()
+        raise
+    finally:
+        # 검색 결과/항공편 정보 캐시에 이전 스케줄이 남지 않도록 비움
+        search_cache.clear()
+        flight_cache.clear()
+        # 노선 그래프는 적재한 출발일만 다시 적재
+        route_graph.invalidate_days(changed_days)
+        if changed_days:
+            flight_inventory.invalidate()
+
+    elapsed = time.perf_counter() - started
+    result["seconds"] = round(elapsed, 3)
+    result["rows_per_sec"] = round(result["rows"] / elapsed) if elapsed else 0
+    return result
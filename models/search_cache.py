@@ -0,0 +1,101 @@
+import threading
+import time
+from collections import OrderedDict
+
+from config import Config
+
+
+class SearchCache:
+    """
+    항공편 검색 결과 캐시 (LRU + TTL)
+    키: (출발일, 출발공항 코드들, 도착공항 코드들, 좌석등급)
+    """
+
+    def __init__(self, max_size=1024, ttl=30):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (저장 시각, 검색 결과)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(search_date, departure_codes, arrival_codes, seat_class, *extra):
+        """
+        검색 조건을 정규화하여 캐시 키 생성 (공항 코드 순서 무관)
+        extra: 정렬/페이지 등 추가 조건
+        """
+        return (
+            search_date,
+            tuple(sorted(departure_codes)),
+            tuple(sorted(arrival_codes)),
+            seat_class,
+            *extra,
+        )
+
+    def get(self, key):
+        """
+        캐시 조회 (만료된 항목은 제거 후 None 반환)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, results):
+        """
+        검색 결과 저장 (최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거)
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, departure_date_time, seat_class):
+        """
+        좌석 수가 바뀐 항공편이 포함될 수 있는 캐시 항목 삭제 (출발일 + 좌석등급 기준)
+        """
+        search_date = departure_date_time.date()
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if key[0] == search_date and key[3] == seat_class
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        캐시 통계 (크기 조정용 히트/미스 카운터)
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# 애플리케이션 전역 검색 캐시
+search_cache = SearchCache(
+    max_size=Config.SEARCH_CACHE_SIZE, ttl=Config.SEARCH_CACHE_TTL
+)
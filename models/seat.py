@@ -1,15 +1,28 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    ForeignKey,
+    DateTime,
+    bindparam,
+    tuple_,
+    update,
+)
 from models.customer import db
+from models.search_cache import search_cache
+from models.seat_events import mark_seats_changed
+from models.inventory import record_seat_deltas
+from models.alias_resolver import seat_class_resolver
 
 
 class Seat(db.Model):
     __tablename__ = "SEAT"
-
-    # 좌석 등급 매핑 (한글/영문 모두 지원)
-    SEAT_CLASS_MAPPING = {
-        "Business": ["비즈니스", "비즈니스석", "Business", "business"],
-        "Economy": ["이코노미", "이코노미석", "Economy", "economy"],
-    }
+    __table_args__ = (
+        # 좌석등급 + 잔여좌석 + 가격 조건 검색용 복합 인덱스
+        db.Index(
+            "IDX_SEAT_CLASS_SEATS_PRICE", "SEAT_CLASS", "NUMBER_OF_SEATS", "PRICE"
+        ),
+    )
 
     # 좌석 정보 컬럼 정의
     flight_number = Column("FLIGHT_NUMBER", String(20), primary_key=True)  # 운항편명
@@ -36,13 +49,9 @@ class Seat(db.Model):
         """
         좌석 등급 입력값을 받아서 DB 좌석등급으로 변환 (한글/영문 모두 지원)
         """
-        for db_class, names in cls.SEAT_CLASS_MAPPING.items():
-            if any(
-                name.lower() in seat_class_input.lower()
-                or seat_class_input.lower() in name.lower()
-                for name in names
-            ):
-                return db_class
+        seat_classes = seat_class_resolver.resolve(seat_class_input)
+        if seat_classes:
+            return seat_classes[0]
         return seat_class_input  # 매핑되지 않으면 원래 입력값 반환
 
     @classmethod
@@ -61,26 +70,168 @@ class Seat(db.Model):
 
         return seat.number_of_seats if seat else 0
 
+    @classmethod
+    def flight_seat_counts_statement(cls, flights):
+        """
+        여러 항공편의 좌석등급별 잔여좌석 조회 SELECT 문 (동기/비동기 세션 공용)
+        flights: (운항편명, 출발일시) 리스트
+        """
+        return db.select(
+            cls.flight_number,
+            cls.departure_date_time,
+            cls.seat_class,
+            cls.number_of_seats,
+        ).where(
+            # 운항편명 단일 컬럼 조건을 함께 주어 (행 값 IN을 인덱스로 처리하지 못하는 DB에서도)
+            # 기본키 인덱스 사용
+            cls.flight_number.in_({flight_number for flight_number, _ in flights}),
+            tuple_(cls.flight_number, cls.departure_date_time).in_(flights),
+        )
+
+    @staticmethod
+    def to_seat_counts(rows):
+        """
+        잔여좌석 조회 결과를 {(운항편명, 출발일시, 좌석등급): 잔여좌석수}로 변환
+        """
+        return {
+            (flight_number, departure_date_time, seat_class): number_of_seats
+            for flight_number, departure_date_time, seat_class, number_of_seats in rows
+        }
+
+    @classmethod
+    def get_flight_seat_counts(cls, flights):
+        """
+        여러 항공편의 좌석등급별 잔여좌석 일괄 조회
+        flights: (운항편명, 출발일시) 리스트, {(운항편명, 출발일시, 좌석등급): 잔여좌석수} 반환
+        """
+        return cls.to_seat_counts(
+            db.session.execute(cls.flight_seat_counts_statement(flights))
+        )
+
     @classmethod
     def update_seat_count(
         cls, flight_number, departure_date_time, seat_class, count_change
     ):
         """
         좌석 수 업데이트 (예약 시 감소, 취소 시 증가)
+        단일 UPDATE 문으로 처리하며, 커밋은 호출한 쪽의 트랜잭션에서 수행
         """
         # 좌석 등급 매핑 적용
         mapped_seat_class = cls._get_seat_class(seat_class)
 
-        seat = cls.query.filter_by(
-            flight_number=flight_number,
-            departure_date_time=departure_date_time,
-            seat_class=mapped_seat_class,
-        ).first()
+        # 조건부 UPDATE (잔여좌석이 음수가 되는 변경은 적용하지 않음)
+        result = db.session.execute(
+            update(cls)
+            .where(
+                cls.flight_number == flight_number,
+                cls.departure_date_time == departure_date_time,
+                cls.seat_class == mapped_seat_class,
+                cls.number_of_seats + count_change >= 0,
+            )
+            .values(number_of_seats=cls.number_of_seats + count_change)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            return False
 
-        if seat:
-            seat.number_of_seats += count_change
-            if seat.number_of_seats < 0:
-                seat.number_of_seats = 0
-            db.session.commit()
+        # 좌석 수가 바뀐 항공편의 검색 캐시 무효화, 커밋 후 잔여좌석 알림 대상 기록
+        search_cache.invalidate(departure_date_time, mapped_seat_class)
+        seat_key = (flight_number, departure_date_time, mapped_seat_class)
+        mark_seats_changed(db.session, [seat_key])
+        record_seat_deltas(db.session, {seat_key: count_change})
+        return True
+
+    @classmethod
+    def reserve_seat(cls, flight_number, departure_date_time, seat_class):
+        """
+        좌석 1개 선점 (UPDATE ... SET NUMBER_OF_SEATS = NUMBER_OF_SEATS - 1
+        WHERE ... AND NUMBER_OF_SEATS > 0), 성공 여부 반환
+        """
+        return cls.update_seat_count(flight_number, departure_date_time, seat_class, -1)
+
+    @classmethod
+    def lock_seats(cls, seat_keys):
+        """
+        여러 좌석 행을 한 번에 잠금 조회 (SELECT ... FOR UPDATE)
+        seat_keys: (운항편명, 출발일시, 좌석등급) 리스트, {키: (잔여좌석수, 가격)} 반환
+        """
+        rows = db.session.execute(
+            db.select(
+                cls.flight_number,
+                cls.departure_date_time,
+                cls.seat_class,
+                cls.number_of_seats,
+                cls.price,
+            )
+            .where(
+                tuple_(cls.flight_number, cls.departure_date_time, cls.seat_class).in_(
+                    seat_keys
+                )
+            )
+            .with_for_update()
+        )
+        return {
+            (flight_number, departure_date_time, seat_class): (number_of_seats, price)
+            for flight_number, departure_date_time, seat_class, number_of_seats, price in rows
+        }
+
+    @classmethod
+    def apply_seat_changes(cls, changes):
+        """
+        여러 좌석 행의 잔여좌석 일괄 변경 (executemany 1회), 커밋은 호출한 쪽에서 수행
+        changes: {(운항편명, 출발일시, 좌석등급): 변경 수(차감은 음수)}
+        잔여좌석이 음수가 되는 변경은 적용하지 않으며, 모두 적용되면 True 반환
+        """
+        if not changes:
             return True
-        return False
+        table = cls.__table__
+        columns = table.c
+        result = db.session.execute(
+            update(table)
+            .where(
+                columns.FLIGHT_NUMBER == bindparam("flight_number"),
+                columns.DEPARTURE_DATE_TIME == bindparam("departure_date_time"),
+                columns.SEAT_CLASS == bindparam("seat_class"),
+                columns.NUMBER_OF_SEATS + bindparam("change") >= 0,
+            )
+            .values(
+                {columns.NUMBER_OF_SEATS: columns.NUMBER_OF_SEATS + bindparam("change")}
+            ),
+            [
+                {
+                    "flight_number": flight_number,
+                    "departure_date_time": departure_date_time,
+                    "seat_class": seat_class,
+                    "change": change,
+                }
+                for (
+                    flight_number,
+                    departure_date_time,
+                    seat_class,
+                ), change in changes.items()
+            ],
+        )
+        # executemany의 rowcount를 신뢰할 수 없는 드라이버는 잠금 조회 결과를 믿음
+        if db.engine.dialect.supports_sane_multi_rowcount:
+            if result.rowcount != len(changes):
+                return False
+
+        for _, departure_date_time, seat_class in changes:
+            search_cache.invalidate(departure_date_time, seat_class)
+        mark_seats_changed(db.session, changes)
+        record_seat_deltas(db.session, changes)
+        return True
+
+    @classmethod
+    def decrement_seats(cls, counts):
+        """
+        여러 좌석 행의 잔여좌석 일괄 차감 (counts: {좌석 키: 차감 수})
+        """
+        return cls.apply_seat_changes({key: -count for key, count in counts.items()})
+
+    @classmethod
+    def restore_seats(cls, counts):
+        """
+        여러 좌석 행의 잔여좌석 일괄 복구 (counts: {좌석 키: 복구 수})
+        """
+        return cls.apply_seat_changes(counts)
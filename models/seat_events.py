@@ -0,0 +1,267 @@
+import asyncio
+import json
+import threading
+import time
+
+from sqlalchemy import event, select, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from config import Config
+
+# 잔여좌석 변경 알림 (프로세스 내 pub/sub)
+# - 좌석 수를 바꾼 트랜잭션이 커밋되면 바뀐 좌석의 현재 잔여좌석을 다시 읽어 구독자에게 전달
+#   (롤백된 변경은 전달하지 않고, 커밋된 값만 읽으므로 증감 순서가 섞여도 최종 값이 맞음)
+# - 구독자는 항공편 단위로 등록, 구독자별 스레드/폴링 없이 발행하는 쪽에서 대기 중인 구독자를 깨움
+# - 구독자에게 전달 전 쌓인 알림은 좌석별 최신 값만 남김 (느린 구독자도 메모리가 늘지 않음)
+
+
+class SeatSubscription:
+    """
+    항공편 목록에 대한 잔여좌석 변경 구독 (좌석 키별 최신 잔여좌석만 보관)
+    """
+
+    def __init__(self, flights):
+        self.flights = frozenset(flights)
+        self._pending = {}  # (운항편명, 출발일시, 좌석등급) -> 잔여좌석수
+        self._condition = threading.Condition()
+        self.closed = False
+        # 알림이 쌓일 때 호출할 함수 (비동기 스트림이 이벤트 루프를 깨우는 데 사용)
+        self.on_push = None
+
+    def push(self, seat_counts):
+        with self._condition:
+            self._pending.update(seat_counts)
+            self._condition.notify()
+        if self.on_push is not None:
+            self.on_push()
+
+    def close(self):
+        with self._condition:
+            self.closed = True
+            self._condition.notify()
+
+    def wait(self, timeout):
+        """
+        변경 알림이 올 때까지 최대 timeout초 대기 후 쌓인 알림 반환 (없으면 빈 dict)
+        """
+        with self._condition:
+            if not self._pending and not self.closed:
+                self._condition.wait(timeout)
+            pending, self._pending = self._pending, {}
+            return pending
+
+
+class SeatEventBroker:
+    """
+    항공편별 구독자 관리 및 잔여좌석 변경 발행
+    """
+
+    def __init__(self, max_subscribers=5000):
+        self.max_subscribers = max_subscribers
+        self._topics = {}  # (운항편명, 출발일시) -> 구독 집합
+        self._subscribers = 0
+        self._lock = threading.Lock()
+        self.published = 0
+        self.delivered = 0
+        self.rejected = 0
+        self.errors = 0
+
+    def subscribe(self, flights):
+        """
+        구독 등록, 최대 구독자 수를 넘으면 None 반환
+        flights: (운항편명, 출발일시) 리스트
+        """
+        subscription = SeatSubscription(flights)
+        with self._lock:
+            if self._subscribers >= self.max_subscribers:
+                self.rejected += 1
+                return None
+            self._subscribers += 1
+            for flight in subscription.flights:
+                self._topics.setdefault(flight, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            if subscription.closed:
+                return
+            self._subscribers -= 1
+            for flight in subscription.flights:
+                subscribers = self._topics.get(flight)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._topics[flight]
+        subscription.close()
+
+    def has_subscribers(self, flights):
+        with self._lock:
+            return any(flight in self._topics for flight in flights)
+
+    def publish(self, seat_counts):
+        """
+        잔여좌석 변경 발행 (seat_counts: {(운항편명, 출발일시, 좌석등급): 잔여좌석수})
+        구독자별로 모아서 한 번씩만 깨움
+        """
+        batches = {}
+        with self._lock:
+            for key, seats in seat_counts.items():
+                for subscription in self._topics.get(key[:2], ()):
+                    batches.setdefault(subscription, {})[key] = seats
+            self.published += len(seat_counts)
+            self.delivered += len(batches)
+        for subscription, counts in batches.items():
+            subscription.push(counts)
+        return len(batches)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "subscribers": self._subscribers,
+                "max_subscribers": self.max_subscribers,
+                "flights": len(self._topics),
+                "published": self.published,
+                "delivered": self.delivered,
+                "rejected": self.rejected,
+                "errors": self.errors,
+            }
+
+
+def mark_seats_changed(session, seat_keys):
+    """
+    현재 트랜잭션에서 잔여좌석이 바뀐 좌석 키 기록 (커밋 후 알림 발행 대상)
+    """
+    session.info.setdefault("changed_seats", set()).update(seat_keys)
+
+
+def read_seat_counts(connection, seat_keys):
+    """
+    좌석 키 목록의 현재 잔여좌석 조회, {좌석 키: 잔여좌석수} 반환
+    """
+    from models.seat import Seat
+
+    seat_keys = list(seat_keys)
+    counts = {}
+    # 오라클 IN 목록 길이 제한(1000개) 안에서 나눠 조회
+    for start in range(0, len(seat_keys), 1000):
+        rows = connection.execute(
+            select(
+                Seat.flight_number,
+                Seat.departure_date_time,
+                Seat.seat_class,
+                Seat.number_of_seats,
+            ).where(
+                tuple_(
+                    Seat.flight_number, Seat.departure_date_time, Seat.seat_class
+                ).in_(seat_keys[start : start + 1000])
+            )
+        )
+        counts.update(
+            ((flight_number, departure_date_time, seat_class), seats)
+            for flight_number, departure_date_time, seat_class, seats in rows
+        )
+    return counts
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_changed_seats(session):
+    # SAVEPOINT 해제(begin_nested 종료)에서도 호출되므로 바깥 트랜잭션 커밋에서만 발행
+    if session.in_nested_transaction():
+        return
+    changed = session.info.pop("changed_seats", None)
+    # 구독자가 없는 항공편이면 다시 읽지 않음
+    if not changed or not seat_events.has_subscribers({key[:2] for key in changed}):
+        return
+    # 커밋 직후 세션에서는 SQL을 실행할 수 없으므로 별도 커넥션으로 조회
+    # (조회에 실패해도 이미 커밋된 예약/취소가 실패로 보이지 않도록 알림만 생략)
+    try:
+        with session.get_bind().connect() as connection:
+            counts = read_seat_counts(connection, changed)
+    except SQLAlchemyError:
+        seat_events.errors += 1
+        return
+    seat_events.publish(counts)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_seats(session):
+    # SAVEPOINT 롤백이면 바깥 트랜잭션의 변경 기록은 유지 (커밋 후 실제 값을 다시 읽음)
+    if not session.in_nested_transaction():
+        session.info.pop("changed_seats", None)
+
+
+def format_seat_event(seat_counts):
+    """
+    잔여좌석 변경을 SSE 이벤트 문자열로 변환 (출발일시는 검색 결과 화면과 같은 형식)
+    """
+    data = json.dumps(
+        [
+            {
+                "flight_number": flight_number,
+                "departure_date_time": departure_date_time.strftime("%Y-%m-%d %H:%M"),
+                "seat_class": seat_class,
+                "number_of_seats": seats,
+            }
+            for (
+                flight_number,
+                departure_date_time,
+                seat_class,
+            ), seats in sorted(seat_counts.items())
+        ],
+        ensure_ascii=False,
+    )
+    return f"event: seats\ndata: {data}\n\n"
+
+
+def seat_event_stream(subscription, initial_counts, heartbeat, timeout):
+    """
+    구독 하나의 SSE 응답 본문 생성기 (현재 잔여좌석 전송 후 변경 알림 대기)
+    알림이 없으면 heartbeat초마다 주석 행을 보내 끊긴 연결을 감지하고,
+    timeout초가 지나면 종료 (브라우저 EventSource가 자동으로 다시 연결)
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        yield "retry: 3000\n\n"
+        if initial_counts:
+            yield format_seat_event(initial_counts)
+        while not subscription.closed and time.monotonic() < deadline:
+            counts = subscription.wait(min(heartbeat, deadline - time.monotonic()))
+            yield format_seat_event(counts) if counts else ": keep-alive\n\n"
+    finally:
+        seat_events.unsubscribe(subscription)
+
+
+async def async_seat_event_stream(subscription, initial_counts, heartbeat, timeout):
+    """
+    seat_event_stream()의 비동기 버전 (ASGI용, 대기 중에 스레드를 점유하지 않음)
+    발행하는 스레드가 on_push로 이벤트 루프의 asyncio.Event를 설정하여 깨움
+    """
+    loop = asyncio.get_running_loop()
+    wake = asyncio.Event()
+    subscription.on_push = lambda: loop.call_soon_threadsafe(wake.set)
+    deadline = loop.time() + timeout
+    try:
+        yield "retry: 3000\n\n"
+        if initial_counts:
+            yield format_seat_event(initial_counts)
+        while not subscription.closed and loop.time() < deadline:
+            # 깨우기 신호를 지운 뒤 쌓인 알림을 확인 (확인 후 도착한 알림은 다시 신호를 설정)
+            wake.clear()
+            counts = subscription.wait(0)
+            if not counts:
+                try:
+                    await asyncio.wait_for(
+                        wake.wait(), min(heartbeat, deadline - loop.time())
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                counts = subscription.wait(0)
+            yield format_seat_event(counts) if counts else ": keep-alive\n\n"
+    finally:
+        subscription.on_push = None
+        seat_events.unsubscribe(subscription)
+
+
+# 애플리케이션 전역 잔여좌석 알림 브로커
+seat_events = SeatEventBroker(max_subscribers=Config.SEAT_EVENTS_MAX_SUBSCRIBERS)
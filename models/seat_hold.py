@@ -0,0 +1,376 @@
+import heapq
+import secrets
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from sqlalchemy import Column, String, Integer, DateTime, delete, select
+from models.customer import db
+from models.seat import Seat
+from config import Config
+
+# 결제 전 좌석 선점 (임시 예약)
+# - 항공편 선택 시 잔여좌석을 조건부 UPDATE로 1석 차감하고 선점 ID를 발급
+# - 결제(/api/reserve) 시 선점을 예약으로 전환 (좌석은 이미 차감되어 있으므로 다시 차감하지 않음)
+# - 만료된 선점은 백그라운드 스위퍼가 만료 시각순 힙에서 꺼내 배치 단위로 좌석 반환
+
+
+class SeatHold(db.Model):
+    __tablename__ = "SEAT_HOLD"
+    __table_args__ = (
+        # 만료 시각 범위 조회(스위퍼 재동기화)와 고객별 선점 조회용 인덱스
+        db.Index("IDX_SEAT_HOLD_EXPIRES_AT", "EXPIRES_AT"),
+        db.Index("IDX_SEAT_HOLD_CNO", "CNO"),
+    )
+
+    # 좌석 선점 정보 컬럼 정의
+    hold_id = Column("HOLD_ID", String(32), primary_key=True)  # 선점 ID
+    cno = Column("CNO", String(20), nullable=False)  # 회원번호
+    flight_number = Column("FLIGHT_NUMBER", String(20), nullable=False)  # 운항편명
+    departure_date_time = Column(
+        "DEPARTURE_DATE_TIME", DateTime, nullable=False
+    )  # 출발일시
+    seat_class = Column("SEAT_CLASS", String(20), nullable=False)  # 좌석등급
+    price = Column("PRICE", Integer, nullable=False)  # 선점 시점 가격 (결제금액)
+    created_at = Column("CREATED_AT", DateTime, nullable=False)  # 선점일시
+    expires_at = Column("EXPIRES_AT", DateTime, nullable=False)  # 만료일시
+
+    def __repr__(self):
+        return f"<SeatHold {self.hold_id} {self.cno} {self.flight_number}>"
+
+    @property
+    def seat_key(self):
+        return (self.flight_number, self.departure_date_time, self.seat_class)
+
+    @classmethod
+    def create_hold(cls, cno, flight_number, departure_date_time, seat_class):
+        """
+        좌석 1석 선점 (잔여좌석 차감 + 선점 INSERT를 하나의 트랜잭션으로 처리)
+        같은 좌석을 이미 선점 중이면 기존 선점을 그대로 반환
+        (선점 객체, 메시지) 반환, 실패 시 선점 객체는 None
+        """
+        from models.reservation import Reservation
+
+        mapped_seat_class = Seat._get_seat_class(seat_class)
+        now = datetime.now()
+        try:
+            holds = (
+                cls.query.filter(cls.cno == cno, cls.expires_at > now)
+                .order_by(cls.expires_at)
+                .all()
+            )
+            for hold in holds:
+                if hold.seat_key == (
+                    flight_number,
+                    departure_date_time,
+                    mapped_seat_class,
+                ):
+                    # 롤백 후 다시 읽지 않도록 세션에서 분리
+                    db.session.expunge(hold)
+                    db.session.rollback()
+                    return hold, "이미 선점한 좌석입니다."
+            if len(holds) >= Config.SEAT_HOLD_MAX_PER_CUSTOMER:
+                db.session.rollback()
+                return None, "동시에 선점할 수 있는 좌석 수를 초과했습니다."
+
+            if db.session.get(
+                Reservation,
+                (cno, flight_number, departure_date_time, mapped_seat_class),
+            ):
+                db.session.rollback()
+                return None, "이미 예약된 항공편입니다."
+
+            # 좌석 차감 (잔여좌석이 있을 때만 UPDATE)
+            if not Seat.reserve_seat(flight_number, departure_date_time, seat_class):
+                db.session.rollback()
+                return None, "해당 좌석 등급의 가용 좌석이 없습니다."
+
+            price = db.session.execute(
+                select(Seat.price).where(
+                    Seat.flight_number == flight_number,
+                    Seat.departure_date_time == departure_date_time,
+                    Seat.seat_class == mapped_seat_class,
+                )
+            ).scalar_one()
+            hold = cls(
+                hold_id=secrets.token_hex(16),
+                cno=cno,
+                flight_number=flight_number,
+                departure_date_time=departure_date_time,
+                seat_class=mapped_seat_class,
+                price=price,
+                created_at=now,
+                expires_at=now + timedelta(seconds=Config.SEAT_HOLD_TTL),
+            )
+            db.session.add(hold)
+            db.session.flush()
+            # 커밋 후 선점 객체를 다시 읽지 않도록 세션에서 분리
+            db.session.expunge(hold)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            return None, f"좌석 선점 중 오류가 발생했습니다: {str(e)}"
+
+        seat_hold_sweeper.schedule(hold.hold_id, hold.expires_at)
+        return hold, "좌석이 선점되었습니다."
+
+    @classmethod
+    def claim(cls, cno, hold_id):
+        """
+        만료되지 않은 본인 선점을 잠금 조회 후 삭제 (예약 전환/선점 취소용)
+        커밋은 호출한 쪽의 트랜잭션에서 수행, 선점이 없거나 만료되었으면 None 반환
+        """
+        hold = db.session.execute(
+            select(cls)
+            .where(
+                cls.hold_id == hold_id,
+                cls.cno == cno,
+                cls.expires_at > datetime.now(),
+            )
+            .with_for_update()
+        ).scalar_one_or_none()
+        if hold is None:
+            return None
+        db.session.delete(hold)
+        db.session.flush()
+        return hold
+
+    @classmethod
+    def release_hold(cls, cno, hold_id):
+        """
+        선점 취소 (좌석 즉시 반환), 성공 여부 반환
+        """
+        try:
+            hold = cls.claim(cno, hold_id)
+            if hold is None:
+                db.session.rollback()
+                return False
+            Seat.update_seat_count(*hold.seat_key, 1)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        seat_hold_sweeper.discard(hold_id)
+        return True
+
+    @classmethod
+    def expire_holds(cls, hold_ids, now):
+        """
+        만료된 선점 일괄 삭제 + 좌석 반환 (좌석별 반환 수를 모아 executemany 1회)
+        다른 프로세스의 스위퍼/예약 전환과 겹쳐 삭제 건수가 다르면 롤백 후 None 반환
+        반환한 선점 수 반환
+        """
+        try:
+            holds = db.session.execute(
+                select(
+                    cls.hold_id,
+                    cls.flight_number,
+                    cls.departure_date_time,
+                    cls.seat_class,
+                )
+                .where(cls.hold_id.in_(hold_ids), cls.expires_at <= now)
+                .with_for_update()
+            ).all()
+            if not holds:
+                db.session.rollback()
+                return 0
+
+            result = db.session.execute(
+                delete(cls)
+                .where(
+                    cls.hold_id.in_([hold[0] for hold in holds]),
+                    cls.expires_at <= now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount != len(holds):
+                db.session.rollback()
+                return None
+            if not Seat.restore_seats(Counter(tuple(hold[1:]) for hold in holds)):
+                db.session.rollback()
+                return None
+            db.session.commit()
+            return len(holds)
+        except Exception:
+            db.session.rollback()
+            raise
+
+    @classmethod
+    def expiring_holds(cls, until, limit):
+        """
+        until까지 만료되는 선점 (만료 시각 인덱스 범위 조회), (선점 ID, 만료일시) 리스트 반환
+        """
+        return db.session.execute(
+            select(cls.hold_id, cls.expires_at)
+            .where(cls.expires_at <= until)
+            .order_by(cls.expires_at)
+            .limit(limit)
+        ).all()
+
+    def to_dict(self):
+        return {
+            "hold_id": self.hold_id,
+            "flight_number": self.flight_number,
+            "departure_date_time": self.departure_date_time.strftime("%Y-%m-%d %H:%M"),
+            "seat_class": self.seat_class,
+            "price": self.price,
+            "expires_at": self.expires_at.strftime("%Y-%m-%d %H:%M:%S"),
+            "expires_in": max(
+                int((self.expires_at - datetime.now()).total_seconds()), 0
+            ),
+        }
+
+
+class SeatHoldSweeper:
+    """
+    만료된 좌석 선점 반환 스레드
+    - 이 프로세스에서 만든 선점은 (만료일시, 선점 ID) 최소 힙에 넣고 가장 빠른 만료 시각까지 대기
+    - 예약 전환/취소된 선점은 힙에서 바로 빼지 않고 꺼낼 때 건너뜀
+    - 다른 프로세스(또는 재시작 전)에서 만든 선점은 resync_interval마다
+      다음 주기 안에 만료되는 선점을 만료 시각 인덱스로 조회하여 힙에 추가
+    - 다른 프로세스와 겹쳐 반환하지 못한 배치는 retry_delay초 뒤에 다시 시도
+    """
+
+    def __init__(self, batch_size=500, resync_interval=60, retry_delay=5):
+        self.batch_size = batch_size
+        self.resync_interval = resync_interval
+        self.retry_delay = retry_delay
+        self._heap = []  # (만료일시, 선점 ID) 최소 힙
+        self._scheduled = set()  # 힙에 있는 유효한 선점 ID
+        self._condition = threading.Condition()
+        self._thread = None
+        self.expired = 0
+        self.sweeps = 0
+        self.conflicts = 0
+        self.errors = 0
+        self.last_error = None
+
+    def init_app(self, app):
+        """
+        선점 테이블 생성(없으면) 후 스위퍼 스레드 시작
+        """
+        if self._thread is not None:
+            return
+        with app.app_context():
+            SeatHold.__table__.create(db.engine, checkfirst=True)
+        self._thread = threading.Thread(
+            target=self._sweep_loop, args=(app,), daemon=True
+        )
+        self._thread.start()
+
+    def schedule(self, hold_id, expires_at):
+        """
+        선점 만료 예약 (가장 빠른 만료 시각이 바뀌면 스위퍼를 깨움)
+        """
+        with self._condition:
+            if hold_id in self._scheduled:
+                return
+            self._scheduled.add(hold_id)
+            heapq.heappush(self._heap, (expires_at, hold_id))
+            if self._heap[0][1] == hold_id:
+                self._condition.notify()
+
+    def discard(self, hold_id):
+        """
+        예약 전환/취소된 선점을 만료 대상에서 제외
+        """
+        with self._condition:
+            self._scheduled.discard(hold_id)
+
+    def _pop_due(self, now):
+        # 만료된 선점 ID를 최대 batch_size개 꺼냄 (제외된 선점은 건너뜀)
+        due = []
+        while self._heap and self._heap[0][0] <= now and len(due) < self.batch_size:
+            _, hold_id = heapq.heappop(self._heap)
+            if hold_id in self._scheduled:
+                self._scheduled.discard(hold_id)
+                due.append(hold_id)
+        return due
+
+    def _wait_seconds(self, next_resync):
+        timeout = next_resync - time.monotonic()
+        if self._heap:
+            timeout = min(timeout, (self._heap[0][0] - datetime.now()).total_seconds())
+        return timeout
+
+    def sweep(self, now=None):
+        """
+        만료된 선점을 배치 단위로 반환 (앱 컨텍스트 안에서 호출), 반환한 선점 수 반환
+        """
+        now = now or datetime.now()
+        total = 0
+        while True:
+            with self._condition:
+                due = self._pop_due(now)
+            if not due:
+                return total
+            expired = SeatHold.expire_holds(due, now)
+            self.sweeps += 1
+            if expired is None:
+                # 다른 프로세스가 먼저 처리한 선점이 섞여 있으면 retry_delay초 뒤에 다시 확인
+                # (만료 시각 그대로 다시 넣으면 힙의 가장 빠른 만료 시각이 지난 상태로 남아 바로 재시도)
+                self.conflicts += 1
+                retry_at = now + timedelta(seconds=self.retry_delay)
+                for hold_id in due:
+                    self.schedule(hold_id, retry_at)
+                print(
+                    f"좌석 선점 만료 처리 충돌 : {len(due)}건, {self.retry_delay}초 후 재시도"
+                )
+                return total
+            self.expired += expired
+            total += expired
+
+    def resync(self):
+        """
+        다음 재동기화 전까지 만료되는 선점을 DB에서 읽어 힙에 추가 (앱 컨텍스트 안에서 호출)
+        """
+        until = datetime.now() + timedelta(seconds=self.resync_interval)
+        while True:
+            holds = SeatHold.expiring_holds(until, self.batch_size)
+            db.session.rollback()
+            with self._condition:
+                added = [hold for hold in holds if hold.hold_id not in self._scheduled]
+            for hold_id, expires_at in added:
+                self.schedule(hold_id, expires_at)
+            # 한 배치가 모두 이미 힙에 있으면 나머지도 힙에 있거나 다음 주기에 읽음
+            if len(holds) < self.batch_size or not added:
+                return
+
+    def _sweep_loop(self, app):
+        next_resync = 0.0
+        while True:
+            try:
+                with app.app_context():
+                    if time.monotonic() >= next_resync:
+                        self.resync()
+                        next_resync = time.monotonic() + self.resync_interval
+                    self.sweep()
+            except Exception as e:
+                self.errors += 1
+                self.last_error = str(e)
+                print(f"좌석 선점 만료 처리 오류 : {e}")
+            with self._condition:
+                timeout = self._wait_seconds(next_resync)
+                if timeout > 0:
+                    self._condition.wait(timeout)
+
+    def stats(self):
+        with self._condition:
+            return {
+                "scheduled": len(self._scheduled),
+                "heap": len(self._heap),
+                "expired": self.expired,
+                "sweeps": self.sweeps,
+                "conflicts": self.conflicts,
+                "errors": self.errors,
+                "last_error": self.last_error,
+            }
+
+
+# 애플리케이션 전역 좌석 선점 스위퍼 (app.py에서 init_app)
+seat_hold_sweeper = SeatHoldSweeper(
+    batch_size=Config.SEAT_HOLD_SWEEP_BATCH,
+    resync_interval=Config.SEAT_HOLD_RESYNC_SECONDS,
+    retry_delay=Config.SEAT_HOLD_RETRY_SECONDS,
+)
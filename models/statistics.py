@@ -1,23 +1,94 @@
 from models.reservation import Reservation
 from models.cancellation import Cancellation
 from models.customer import Customer, db
+from models.stats_summary import CustomerPayment, CustomerRefund, FlightRevenue
 import pandas as pd
-from sqlalchemy import func, desc, over, text
+from sqlalchemy import func, desc, over, text, and_, or_
+from datetime import datetime
+import base64
+import json
 
 
-def get_group01_stats():
-    q = (
+def _group01_query():
+    # 운항편별 집계 테이블(FLIGHT_REVENUE)에서 조회 (예약 이력 크기와 무관)
+    return (
         db.session.query(
-            Reservation.flight_number.label("flight_number"),
-            Reservation.departure_date_time.label("departure_date_time"),
-            func.sum(Reservation.payment).label("total_amount"),
-            func.avg(Reservation.payment).label("avg_amount"),
-            func.count().label("reservation_count"),
+            FlightRevenue.flight_number.label("flight_number"),
+            FlightRevenue.departure_date_time.label("departure_date_time"),
+            FlightRevenue.total_amount.label("total_amount"),
+            (FlightRevenue.total_amount * 1.0 / FlightRevenue.reservation_count).label(
+                "avg_amount"
+            ),
+            FlightRevenue.reservation_count.label("reservation_count"),
+        )
+        .filter(FlightRevenue.reservation_count > 0)
+        .order_by(FlightRevenue.total_amount.desc())
+    )
+
+
+def _group02_query():
+    # 고객별 환불 집계 테이블(CUSTOMER_REFUND)에서 조회
+    return (
+        db.session.query(
+            CustomerRefund.cno.label("cno"),
+            Customer.name.label("name"),
+            CustomerRefund.total_refund.label("total_refund"),
+            CustomerRefund.max_refund.label("max_refund"),
+            CustomerRefund.cancel_count.label("cancel_count"),
         )
-        .group_by(Reservation.flight_number, Reservation.departure_date_time)
-        .order_by(func.sum(Reservation.payment).desc())
+        .join(Customer, Customer.cno == CustomerRefund.cno)
+        .filter(CustomerRefund.total_refund > 0)
+        .order_by(CustomerRefund.total_refund.desc())
     )
-    df = pd.read_sql(q.statement, db.engine)
+
+
+def _window01_query(with_keys=False):
+    columns = [
+        Reservation.flight_number.label("flight_number"),
+        Reservation.departure_date_time.label("departure_date_time"),
+        Reservation.payment.label("amount"),
+        func.sum(Reservation.payment)
+        .over(
+            partition_by=[Reservation.flight_number, Reservation.departure_date_time],
+            order_by=Reservation.reserve_date_time,
+        )
+        .label("cumulative_amount"),
+        func.rank()
+        .over(
+            partition_by=[Reservation.flight_number, Reservation.departure_date_time],
+            order_by=desc(Reservation.payment),
+        )
+        .label("amount_rank"),
+    ]
+    # 키셋 페이지네이션용 정렬 키 컬럼 추가
+    if with_keys:
+        columns += [
+            Reservation.reserve_date_time.label("reserve_date_time"),
+            Reservation.cno.label("cno"),
+            Reservation.seat_class.label("seat_class"),
+        ]
+    return db.session.query(*columns)
+
+
+def _window02_query():
+    # 고객별 예약 집계 테이블(CUSTOMER_PAYMENT)에서 순위 계산 (고객 수에만 비례)
+    return (
+        db.session.query(
+            Customer.cno.label("cno"),
+            Customer.name.label("name"),
+            CustomerPayment.total_amount.label("total_amount"),
+            func.rank()
+            .over(order_by=CustomerPayment.total_amount.desc())
+            .label("total_rank"),
+        )
+        .join(CustomerPayment, Customer.cno == CustomerPayment.cno)
+        .filter(CustomerPayment.reservation_count > 0)
+        .order_by("total_rank")
+    )
+
+
+def get_group01_stats():
+    df = pd.read_sql(_group01_query().statement, db.engine)
     df.columns = [
         "flight_number",
         "departure_date_time",
@@ -39,20 +110,7 @@ def get_group01_stats():
 
 
 def get_group02_stats():
-    q = (
-        db.session.query(
-            Cancellation.cno.label("cno"),
-            Customer.name.label("name"),
-            func.sum(Cancellation.refund).label("total_refund"),
-            func.max(Cancellation.refund).label("max_refund"),
-            func.count().label("cancel_count"),
-        )
-        .join(Customer, Customer.cno == Cancellation.cno)
-        .group_by(Cancellation.cno, Customer.name)
-        .having(func.sum(Cancellation.refund) > 0)
-        .order_by(func.sum(Cancellation.refund).desc())
-    )
-    df = pd.read_sql(q.statement, db.engine)
+    df = pd.read_sql(_group02_query().statement, db.engine)
     df.columns = ["cno", "name", "total_refund", "max_refund", "cancel_count"]
     # name 컬럼은 내부적으로만 사용, 반환 시에는 제거
     df = df[["cno", "name", "cancel_count", "total_refund", "max_refund"]]
@@ -60,24 +118,7 @@ def get_group02_stats():
 
 
 def get_window01_stats():
-    q = db.session.query(
-        Reservation.flight_number.label("flight_number"),
-        Reservation.departure_date_time.label("departure_date_time"),
-        Reservation.payment.label("amount"),
-        func.sum(Reservation.payment)
-        .over(
-            partition_by=[Reservation.flight_number, Reservation.departure_date_time],
-            order_by=Reservation.reserve_date_time,
-        )
-        .label("cumulative_amount"),
-        func.rank()
-        .over(
-            partition_by=[Reservation.flight_number, Reservation.departure_date_time],
-            order_by=desc(Reservation.payment),
-        )
-        .label("amount_rank"),
-    )
-    df = pd.read_sql(q.statement, db.engine)
+    df = pd.read_sql(_window01_query().statement, db.engine)
     df.columns = [
         "flight_number",
         "departure_date_time",
@@ -99,18 +140,133 @@ def get_window01_stats():
 
 
 def get_window02_stats():
-    sql = """
-    SELECT
-        c.cno,
-        c.name,
-        SUM(r.payment) AS total_amount,
-        RANK() OVER (ORDER BY SUM(r.payment) DESC) AS total_rank
-    FROM customer c
-    JOIN reservation r ON c.cno = r.cno
-    GROUP BY c.cno, c.name
-    ORDER BY total_rank
-    """
-    df = pd.read_sql(text(sql), db.engine)
+    df = pd.read_sql(_window02_query().statement, db.engine)
     df.columns = ["cno", "name", "total_amount", "total_rank"]
     df = df[["cno", "name", "total_amount", "total_rank"]]
     return df
+
+
+# 통계 타입별 (조회 쿼리, 반환 컬럼 순서) - 스트리밍 내보내기용
+STAT_QUERIES = {
+    "group01": (
+        _group01_query,
+        [
+            "flight_number",
+            "departure_date_time",
+            "reservation_count",
+            "total_amount",
+            "avg_amount",
+        ],
+    ),
+    "group02": (
+        _group02_query,
+        ["cno", "name", "cancel_count", "total_refund", "max_refund"],
+    ),
+    "window01": (
+        _window01_query,
+        [
+            "flight_number",
+            "departure_date_time",
+            "cumulative_amount",
+            "amount",
+            "amount_rank",
+        ],
+    ),
+    "window02": (_window02_query, ["cno", "name", "total_amount", "total_rank"]),
+}
+
+# window01 키셋 페이지네이션 정렬 키 (예약 테이블 기본키 + 예약일시)
+WINDOW01_KEYS = [
+    "flight_number",
+    "departure_date_time",
+    "reserve_date_time",
+    "cno",
+    "seat_class",
+]
+
+
+def iter_stats(stat_type, chunksize=10000):
+    """
+    통계 결과를 chunksize 행씩 DataFrame으로 나누어 반환하는 제너레이터
+    (서버 측 커서로 조회하므로 전체 결과를 메모리에 올리지 않음)
+    """
+    query, columns = STAT_QUERIES[stat_type]
+    with db.engine.connect().execution_options(
+        stream_results=True, max_row_buffer=chunksize
+    ) as conn:
+        for chunk in pd.read_sql(query().statement, conn, chunksize=chunksize):
+            yield chunk[columns]
+
+
+def _keyset_after(columns, values, inclusive=False, descending=False):
+    """
+    (c1, c2, ...) > (v1, v2, ...) 조건을 AND/OR 조합으로 생성 (오라클은 행 값 비교 미지원)
+    descending이면 내림차순 정렬의 다음 페이지 조건 (c1, c2, ...) < (v1, v2, ...)
+    """
+    clauses = [
+        and_(
+            *[columns[j] == values[j] for j in range(i)],
+            columns[i] < values[i] if descending else columns[i] > values[i],
+        )
+        for i in range(len(columns))
+    ]
+    if inclusive:
+        clauses.append(and_(*[c == v for c, v in zip(columns, values)]))
+    return or_(*clauses)
+
+
+def encode_cursor(values):
+    """
+    키셋 커서 값을 URL에 넣을 수 있는 문자열로 변환
+    """
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """
+    encode_cursor()로 만든 커서 문자열을 window01 정렬 키 값으로 복원 (형식이 틀리면 ValueError)
+    """
+    values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    if not isinstance(values, list) or len(values) != len(WINDOW01_KEYS):
+        raise ValueError("잘못된 커서입니다.")
+    try:
+        return [
+            datetime.fromisoformat(value) if name.endswith("date_time") else str(value)
+            for name, value in zip(WINDOW01_KEYS, values)
+        ]
+    except TypeError:
+        raise ValueError("잘못된 커서입니다.")
+
+
+def get_window01_page(page_size=100, after=None):
+    """
+    window01 통계 키셋 페이지 조회, (DataFrame, 다음 페이지 커서 값 또는 None) 반환
+    """
+    q = _window01_query(with_keys=True)
+    if after:
+        # 이전 항공편 파티션 제외 (파티션 단위로 거르므로 누적합/순위 값은 그대로 유지)
+        q = q.filter(
+            _keyset_after(
+                [Reservation.flight_number, Reservation.departure_date_time],
+                after[:2],
+                inclusive=True,
+            )
+        )
+    sub = q.subquery()
+    keys = [sub.c[name] for name in WINDOW01_KEYS]
+
+    page = db.session.query(sub)
+    if after:
+        page = page.filter(_keyset_after(keys, after))
+    page = page.order_by(*keys).limit(page_size + 1)
+
+    df = pd.read_sql(page.statement, db.engine)
+    next_after = None
+    if len(df) > page_size:
+        df = df.iloc[:page_size]
+        next_after = [
+            v.to_pydatetime() if isinstance(v, pd.Timestamp) else v
+            for v in df.iloc[-1][WINDOW01_KEYS].tolist()
+        ]
+    return df[STAT_QUERIES["window01"][1]], next_after
@@ -0,0 +1,106 @@
+import hashlib
+import threading
+import time
+
+from config import Config
+
+
+class StatsRenderCache:
+    """
+    통계 조회 결과/차트 렌더링 캐시
+    - 예약/취소가 발생하면 bump()로 데이터 버전을 올려 이전 버전 항목을 모두 폐기
+    - 백그라운드 스레드가 새 버전의 통계/차트를 미리 렌더링하여 캐시를 데움
+    - 다른 프로세스에서 발생한 예약/취소는 bump()가 호출되지 않으므로
+      check_interval초마다 DB 집계 값(signature)을 확인하여 바뀌었으면 폐기
+    """
+
+    def __init__(self, prerender_delay=2.0, check_interval=10.0):
+        self.prerender_delay = prerender_delay
+        self.check_interval = check_interval
+        self.version = 0
+        self._signature = None  # 마지막으로 렌더링한 시점의 DB 집계 값
+        self._entries = {}  # key -> 현재 버전의 값
+        self._lock = threading.Lock()
+        # matplotlib(pyplot)은 스레드 안전하지 않으므로 조회/렌더링을 직렬화
+        # (차트 builder가 표 조회 get_or_build()를 다시 호출하므로 재진입 가능한 잠금 사용)
+        self._render_lock = threading.RLock()
+        self._dirty = threading.Event()
+        self._thread = None
+
+    def bump(self):
+        """
+        통계 데이터 버전 증가 (예약/취소 커밋 후 호출)
+        """
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+        self._dirty.set()
+
+    def get_or_build(self, key, builder):
+        """
+        캐시된 값 반환, 없으면 builder()로 생성 후 저장 (생성 중 버전이 바뀌면 저장하지 않음)
+        """
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+            version = self.version
+
+        with self._render_lock:
+            with self._lock:
+                if key in self._entries:
+                    return self._entries[key]
+            value = builder()
+
+        with self._lock:
+            if self.version == version:
+                self._entries[key] = value
+        return value
+
+    @staticmethod
+    def make_etag(content):
+        return hashlib.sha1(content).hexdigest()
+
+    def start_prerender(self, app, warm, signature=None):
+        """
+        백그라운드 사전 렌더링 스레드 시작 (시작 시 1회 + 버전이 바뀔 때마다 warm() 실행)
+        signature: 통계 원본이 바뀌면 값이 달라지는 함수 (다른 프로세스의 변경 확인용)
+        """
+        if self._thread is not None:
+            return
+        self._dirty.set()
+        self._thread = threading.Thread(
+            target=self._prerender_loop, args=(app, warm, signature), daemon=True
+        )
+        self._thread.start()
+
+    def _changed_elsewhere(self, app, signature):
+        # DB 집계 값이 마지막 렌더링 때와 다르면 다른 프로세스에서 예약/취소가 발생한 것
+        try:
+            with app.app_context():
+                return signature() != self._signature
+        except Exception as e:
+            print(f"통계 변경 확인 오류 : {e}")
+            return False
+
+    def _prerender_loop(self, app, warm, signature):
+        while True:
+            timeout = self.check_interval if signature is not None else None
+            if not self._dirty.wait(timeout):
+                if not self._changed_elsewhere(app, signature):
+                    continue
+                self.bump()
+            # 연속된 예약/취소는 한 번에 반영되도록 잠시 대기
+            time.sleep(self.prerender_delay)
+            self._dirty.clear()
+            try:
+                with app.app_context():
+                    # 렌더링 전에 집계 값을 읽어두어 렌더링 중 변경도 다음 확인 때 반영
+                    if signature is not None:
+                        self._signature = signature()
+                    warm()
+            except Exception as e:
+                print(f"통계 사전 렌더링 오류 : {e}")
+
+
+# 애플리케이션 전역 통계 캐시
+stats_cache = StatsRenderCache(check_interval=Config.STATS_CHECK_SECONDS)
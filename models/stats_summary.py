@@ -0,0 +1,419 @@
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    DateTime,
+    bindparam,
+    case,
+    delete,
+    func,
+    insert,
+    inspect,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+from models.customer import db
+
+# 통계용 집계 테이블 (예약/취소 시 증분 갱신, rebuild_summaries()로 전체 재계산)
+
+
+class FlightRevenue(db.Model):
+    __tablename__ = "FLIGHT_REVENUE"
+
+    # 운항편별 예약 금액 합계/예약 건수
+    flight_number = Column("FLIGHT_NUMBER", String(20), primary_key=True)  # 운항편명
+    departure_date_time = Column(
+        "DEPARTURE_DATE_TIME", DateTime, primary_key=True
+    )  # 출발일시
+    total_amount = Column("TOTAL_AMOUNT", Integer, nullable=False)  # 예약 금액 합계
+    reservation_count = Column(
+        "RESERVATION_COUNT", Integer, nullable=False
+    )  # 예약 건수
+
+    def __repr__(self):
+        return f"<FlightRevenue {self.flight_number} {self.departure_date_time}>"
+
+
+class CustomerPayment(db.Model):
+    __tablename__ = "CUSTOMER_PAYMENT"
+
+    # 고객별 예약 금액 합계/예약 건수
+    cno = Column("CNO", String(20), primary_key=True)  # 회원번호
+    total_amount = Column("TOTAL_AMOUNT", Integer, nullable=False)  # 예약 금액 합계
+    reservation_count = Column(
+        "RESERVATION_COUNT", Integer, nullable=False
+    )  # 예약 건수
+
+    def __repr__(self):
+        return f"<CustomerPayment {self.cno}>"
+
+
+class CustomerRefund(db.Model):
+    __tablename__ = "CUSTOMER_REFUND"
+
+    # 고객별 환불 금액 합계/최대 환불액/취소 건수
+    cno = Column("CNO", String(20), primary_key=True)  # 회원번호
+    total_refund = Column("TOTAL_REFUND", Integer, nullable=False)  # 환불 금액 합계
+    max_refund = Column("MAX_REFUND", Integer, nullable=False)  # 최대 환불액
+    cancel_count = Column("CANCEL_COUNT", Integer, nullable=False)  # 취소 건수
+
+    def __repr__(self):
+        return f"<CustomerRefund {self.cno}>"
+
+
+SUMMARY_MODELS = [FlightRevenue, CustomerPayment, CustomerRefund]
+
+# IN 목록 최대 길이 (오라클은 IN 목록을 1000개로 제한)
+IN_LIST_SIZE = 1000
+
+
+def _upsert(model, key, increments, maximums=None):
+    """
+    집계 행 증분 갱신 (행이 없으면 INSERT), 커밋은 호출한 쪽 트랜잭션에서 수행
+    """
+    maximums = maximums or {}
+    values = {
+        name: getattr(model, name) + amount for name, amount in increments.items()
+    }
+    for name, amount in maximums.items():
+        column = getattr(model, name)
+        values[name] = case((column < amount, amount), else_=column)
+
+    statement = (
+        update(model)
+        .where(*[getattr(model, name) == value for name, value in key.items()])
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    if db.session.execute(statement).rowcount:
+        return
+
+    try:
+        with db.session.begin_nested():
+            db.session.execute(insert(model).values(**key, **increments, **maximums))
+    except IntegrityError:
+        # 다른 트랜잭션이 먼저 행을 만든 경우 다시 UPDATE
+        db.session.execute(statement)
+
+
+def record_reservation(cno, flight_number, departure_date_time, payment):
+    """
+    예약 생성 시 집계 반영
+    """
+    _upsert(
+        FlightRevenue,
+        {"flight_number": flight_number, "departure_date_time": departure_date_time},
+        {"total_amount": payment, "reservation_count": 1},
+    )
+    _upsert(
+        CustomerPayment,
+        {"cno": cno},
+        {"total_amount": payment, "reservation_count": 1},
+    )
+
+
+def _upsert_many(model, key_names, rows, maximum_names=()):
+    """
+    여러 집계 행 일괄 증분 갱신 (기존 행은 executemany UPDATE, 없는 행은 일괄 INSERT)
+    rows: 키/값 컬럼 dict 리스트, maximum_names에 없는 값 컬럼은 증분으로 처리
+    """
+    if not rows:
+        return
+    value_names = [name for name in rows[0] if name not in key_names]
+    key_columns = [getattr(model, name) for name in key_names]
+
+    # 이미 있는 집계 행 키 조회
+    existing = set()
+    for start in range(0, len(rows), IN_LIST_SIZE):
+        keys = [
+            tuple(row[name] for name in key_names)
+            for row in rows[start : start + IN_LIST_SIZE]
+        ]
+        if len(key_columns) == 1:
+            condition = key_columns[0].in_([key[0] for key in keys])
+        else:
+            condition = tuple_(*key_columns).in_(keys)
+        existing.update(
+            tuple(row)
+            for row in db.session.execute(select(*key_columns).where(condition))
+        )
+
+    updates = []
+    inserts = []
+    for row in rows:
+        key = tuple(row[name] for name in key_names)
+        (updates if key in existing else inserts).append(row)
+
+    if updates:
+        values = {}
+        for name in value_names:
+            column = getattr(model, name)
+            amount = bindparam(f"v_{name}")
+            if name in maximum_names:
+                values[column] = case((column < amount, amount), else_=column)
+            else:
+                values[column] = column + amount
+        db.session.execute(
+            update(model.__table__)
+            .where(
+                *[getattr(model, name) == bindparam(f"k_{name}") for name in key_names]
+            )
+            .values(values),
+            [
+                {
+                    **{f"k_{name}": row[name] for name in key_names},
+                    **{f"v_{name}": row[name] for name in value_names},
+                }
+                for row in updates
+            ],
+        )
+
+    if inserts:
+        try:
+            with db.session.begin_nested():
+                db.session.execute(
+                    insert(model.__table__),
+                    [
+                        {
+                            getattr(model, name).expression.key: value
+                            for name, value in row.items()
+                        }
+                        for row in inserts
+                    ],
+                )
+        except IntegrityError:
+            # 다른 트랜잭션이 먼저 만든 행이 있으면 한 행씩 갱신
+            for row in inserts:
+                _upsert(
+                    model,
+                    {name: row[name] for name in key_names},
+                    {
+                        name: row[name]
+                        for name in value_names
+                        if name not in maximum_names
+                    },
+                    {name: row[name] for name in maximum_names},
+                )
+
+
+def record_reservations(reservations):
+    """
+    여러 예약을 한 번에 집계 반영 (항공편/고객별로 합산 후 일괄 갱신)
+    reservations: (cno, flight_number, departure_date_time, payment) 리스트
+    """
+    flights = {}
+    customers = {}
+    for cno, flight_number, departure_date_time, payment in reservations:
+        for totals, key in (
+            (flights, (flight_number, departure_date_time)),
+            (customers, cno),
+        ):
+            amount, count = totals.get(key, (0, 0))
+            totals[key] = (amount + payment, count + 1)
+
+    _upsert_many(
+        FlightRevenue,
+        ["flight_number", "departure_date_time"],
+        [
+            {
+                "flight_number": flight_number,
+                "departure_date_time": departure_date_time,
+                "total_amount": amount,
+                "reservation_count": count,
+            }
+            for (flight_number, departure_date_time), (amount, count) in flights.items()
+        ],
+    )
+    _upsert_many(
+        CustomerPayment,
+        ["cno"],
+        [
+            {"cno": cno, "total_amount": amount, "reservation_count": count}
+            for cno, (amount, count) in customers.items()
+        ],
+    )
+
+
+def record_cancellations(cancellations):
+    """
+    여러 예약 취소를 한 번에 집계 반영 (항공편/고객별로 합산 후 일괄 갱신)
+    cancellations: (cno, flight_number, departure_date_time, payment, refund) 리스트
+    """
+    flights = {}
+    payments = {}
+    refunds = {}
+    for cno, flight_number, departure_date_time, payment, refund in cancellations:
+        amount, count = flights.get((flight_number, departure_date_time), (0, 0))
+        flights[(flight_number, departure_date_time)] = (amount + payment, count + 1)
+        amount, count = payments.get(cno, (0, 0))
+        payments[cno] = (amount + payment, count + 1)
+        total, largest, count = refunds.get(cno, (0, 0, 0))
+        refunds[cno] = (total + refund, max(largest, refund), count + 1)
+
+    _upsert_many(
+        FlightRevenue,
+        ["flight_number", "departure_date_time"],
+        [
+            {
+                "flight_number": flight_number,
+                "departure_date_time": departure_date_time,
+                "total_amount": -amount,
+                "reservation_count": -count,
+            }
+            for (flight_number, departure_date_time), (amount, count) in flights.items()
+        ],
+    )
+    _upsert_many(
+        CustomerPayment,
+        ["cno"],
+        [
+            {"cno": cno, "total_amount": -amount, "reservation_count": -count}
+            for cno, (amount, count) in payments.items()
+        ],
+    )
+    _upsert_many(
+        CustomerRefund,
+        ["cno"],
+        [
+            {
+                "cno": cno,
+                "total_refund": total,
+                "max_refund": largest,
+                "cancel_count": count,
+            }
+            for cno, (total, largest, count) in refunds.items()
+        ],
+        maximum_names=("max_refund",),
+    )
+
+
+def record_cancellation(cno, flight_number, departure_date_time, payment, refund):
+    """
+    예약 취소 시 집계 반영 (예약 금액 차감, 환불 금액 누적)
+    """
+    _upsert(
+        FlightRevenue,
+        {"flight_number": flight_number, "departure_date_time": departure_date_time},
+        {"total_amount": -payment, "reservation_count": -1},
+    )
+    _upsert(
+        CustomerPayment,
+        {"cno": cno},
+        {"total_amount": -payment, "reservation_count": -1},
+    )
+    _upsert(
+        CustomerRefund,
+        {"cno": cno},
+        {"total_refund": refund, "cancel_count": 1},
+        {"max_refund": refund},
+    )
+
+
+def summary_signature():
+    """
+    집계 테이블 합계 (예약/취소가 반영될 때마다 값이 바뀜, 다른 프로세스의 통계 변경 확인용)
+    """
+    revenue = db.session.execute(
+        select(
+            func.sum(FlightRevenue.reservation_count),
+            func.sum(FlightRevenue.total_amount),
+        )
+    ).one()
+    refund = db.session.execute(
+        select(
+            func.sum(CustomerRefund.cancel_count), func.sum(CustomerRefund.total_refund)
+        )
+    ).one()
+    return tuple(revenue) + tuple(refund)
+
+
+def ensure_summaries():
+    """
+    집계 테이블이 없으면 생성 후 원본으로 채움 (배포 단계의 flask init-stats에서 호출)
+    DDL과 전체 재계산을 수행하므로 워커 시작 시마다 호출하지 않음
+    생성한 테이블 이름 리스트 반환
+    """
+    existing = set(inspect(db.engine).get_table_names())
+    missing = [
+        model.__tablename__
+        for model in SUMMARY_MODELS
+        if model.__tablename__ not in existing
+        and model.__tablename__.lower() not in existing
+    ]
+    if missing:
+        rebuild_summaries()
+    return missing
+
+
+def rebuild_summaries():
+    """
+    집계 테이블을 RESERVATION/CANCELLATION 원본으로 전체 재계산 (불일치 보정용)
+    """
+    from models.reservation import Reservation
+    from models.cancellation import Cancellation
+
+    # 집계 테이블이 없으면 생성
+    db.metadata.create_all(
+        db.engine, tables=[model.__table__ for model in SUMMARY_MODELS]
+    )
+
+    for model in SUMMARY_MODELS:
+        db.session.execute(delete(model))
+
+    db.session.execute(
+        insert(FlightRevenue).from_select(
+            [
+                FlightRevenue.flight_number,
+                FlightRevenue.departure_date_time,
+                FlightRevenue.total_amount,
+                FlightRevenue.reservation_count,
+            ],
+            db.session.query(
+                Reservation.flight_number,
+                Reservation.departure_date_time,
+                func.sum(Reservation.payment),
+                func.count(),
+            )
+            .group_by(Reservation.flight_number, Reservation.departure_date_time)
+            .statement,
+        )
+    )
+    db.session.execute(
+        insert(CustomerPayment).from_select(
+            [
+                CustomerPayment.cno,
+                CustomerPayment.total_amount,
+                CustomerPayment.reservation_count,
+            ],
+            db.session.query(
+                Reservation.cno, func.sum(Reservation.payment), func.count()
+            )
+            .group_by(Reservation.cno)
+            .statement,
+        )
+    )
+    db.session.execute(
+        insert(CustomerRefund).from_select(
+            [
+                CustomerRefund.cno,
+                CustomerRefund.total_refund,
+                CustomerRefund.max_refund,
+                CustomerRefund.cancel_count,
+            ],
+            db.session.query(
+                Cancellation.cno,
+                func.sum(Cancellation.refund),
+                func.max(Cancellation.refund),
+                func.count(),
+            )
+            .group_by(Cancellation.cno)
+            .statement,
+        )
+    )
+    db.session.commit()
+
+    return {
+        model.__tablename__: db.session.query(model).count() for model in SUMMARY_MODELS
+    }
@@ -0,0 +1,256 @@
+import heapq
+import threading
+import time
+from collections import Counter, deque
+
+from flask import Response, g, has_request_context, request
+from config import Config
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 요청 단위 SQL/지연 시간 계측
+# - SQLAlchemy 엔진 이벤트로 요청마다 실행한 SQL 문 수, DB 시간, 가장 느린 문장을 기록
+# - 같은 SELECT 문을 한 요청에서 여러 번 실행하면 N+1 패턴으로 표시
+# - 응답에 Server-Timing 헤더 추가, /metrics에서 Prometheus 텍스트 형식으로 라우트별 지연 시간 제공
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RequestProfile:
+    """
+    요청 하나의 SQL 실행 기록
+    """
+
+    def __init__(self, slowest_size):
+        self.started = time.perf_counter()
+        self.statement_count = 0
+        self.db_time = 0.0
+        self.slowest_size = slowest_size
+        self._slowest = []  # (소요 시간, 순번, SQL) 최소 힙
+        self.statements = Counter()  # SQL 문 -> 실행 횟수
+
+    def record(self, statement, elapsed):
+        self.statement_count += 1
+        self.db_time += elapsed
+        self.statements[statement] += 1
+        entry = (elapsed, self.statement_count, statement)
+        if len(self._slowest) < self.slowest_size:
+            heapq.heappush(self._slowest, entry)
+        else:
+            heapq.heappushpop(self._slowest, entry)
+
+    def slowest(self):
+        return [
+            {"ms": round(elapsed * 1000, 3), "statement": statement[:300]}
+            for elapsed, _, statement in sorted(self._slowest, reverse=True)
+        ]
+
+    def repeated_selects(self, threshold):
+        """
+        threshold번 이상 반복 실행된 SELECT 문 (N+1 의심)
+        """
+        return [
+            {"count": count, "statement": statement[:300]}
+            for statement, count in self.statements.most_common()
+            if count >= threshold and statement.lstrip().upper().startswith("SELECT")
+        ]
+
+
+class RequestMetrics:
+    """
+    라우트별 요청 지연 시간 히스토그램/DB 사용량 집계 (Prometheus 텍스트 형식 출력)
+    """
+
+    def __init__(
+        self,
+        buckets=DEFAULT_BUCKETS,
+        slowest_size=5,
+        n_plus_one_threshold=5,
+        recent_size=100,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.slowest_size = slowest_size
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self._lock = threading.Lock()
+        self._latency = {}  # (라우트, 메서드) -> [버킷별 개수..., 합계, 개수]
+        self._requests = Counter()  # (라우트, 메서드, 상태 코드) -> 요청 수
+        self._db_statements = Counter()  # (라우트, 메서드) -> SQL 문 수 합계
+        self._db_seconds = Counter()  # (라우트, 메서드) -> DB 시간 합계
+        self._n_plus_one = Counter()  # (라우트, 메서드) -> N+1 의심 요청 수
+        self._recent = deque(maxlen=recent_size)  # 최근 요청 기록
+
+    # ---------------------------------------------------------------- Flask 연결
+
+    def init_app(self, app):
+        """
+        요청 훅/엔진 이벤트 등록 및 /metrics 라우트 추가
+        """
+        self.logger = app.logger
+        if not event.contains(
+            Engine, "before_cursor_execute", self._before_cursor_execute
+        ):
+            event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", self._after_cursor_execute)
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.add_url_rule("/metrics", "metrics", self._metrics_view)
+
+    def _before_request(self):
+        g.request_profile = RequestProfile(self.slowest_size)
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @staticmethod
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        stack = conn.info.get("query_started")
+        if not stack:
+            return
+        started = stack.pop()
+        # 요청 밖(백그라운드 스레드, CLI)에서 실행한 SQL은 기록하지 않음
+        if has_request_context():
+            profile = g.get("request_profile")
+            if profile is not None:
+                profile.record(statement, time.perf_counter() - started)
+
+    def _after_request(self, response):
+        profile = g.pop("request_profile", None)
+        if profile is None:
+            return response
+
+        elapsed = time.perf_counter() - profile.started
+        route = request.url_rule.rule if request.url_rule else "<unmatched>"
+        key = (route, request.method)
+        repeated = profile.repeated_selects(self.n_plus_one_threshold)
+
+        response.headers.add(
+            "Server-Timing",
+            f'db;dur={profile.db_time * 1000:.1f};desc="{profile.statement_count} queries"',
+        )
+        response.headers.add("Server-Timing", f"total;dur={elapsed * 1000:.1f}")
+
+        with self._lock:
+            histogram = self._latency.setdefault(key, [0] * (len(self.buckets) + 2))
+            for index, bound in enumerate(self.buckets):
+                if elapsed <= bound:
+                    histogram[index] += 1
+            histogram[-2] += elapsed
+            histogram[-1] += 1
+            self._requests[(route, request.method, response.status_code)] += 1
+            self._db_statements[key] += profile.statement_count
+            self._db_seconds[key] += profile.db_time
+            if repeated:
+                self._n_plus_one[key] += 1
+            self._recent.append(
+                {
+                    "route": route,
+                    "method": request.method,
+                    "status": response.status_code,
+                    "ms": round(elapsed * 1000, 3),
+                    "db_ms": round(profile.db_time * 1000, 3),
+                    "statements": profile.statement_count,
+                    "slowest": profile.slowest(),
+                    "n_plus_one": repeated,
+                }
+            )
+
+        if repeated:
+            self.logger.warning(
+                "N+1 의심 쿼리 (%s %s): %s",
+                request.method,
+                route,
+                ", ".join(
+                    f"{item['count']}회 {item['statement'][:80]}" for item in repeated
+                ),
+            )
+        return response
+
+    # ---------------------------------------------------------------- 조회
+
+    def recent(self, limit=20):
+        """
+        최근 요청 기록 (최신순)
+        """
+        with self._lock:
+            return list(self._recent)[::-1][:limit]
+
+    @staticmethod
+    def _labels(**labels):
+        def escape(value):
+            return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+        return ",".join(f'{name}="{escape(value)}"' for name, value in labels.items())
+
+    def render_prometheus(self):
+        """
+        Prometheus 텍스트 노출 형식으로 지표 출력
+        """
+        lines = [
+            "# HELP http_request_duration_seconds 라우트별 요청 처리 시간",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            for (route, method), histogram in sorted(self._latency.items()):
+                labels = self._labels(route=route, method=method)
+                for bound, count in zip(self.buckets, histogram):
+                    lines.append(
+                        f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}'
+                    )
+                lines.append(
+                    f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram[-1]}'
+                )
+                lines.append(
+                    f"http_request_duration_seconds_sum{{{labels}}} {histogram[-2]:.6f}"
+                )
+                lines.append(
+                    f"http_request_duration_seconds_count{{{labels}}} {histogram[-1]}"
+                )
+
+            lines += [
+                "# HELP http_requests_total 라우트/상태 코드별 요청 수",
+                "# TYPE http_requests_total counter",
+            ]
+            for (route, method, status), count in sorted(self._requests.items()):
+                labels = self._labels(route=route, method=method, status=status)
+                lines.append(f"http_requests_total{{{labels}}} {count}")
+
+            for name, help_text, values, fmt in (
+                (
+                    "db_statements_total",
+                    "라우트별 실행한 SQL 문 수",
+                    self._db_statements,
+                    "{}",
+                ),
+                (
+                    "db_query_seconds_total",
+                    "라우트별 SQL 실행 시간 합계",
+                    self._db_seconds,
+                    "{:.6f}",
+                ),
+                (
+                    "db_n_plus_one_requests_total",
+                    "N+1 의심 쿼리가 발생한 요청 수",
+                    self._n_plus_one,
+                    "{}",
+                ),
+            ):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                for (route, method), value in sorted(values.items()):
+                    labels = self._labels(route=route, method=method)
+                    lines.append(f"{name}{{{labels}}} {fmt.format(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    def _metrics_view(self):
+        return Response(
+            self.render_prometheus(),
+            mimetype="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+
+# 애플리케이션 전역 요청 계측기 (app.py에서 init_app으로 연결)
+request_metrics = RequestMetrics(
+    slowest_size=Config.METRICS_SLOWEST_SIZE,
+    n_plus_one_threshold=Config.METRICS_N_PLUS_ONE_THRESHOLD,
+)
@@ -1,16 +1,38 @@
-from flask import Blueprint, request, session, jsonify, redirect, url_for
+from flask import (
+    Blueprint,
+    Response,
+    request,
+    session,
+    jsonify,
+    redirect,
+    url_for,
+)
 from models.customer import Customer
 from models.customer import db
 from models.airplane import Airplane
 from models.seat import Seat
+from models.seat_hold import SeatHold, seat_hold_sweeper
 from models.reservation import Reservation
 from models.cancellation import Cancellation
-from datetime import datetime
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from models.history import (
+    HISTORY_KEYS,
+    get_history_page,
+    history_item,
+    encode_history_cursor,
+    decode_history_cursor,
+)
+from models.search_cache import search_cache
+from models.lookup_cache import customer_cache, flight_cache
+from models.route_graph import route_graph
+from models.inventory import flight_inventory
+from models.seat_events import seat_events, seat_event_stream
 from config import Config
-
+from models.db_pool import pool_statistics
+from request_metrics import request_metrics
+from datetime import datetime, timedelta
+from mailer import mail_dispatcher
+from session_store import regenerate_session
+from json_response import encode_json_response, search_results
 
 # API (서버-클라이언트 데이터 통신) 전용 라우트
 
@@ -45,9 +67,11 @@ def login():
                 )
             )
 
-    user = Customer.query.filter_by(cno=cno, password=password).first()
+    user = Customer.authenticate(cno, password)
 
     if user:
+        # 로그인 전 세션 ID를 그대로 쓰지 않도록 재발급 (세션 고정 방지)
+        regenerate_session(session)
         session["user_cno"] = user.cno
         session["user_name"] = user.name
         # 관리자/고객 구분
@@ -90,6 +114,53 @@ def logout():
     return redirect(url_for("main.index"))
 
 
+def parse_search_paging(args):
+    """
+    검색 결과 정렬/페이지 파라미터 파싱 (sort=price|time, order=asc|desc, page, page_size)
+    """
+    sort = args.get("sort", "price")
+    order = args.get("order", "asc")
+    return {
+        "sort": sort if sort in ("price", "time") else "price",
+        "order": order if order in ("asc", "desc") else "asc",
+        "page": max(args.get("page", 1, type=int), 1),
+        "page_size": min(
+            max(args.get("page_size", Config.SEARCH_PAGE_SIZE, type=int), 1), 100
+        ),
+    }
+
+
+def search_flights_page(
+    departure_date, departure_airport, arrival_airport, seat_class, paging
+):
+    """
+    검색 결과 한 페이지 조회, (항공편 딕셔너리 리스트, 다음 페이지 존재 여부) 반환
+    """
+    page_size = paging["page_size"]
+    rows = Airplane.search_flights(
+        departure_date=departure_date,
+        departure_airport=departure_airport,
+        arrival_airport=arrival_airport,
+        seat_class=seat_class,
+        sort=paging["sort"],
+        order=paging["order"],
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        limit=page_size + 1,
+        offset=(paging["page"] - 1) * page_size,
+    )
+    return search_results(rows[:page_size]), len(rows) > page_size
+
+
+def fast_json_response(payload, status=200):
+    """
+    대용량 JSON 응답 (orjson 인코딩 + Accept-Encoding에 따른 압축)
+    """
+    body, headers = encode_json_response(
+        payload, request.headers.get("Accept-Encoding")
+    )
+    return Response(body, status=status, headers=headers, mimetype="application/json")
+
+
 @api.route("/search", methods=["GET"])
 def search_page():
     """항공기 검색 API"""
@@ -100,49 +171,35 @@ def search_page():
     seat_class = request.args.get("seat_class")
 
     try:
-        # SQLAlchemy 모델을 사용한 검색
-        search_results = Airplane.search_flights(
-            departure_date=departure_date,
-            departure_airport=departure_airport,
-            arrival_airport=arrival_airport,
-            seat_class=seat_class,
-        )
-
-        # 결과를 딕셔너리 형태로 변환
-        flights = []
-        for row in search_results:
-            flights.append(
-                {
-                    "airline": row[0],
-                    "flight_number": row[1],
-                    "departure_date_time": (
-                        row[2].strftime("%Y-%m-%d %H:%M") if row[2] else None
-                    ),
-                    "departure_airport": row[3],
-                    "arrival_date_time": (
-                        row[4].strftime("%Y-%m-%d %H:%M") if row[4] else None
-                    ),
-                    "arrival_airport": row[5],
-                    "seat_class": row[6],
-                    "number_of_seats": row[7],
-                    "price": row[8],
-                }
-            )
-
-        # JSON 요청인 경우 JSON 응답 반환
-        if request.headers.get("Accept") == "application/json":
-            return jsonify({"success": True, "flights": flights, "count": len(flights)})
-        else:
-            # HTML 요청인 경우 검색 결과를 세션에 저장하고 reservation 페이지로 리다이렉트
-            session["search_results"] = flights
-            session["search_params"] = {
+        # HTML 요청인 경우 검색 조건만 세션에 보관하고 (결과는 세션에 저장하지 않음)
+        # reservation 페이지에서 페이지 단위로 조회 (모든 워커에서 같은 세션 저장소 사용)
+        if request.headers.get("Accept") != "application/json":
+            datetime.strptime(departure_date, "%Y-%m-%d")  # 날짜 형식 검증
+            search_params = {
                 "departure_date": departure_date,
                 "departure_airport": departure_airport,
                 "arrival_airport": arrival_airport,
                 "seat_class": seat_class,
             }
+            session.pop("search_results", None)
+            session["search_params"] = search_params
             return redirect(url_for("main.reservation_page"))
 
+        # JSON 요청인 경우 정렬/페이지 조건을 SQL로 처리하여 한 페이지만 반환
+        paging = parse_search_paging(request.args)
+        flights, has_next = search_flights_page(
+            departure_date, departure_airport, arrival_airport, seat_class, paging
+        )
+        return fast_json_response(
+            {
+                "success": True,
+                "flights": flights,
+                "count": len(flights),
+                "has_next": has_next,
+                **paging,
+            }
+        )
+
     except Exception as e:
         if request.headers.get("Accept") == "application/json":
             return (
@@ -162,6 +219,323 @@ def search_page():
             )
 
 
+def parse_calendar_range(args):
+    """
+    요금 달력 조회 기간 파싱, (시작일, 종료일) 반환, 잘못된 값이면 ValueError(응답 메시지)
+    start_date/end_date로 기간 지정, 또는 departure_date 기준 전후 flex일
+    """
+    start_date = args.get("start_date")
+    end_date = args.get("end_date")
+    departure_date = args.get("departure_date")
+
+    try:
+        if start_date or end_date:
+            start = datetime.strptime(start_date or "", "%Y-%m-%d").date()
+            end = datetime.strptime(end_date or "", "%Y-%m-%d").date()
+        else:
+            center = datetime.strptime(departure_date or "", "%Y-%m-%d").date()
+            flex = min(
+                max(args.get("flex", Config.FARE_CALENDAR_FLEX_DAYS, type=int), 0),
+                Config.FARE_CALENDAR_MAX_DAYS // 2,
+            )
+            start = center - timedelta(days=flex)
+            end = center + timedelta(days=flex)
+    except ValueError:
+        raise ValueError("잘못된 날짜 형식입니다.")
+
+    if end < start:
+        raise ValueError("종료일이 시작일보다 빠릅니다.")
+    if (end - start).days + 1 > Config.FARE_CALENDAR_MAX_DAYS:
+        raise ValueError(
+            f"요금 달력은 최대 {Config.FARE_CALENDAR_MAX_DAYS}일까지 조회할 수 있습니다."
+        )
+    return start, end
+
+
+@api.route("/search/calendar", methods=["GET"])
+def fare_calendar():
+    """요금 달력 API (출발일 범위의 날짜별 최저가/예약 가능 여부)"""
+    departure_airport = request.args.get("departure_airport")
+    arrival_airport = request.args.get("arrival_airport")
+    seat_class = request.args.get("seat_class")
+    if not all([departure_airport, arrival_airport, seat_class]):
+        return (
+            jsonify({"success": False, "message": "모든 검색 조건을 입력해주세요."}),
+            400,
+        )
+
+    try:
+        start, end = parse_calendar_range(request.args)
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+
+    try:
+        rows = Airplane.fare_calendar(
+            start, end, departure_airport, arrival_airport, seat_class
+        )
+    except Exception as e:
+        return (
+            jsonify(
+                {"success": False, "message": f"검색 중 오류가 발생했습니다: {str(e)}"}
+            ),
+            500,
+        )
+
+    days = [Airplane.to_calendar_result(row) for row in rows]
+    prices = [day["min_price"] for day in days if day["available"]]
+    return jsonify(
+        {
+            "success": True,
+            "start_date": start.strftime("%Y-%m-%d"),
+            "end_date": end.strftime("%Y-%m-%d"),
+            "days": days,
+            "lowest_price": min(prices) if prices else None,
+        }
+    )
+
+
+@api.route("/search/itineraries", methods=["GET"])
+def search_itineraries():
+    """경유 항공편 검색 API (직항/1회/2회 경유, sort=price|duration, max_stops, limit)"""
+    departure_date = request.args.get("departure_date")
+    departure_airport = request.args.get("departure_airport")
+    arrival_airport = request.args.get("arrival_airport")
+    seat_class = request.args.get("seat_class")
+    if not all([departure_date, departure_airport, arrival_airport, seat_class]):
+        return (
+            jsonify({"success": False, "message": "모든 검색 조건을 입력해주세요."}),
+            400,
+        )
+    try:
+        datetime.strptime(departure_date, "%Y-%m-%d")
+    except ValueError:
+        return jsonify({"success": False, "message": "잘못된 날짜 형식입니다."}), 400
+
+    # 출발/도착 공항이 겹치면 출발지로 되돌아오는 일정만 나오므로 검색하지 않음
+    departure_codes, arrival_codes = Airplane._get_route_codes(
+        departure_airport, arrival_airport
+    )
+    if set(departure_codes) & set(arrival_codes):
+        return (
+            jsonify(
+                {"success": False, "message": "출발지와 도착지가 같을 수 없습니다."}
+            ),
+            400,
+        )
+
+    sort = request.args.get("sort", "price")
+    sort = sort if sort in ("price", "duration") else "price"
+    max_stops = min(max(request.args.get("max_stops", 2, type=int), 0), 2)
+    limit = min(max(request.args.get("limit", 10, type=int), 1), 50)
+
+    try:
+        results, truncated = Airplane.search_itineraries(
+            departure_date,
+            departure_airport,
+            arrival_airport,
+            seat_class,
+            max_stops=max_stops,
+            sort=sort,
+            limit=limit,
+        )
+    except Exception as e:
+        return (
+            jsonify(
+                {"success": False, "message": f"검색 중 오류가 발생했습니다: {str(e)}"}
+            ),
+            500,
+        )
+
+    mapped_seat_class = Seat._get_seat_class(seat_class)
+    itineraries = [
+        Airplane.to_itinerary_result(legs, number_of_seats, mapped_seat_class)
+        for legs, number_of_seats in results
+    ]
+    return jsonify(
+        {
+            "success": True,
+            "itineraries": itineraries,
+            "count": len(itineraries),
+            "sort": sort,
+            "max_stops": max_stops,
+            "truncated": truncated,
+        }
+    )
+
+
+@api.route("/search/cache-stats", methods=["GET"])
+def search_cache_stats():
+    """검색 캐시 히트/미스 통계 API (관리자용)"""
+    if session.get("user_role") != "admin":
+        return jsonify({"success": False, "message": "관리자 권한이 필요합니다."}), 403
+
+    return jsonify(
+        {
+            "success": True,
+            "cache": search_cache.stats(),
+            "customer_cache": customer_cache.stats(),
+            "flight_cache": flight_cache.stats(),
+            "route_graph": route_graph.stats(),
+            "inventory": flight_inventory.stats(),
+        }
+    )
+
+
+@api.route("/db/pool-stats", methods=["GET"])
+def db_pool_stats():
+    """커넥션 풀 상태 통계 API (관리자용)"""
+    if session.get("user_role") != "admin":
+        return jsonify({"success": False, "message": "관리자 권한이 필요합니다."}), 403
+
+    return jsonify({"success": True, "pool": pool_statistics(db.engine)})
+
+
+@api.route("/db/request-profiles", methods=["GET"])
+def db_request_profiles():
+    """최근 요청별 SQL 실행 횟수/DB 시간/느린 SQL/N+1 의심 쿼리 API (관리자용)"""
+    if session.get("user_role") != "admin":
+        return jsonify({"success": False, "message": "관리자 권한이 필요합니다."}), 403
+
+    limit = min(request.args.get("limit", 20, type=int), 100)
+    return jsonify({"success": True, "requests": request_metrics.recent(limit)})
+
+
+def parse_stream_flights(args):
+    """
+    잔여좌석 알림 구독 항공편 파라미터 파싱 (flight=운항편명|출발일시 반복 지정, 중복 제거)
+    잘못된 값이면 ValueError(응답 메시지)
+    """
+    flights = set()
+    for value in args.getlist("flight"):
+        flight_number, separator, departure = value.partition("|")
+        try:
+            if not flight_number or not separator:
+                raise ValueError(value)
+            flights.add((flight_number, datetime.fromisoformat(departure)))
+        except ValueError:
+            raise ValueError("잘못된 항공편 형식입니다.")
+    if not flights or len(flights) > Config.SEAT_EVENTS_MAX_FLIGHTS:
+        raise ValueError(
+            f"항공편은 1~{Config.SEAT_EVENTS_MAX_FLIGHTS}개까지 구독할 수 있습니다."
+        )
+    return flights
+
+
+@api.route("/seats/stream", methods=["GET"])
+def seat_stream():
+    """잔여좌석 변경 실시간 알림 API (Server-Sent Events, flight=운항편명|출발일시 반복 지정)"""
+    try:
+        flights = parse_stream_flights(request.args)
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+
+    subscription = seat_events.subscribe(flights)
+    if subscription is None:
+        return (
+            jsonify({"success": False, "message": "잠시 후 다시 시도해주세요."}),
+            503,
+        )
+
+    # 구독 등록 후 현재 잔여좌석을 읽어 첫 이벤트로 전송 (검색 이후 바뀐 값 반영, 등록 전후 변경 누락 방지)
+    try:
+        initial_counts = Seat.get_flight_seat_counts(flights)
+    except Exception:
+        seat_events.unsubscribe(subscription)
+        raise
+
+    return Response(
+        seat_event_stream(
+            subscription,
+            initial_counts,
+            heartbeat=Config.SEAT_EVENTS_HEARTBEAT,
+            timeout=Config.SEAT_EVENTS_STREAM_TIMEOUT,
+        ),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@api.route("/seats/stream-stats", methods=["GET"])
+def seat_stream_stats():
+    """잔여좌석 알림 구독자/발행 통계 API (관리자용)"""
+    if session.get("user_role") != "admin":
+        return jsonify({"success": False, "message": "관리자 권한이 필요합니다."}), 403
+
+    return jsonify({"success": True, "seat_events": seat_events.stats()})
+
+
+@api.route("/holds", methods=["POST"])
+def create_seat_hold():
+    """좌석 선점 API (결제 전 잔여좌석 1석 차감, 선점 ID 발급)"""
+    if "user_cno" not in session:
+        return (
+            jsonify({"success": False, "message": "로그인이 필요한 서비스입니다."}),
+            401,
+        )
+    if not request.is_json:
+        return jsonify({"success": False, "message": "잘못된 요청 형식입니다."}), 400
+
+    data = request.get_json()
+    flight_number = data.get("flight_number")
+    departure_date_time = data.get("departure_date_time")
+    seat_class = data.get("seat_class")
+    if not all([flight_number, departure_date_time, seat_class]):
+        return (
+            jsonify({"success": False, "message": "모든 선점 정보를 입력해주세요."}),
+            400,
+        )
+
+    try:
+        departure_datetime = datetime.strptime(departure_date_time, "%Y-%m-%d %H:%M")
+    except ValueError:
+        return jsonify({"success": False, "message": "잘못된 날짜 형식입니다."}), 400
+
+    hold, message = SeatHold.create_hold(
+        session["user_cno"], flight_number, departure_datetime, seat_class
+    )
+    if hold is None:
+        return jsonify({"success": False, "message": message}), 409
+    return jsonify({"success": True, "message": message, **hold.to_dict()})
+
+
+@api.route("/holds/<hold_id>", methods=["DELETE"])
+def release_seat_hold(hold_id):
+    """좌석 선점 취소 API (좌석 즉시 반환)"""
+    if "user_cno" not in session:
+        return (
+            jsonify({"success": False, "message": "로그인이 필요한 서비스입니다."}),
+            401,
+        )
+
+    try:
+        released = SeatHold.release_hold(session["user_cno"], hold_id)
+    except Exception as e:
+        return (
+            jsonify(
+                {
+                    "success": False,
+                    "message": f"선점 취소 중 오류가 발생했습니다: {str(e)}",
+                }
+            ),
+            500,
+        )
+    if not released:
+        return (
+            jsonify({"success": False, "message": "선점 정보를 찾을 수 없습니다."}),
+            404,
+        )
+    return jsonify({"success": True, "message": "좌석 선점이 취소되었습니다."})
+
+
+@api.route("/holds/stats", methods=["GET"])
+def seat_hold_stats():
+    """좌석 선점 만료 처리 통계 API (관리자용)"""
+    if session.get("user_role") != "admin":
+        return jsonify({"success": False, "message": "관리자 권한이 필요합니다."}), 403
+
+    return jsonify({"success": True, "seat_holds": seat_hold_sweeper.stats()})
+
+
 @api.route("/reserve", methods=["POST"])
 def reserve_flight():
     """항공편 예약 API"""
@@ -181,6 +555,7 @@ def reserve_flight():
     departure_date_time = data.get("departure_date_time")
     seat_class = data.get("seat_class")
     price = data.get("price")
+    hold_id = data.get("hold_id")
 
     # 필수 파라미터 검증
     if not all([flight_number, departure_date_time, seat_class, price]):
@@ -193,18 +568,30 @@ def reserve_flight():
         # 날짜 시간 파싱
         departure_datetime = datetime.strptime(departure_date_time, "%Y-%m-%d %H:%M")
 
-        # 예약 생성
-        reservation, message = Reservation.create_reservation(
-            cno=session["user_cno"],
-            flight_number=flight_number,
-            departure_date_time=departure_datetime,
-            seat_class=seat_class,
-            payment=price,
-        )
+        if hold_id:
+            # 좌석 선점을 예약으로 전환 (항공편/결제금액은 선점 정보 사용)
+            reservation, message = Reservation.create_reservation_from_hold(
+                session["user_cno"], hold_id
+            )
+            if reservation:
+                flight_number = reservation.flight_number
+                departure_datetime = reservation.departure_date_time
+                departure_date_time = departure_datetime.strftime("%Y-%m-%d %H:%M")
+                seat_class = reservation.seat_class
+                price = reservation.payment
+        else:
+            # 예약 생성
+            reservation, message = Reservation.create_reservation(
+                cno=session["user_cno"],
+                flight_number=flight_number,
+                departure_date_time=departure_datetime,
+                seat_class=seat_class,
+                payment=price,
+            )
 
         if reservation:
             # 고객 정보 가져오기
-            customer = Customer.query.filter_by(cno=session["user_cno"]).first()
+            customer = Customer.get_cached(session["user_cno"])
             if not customer:
                 return (
                     jsonify(
@@ -214,9 +601,7 @@ def reserve_flight():
                 )
 
             # 항공편 정보 가져오기
-            airplane = Airplane.query.filter_by(
-                flight_number=flight_number, departure_date_time=departure_datetime
-            ).first()
+            airplane = Airplane.get_cached(flight_number, departure_datetime)
 
             # 이메일 전송을 위한 항공편 정보 구성
             flight_info = {
@@ -249,7 +634,8 @@ def reserve_flight():
                     "message": message,
                     "email_sent": email_success,
                     "email_message": email_message,
-                    "reservation_id": f"{reservation.cno}_{reservation.flight_number}_{reservation.departure_date_time}",
+                    # 커밋 후 예약 객체를 다시 읽지 않도록 요청 값으로 구성
+                    "reservation_id": f"{session['user_cno']}_{flight_number}_{departure_datetime}",
                 }
             )
         else:
@@ -269,17 +655,172 @@ def reserve_flight():
         )
 
 
+@api.route("/reserve/batch", methods=["POST"])
+def reserve_flights_batch():
+    """여러 여정 일괄 예약 API (전체 성공 또는 전체 취소, 회원 1명당 항공편/좌석등급별 1석)"""
+    # 로그인 상태 확인
+    if "user_cno" not in session:
+        return (
+            jsonify({"success": False, "message": "로그인이 필요한 서비스입니다."}),
+            401,
+        )
+
+    # JSON 데이터 파싱
+    if not request.is_json:
+        return jsonify({"success": False, "message": "잘못된 요청 형식입니다."}), 400
+
+    raw_items = (request.get_json(silent=True) or {}).get("items")
+    if not isinstance(raw_items, list) or not raw_items:
+        return (
+            jsonify({"success": False, "message": "예약 항목 목록을 입력해주세요."}),
+            400,
+        )
+    if len(raw_items) > Config.RESERVATION_BATCH_MAX:
+        return (
+            jsonify(
+                {
+                    "success": False,
+                    "message": f"한 번에 최대 {Config.RESERVATION_BATCH_MAX}건까지 예약할 수 있습니다.",
+                }
+            ),
+            400,
+        )
+
+    # 항목별 파라미터 검증 (승객 회원번호가 없으면 로그인한 회원)
+    # 다른 회원 명의의 예약은 관리자만 등록 가능
+    # 예약은 회원번호 단위(RESERVATION 기본키: 회원번호 + 항공편 + 좌석등급)이므로
+    # 같은 회원이 같은 항공편/좌석등급을 여러 석 예약할 수는 없음 (동반 승객 정보 미지원)
+    is_admin = session.get("user_role") == "admin"
+    items = []
+    errors = []
+    seen = set()
+    for index, raw in enumerate(raw_items):
+        raw = raw if isinstance(raw, dict) else {}
+        passenger_cno = raw.get("passenger_cno") or session["user_cno"]
+        if passenger_cno != session["user_cno"] and not is_admin:
+            return (
+                jsonify(
+                    {
+                        "success": False,
+                        "message": "다른 회원의 예약은 등록할 수 없습니다.",
+                    }
+                ),
+                403,
+            )
+        flight_number = raw.get("flight_number")
+        departure_date_time = raw.get("departure_date_time")
+        seat_class = raw.get("seat_class")
+        if not all([flight_number, departure_date_time, seat_class]):
+            errors.append({"index": index, "message": "모든 예약 정보를 입력해주세요."})
+            continue
+        try:
+            departure_datetime = datetime.strptime(
+                departure_date_time, "%Y-%m-%d %H:%M"
+            )
+        except (TypeError, ValueError):
+            errors.append({"index": index, "message": "잘못된 날짜 형식입니다."})
+            continue
+        key = (
+            passenger_cno,
+            flight_number,
+            departure_datetime,
+            Seat._get_seat_class(seat_class),
+        )
+        if key in seen:
+            errors.append(
+                {
+                    "index": index,
+                    "message": "한 회원은 같은 항공편/좌석등급을 한 좌석만 예약할 수 있습니다.",
+                }
+            )
+            continue
+        seen.add(key)
+        items.append(
+            {
+                "cno": passenger_cno,
+                "flight_number": flight_number,
+                "departure_date_time": departure_datetime,
+                "seat_class": seat_class,
+            }
+        )
+    if errors:
+        return (
+            jsonify(
+                {
+                    "success": False,
+                    "message": "잘못된 예약 항목이 있습니다.",
+                    "errors": errors,
+                }
+            ),
+            400,
+        )
+
+    # 승객(회원) 정보 조회 (조회 캐시 사용)
+    customers = {
+        cno: Customer.get_cached(cno) for cno in {item["cno"] for item in items}
+    }
+    # 회원번호 존재 여부가 드러나지 않도록 어떤 승객인지 알리지 않음
+    if any(customer is None for customer in customers.values()):
+        return (
+            jsonify({"success": False, "message": "승객 정보를 확인할 수 없습니다."}),
+            400,
+        )
+
+    try:
+        success, results, message = Reservation.create_reservations(items)
+    except Exception as e:
+        return (
+            jsonify(
+                {
+                    "success": False,
+                    "message": f"예약 처리 중 오류가 발생했습니다: {str(e)}",
+                }
+            ),
+            500,
+        )
+
+    for index, result in enumerate(results):
+        result["index"] = index
+        result["departure_date_time"] = result["departure_date_time"].strftime(
+            "%Y-%m-%d %H:%M"
+        )
+    if not success:
+        return jsonify({"success": False, "message": message, "results": results}), 409
+
+    # 이메일 전송 (항공편 정보는 조회 캐시 사용, 승객별로 발송 큐에 등록)
+    for item, result in zip(items, results):
+        airplane = Airplane.get_cached(
+            item["flight_number"], item["departure_date_time"]
+        )
+        customer = customers[item["cno"]]
+        flight_info = {
+            "flight_number": item["flight_number"],
+            "airline": airplane.airline if airplane else "알 수 없음",
+            "departure_date_time": result["departure_date_time"],
+            "departure_airport": (
+                airplane.departure_airport if airplane else "알 수 없음"
+            ),
+            "arrival_date_time": (
+                airplane.arrival_date_time.strftime("%Y-%m-%d %H:%M")
+                if airplane
+                else "알 수 없음"
+            ),
+            "arrival_airport": airplane.arrival_airport if airplane else "알 수 없음",
+            "seat_class": result["seat_class"],
+            "price": result["payment"],
+        }
+        result["email_sent"], result["email_message"] = send_reservation_email(
+            customer.email, customer.name, flight_info
+        )
+
+    return jsonify({"success": True, "message": message, "results": results})
+
+
 def send_reservation_email(customer_email, customer_name, flight_info):
     """
-    예약 완료 이메일 전송
+    예약 완료 이메일 전송 (발송 큐에 넣고 바로 반환, 실제 전송은 백그라운드 워커가 처리)
     """
     try:
-        # 이메일 설정 (config.py에서 가져오기)
-        smtp_server = Config.SMTP_SERVER
-        smtp_port = Config.SMTP_PORT
-        sender_email = Config.SENDER_EMAIL
-        sender_password = Config.SENDER_PASSWORD
-
         # 이메일 내용 구성
         subject = f"[C-AIR] {customer_name}님의 항공편 예약이 완료되었습니다"
 
@@ -339,32 +880,10 @@ def send_reservation_email(customer_email, customer_name, flight_info):
         </html>
         """
 
-        # 이메일 메시지 생성
-        msg = MIMEMultipart("alternative")
-        msg["From"] = sender_email
-        msg["To"] = customer_email
-        msg["Subject"] = subject
+        # 발송 큐에 추가
+        mail_dispatcher.enqueue(customer_email, subject, html_content)
 
-        # HTML 내용 추가
-        html_part = MIMEText(html_content, "html", "utf-8")
-        msg.attach(html_part)
-
-        # SMTP 서버 연결 및 이메일 전송
-        if smtp_port == 465:
-            # SSL 사용 (네이버 메일 등)
-            server = smtplib.SMTP_SSL(smtp_server, smtp_port)
-        else:
-            # TLS 사용 (Gmail 등)
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            server.starttls()
-
-        server.login(sender_email, sender_password)
-
-        text = msg.as_string()
-        server.sendmail(sender_email, customer_email, text)
-        server.quit()
-
-        return True, "이메일이 성공적으로 전송되었습니다."
+        return True, "예약 확인 이메일이 발송 대기열에 등록되었습니다."
 
     except Exception as e:
         return False, f"이메일 전송 중 오류가 발생했습니다: {str(e)}"
@@ -435,11 +954,12 @@ def cancel_reservation():
             departure_date_time=departure_datetime,
             seat_class=seat_class,
             original_payment=reservation.payment,
+            reservation=reservation,
         )
 
         if cancellation:
             # 고객 정보 가져오기
-            customer = Customer.query.filter_by(cno=session["user_cno"]).first()
+            customer = Customer.get_cached(session["user_cno"])
             if not customer:
                 return (
                     jsonify(
@@ -448,11 +968,6 @@ def cancel_reservation():
                     400,
                 )
 
-            # 항공편 정보 가져오기
-            airplane = Airplane.query.filter_by(
-                flight_number=flight_number, departure_date_time=departure_datetime
-            ).first()
-
             return jsonify(
                 {
                     "success": True,
@@ -476,3 +991,72 @@ def cancel_reservation():
             ),
             500,
         )
+
+
+def parse_history_args(args):
+    """
+    내역 조회 파라미터 파싱 (type, start_date, end_date, page_size, cursor)
+    get_history_page() 인자 딕셔너리 반환, 잘못된 값이면 ValueError(응답 메시지)
+    """
+    kind = args.get("type", "reservation")
+    if kind not in HISTORY_KEYS:
+        raise ValueError("잘못된 내역 종류입니다.")
+
+    page_size = min(
+        max(args.get("page_size", Config.HISTORY_PAGE_SIZE, type=int), 1), 1000
+    )
+    start_date = args.get("start_date")
+    end_date = args.get("end_date")
+    cursor = args.get("cursor")
+
+    try:
+        start = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
+        end = (
+            datetime.strptime(end_date + " 23:59:59", "%Y-%m-%d %H:%M:%S")
+            if end_date
+            else None
+        )
+    except ValueError:
+        raise ValueError("잘못된 날짜 형식입니다.")
+    try:
+        after = decode_history_cursor(kind, cursor) if cursor else None
+    except ValueError:
+        raise ValueError("잘못된 커서입니다.")
+
+    return {
+        "kind": kind,
+        "start": start,
+        "end": end,
+        "page_size": page_size,
+        "after": after,
+    }
+
+
+def history_response(kind, rows, next_after):
+    """
+    내역 조회 결과 응답 본문
+    """
+    return {
+        "success": True,
+        "items": [history_item(kind, row) for row in rows],
+        "next_cursor": encode_history_cursor(next_after),
+    }
+
+
+@api.route("/history", methods=["GET"])
+def history():
+    """예약/취소 내역 조회 API (type=reservation|cancellation, cursor로 다음 페이지 요청)"""
+    # 로그인 상태 확인
+    if "user_cno" not in session:
+        return (
+            jsonify({"success": False, "message": "로그인이 필요한 서비스입니다."}),
+            401,
+        )
+
+    try:
+        params = parse_history_args(request.args)
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+
+    rows, next_after = get_history_page(cno=session["user_cno"], **params)
+    return jsonify(history_response(params["kind"], rows, next_after))
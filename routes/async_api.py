@@ -0,0 +1,222 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from a2wsgi import WSGIMiddleware
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Mount, Route
+from werkzeug.datastructures import MultiDict
+
+from config import Config
+from json_response import encode_json_response, search_results
+from models.airplane import Airplane
+from models.async_db import async_engine_options, create_async_db
+from models.history import history_statement, split_history_page
+from models.inventory import flight_inventory
+from models.search_cache import search_cache
+from models.seat import Seat
+from models.seat_events import async_seat_event_stream, seat_events
+from routes.api import (
+    history_response,
+    parse_history_args,
+    parse_search_paging,
+    parse_stream_flights,
+)
+
+# 비동기(ASGI) 조회 라우트
+# - 요청이 많은 조회 API(항공편 검색, 잔여좌석 알림, 예약/취소 내역)를 비동기 DB 드라이버로 처리
+#   (DB 응답을 기다리는 동안 워커 스레드를 점유하지 않음)
+# - 쿼리/파라미터 파싱/응답 형식은 동기 Flask 라우트와 공유, 그 외 라우트는 Flask 앱으로 전달
+
+
+def _args(request):
+    # Flask 라우트의 파라미터 파싱 함수를 그대로 쓰기 위해 werkzeug MultiDict로 변환
+    return MultiDict(request.query_params.multi_items())
+
+
+def _error(message, status):
+    return JSONResponse({"success": False, "message": message}, status_code=status)
+
+
+async def _load_once(inflight, key, loader):
+    """
+    같은 키의 조회가 진행 중이면 새로 조회하지 않고 그 결과를 함께 기다림
+    (캐시가 비어 있을 때 같은 검색이 동시에 몰려도 DB 조회는 한 번)
+    조회는 별도 태스크로 실행하여 먼저 요청한 클라이언트가 끊겨도 나머지 요청은 결과를 받음
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(loader())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+
+async def search(request):
+    """항공기 검색 API (JSON 요청, 정렬/페이지 조건을 SQL로 처리하여 한 페이지만 반환)"""
+    args = _args(request)
+    paging = parse_search_paging(args)
+    page_size = paging["page_size"]
+
+    try:
+        cache_key = Airplane.search_key(
+            args.get("departure_date"),
+            args.get("departure_airport"),
+            args.get("arrival_airport"),
+            args.get("seat_class"),
+            sort=paging["sort"],
+            order=paging["order"],
+            # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+            limit=page_size + 1,
+            offset=(paging["page"] - 1) * page_size,
+        )
+
+        rows = flight_inventory.search(*cache_key)
+        if rows is None:
+            rows = search_cache.get(cache_key)
+        if rows is None:
+
+            async def load():
+                async with request.app.state.sessionmaker() as db_session:
+                    results = [
+                        tuple(row)
+                        for row in await db_session.execute(
+                            Airplane.search_statement(cache_key)
+                        )
+                    ]
+                search_cache.set(cache_key, results)
+                return results
+
+            rows = await _load_once(request.app.state.inflight, cache_key, load)
+    except Exception as e:
+        return _error(f"검색 중 오류가 발생했습니다: {str(e)}", 500)
+
+    flights = search_results(rows[:page_size])
+    body, headers = encode_json_response(
+        {
+            "success": True,
+            "flights": flights,
+            "count": len(flights),
+            "has_next": len(rows) > page_size,
+            **paging,
+        },
+        request.headers.get("accept-encoding"),
+    )
+    return Response(body, headers=headers, media_type="application/json")
+
+
+class JsonOrWsgi:
+    """
+    Accept: application/json 요청은 비동기 라우트로 처리하고,
+    그 외(HTML 검색 폼: 세션 저장 후 리다이렉트)는 Flask 앱으로 전달
+    """
+
+    def __init__(self, endpoint, wsgi_app):
+        self.endpoint = endpoint
+        self.wsgi_app = wsgi_app
+
+    async def __call__(self, scope, receive, send):
+        request = Request(scope, receive)
+        if request.headers.get("accept") != "application/json":
+            await self.wsgi_app(scope, receive, send)
+            return
+        response = await self.endpoint(request)
+        await response(scope, receive, send)
+
+
+def _session_user(request):
+    # 로그인한 회원번호 (세션 데이터는 처음 접근할 때 저장소에서 불러옴)
+    flask_app = request.app.state.flask_app
+    session = flask_app.session_interface.open_session(flask_app, request)
+    return session.get("user_cno") if session is not None else None
+
+
+async def history(request):
+    """예약/취소 내역 조회 API (type=reservation|cancellation, cursor로 다음 페이지 요청)"""
+    # Flask 세션 인터페이스로 쿠키의 세션을 읽음 (서버 측 세션 저장소/쿠키 세션 모두 지원)
+    # SQLite 세션 저장소 조회는 블로킹 I/O이므로 스레드 풀에서 실행
+    user_cno = await run_in_threadpool(_session_user, request)
+    if not user_cno:
+        return _error("로그인이 필요한 서비스입니다.", 401)
+
+    try:
+        params = parse_history_args(_args(request))
+    except ValueError as e:
+        return _error(str(e), 400)
+
+    kind = params.pop("kind")
+    statement = history_statement(kind, user_cno, **params)
+    async with request.app.state.sessionmaker() as db_session:
+        rows = (await db_session.execute(statement)).scalars().all()
+    rows, next_after = split_history_page(kind, rows, params["page_size"])
+    return JSONResponse(history_response(kind, rows, next_after))
+
+
+async def seat_stream(request):
+    """잔여좌석 변경 실시간 알림 API (Server-Sent Events, flight=운항편명|출발일시 반복 지정)"""
+    try:
+        flights = parse_stream_flights(_args(request))
+    except ValueError as e:
+        return _error(str(e), 400)
+
+    subscription = seat_events.subscribe(flights)
+    if subscription is None:
+        return _error("잠시 후 다시 시도해주세요.", 503)
+
+    # 구독 등록 후 현재 잔여좌석을 읽어 첫 이벤트로 전송 (등록 전후 변경 누락 방지)
+    try:
+        async with request.app.state.sessionmaker() as db_session:
+            initial_counts = Seat.to_seat_counts(
+                await db_session.execute(Seat.flight_seat_counts_statement(flights))
+            )
+    except Exception:
+        seat_events.unsubscribe(subscription)
+        raise
+
+    return StreamingResponse(
+        async_seat_event_stream(
+            subscription,
+            initial_counts,
+            heartbeat=Config.SEAT_EVENTS_HEARTBEAT,
+            timeout=Config.SEAT_EVENTS_STREAM_TIMEOUT,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def create_asgi_app(flask_app, database_uri=None, engine_options=None):
+    """
+    비동기 조회 라우트 + 기존 Flask 앱(나머지 라우트)을 묶은 ASGI 앱 생성
+    database_uri/engine_options를 생략하면 Flask 앱 설정의 DB/풀 설정 사용
+    """
+    engine, sessionmaker = create_async_db(
+        database_uri or flask_app.config["SQLALCHEMY_DATABASE_URI"],
+        **(
+            engine_options
+            if engine_options is not None
+            else async_engine_options(flask_app.config)
+        ),
+    )
+    wsgi_app = WSGIMiddleware(flask_app)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        await engine.dispose()
+
+    app = Starlette(
+        routes=[
+            Route("/api/search", JsonOrWsgi(search, wsgi_app)),
+            Route("/api/history", history, methods=["GET"]),
+            Route("/api/seats/stream", seat_stream, methods=["GET"]),
+            Mount("/", app=wsgi_app),
+        ],
+        lifespan=lifespan,
+    )
+    app.state.flask_app = flask_app
+    app.state.sessionmaker = sessionmaker
+    app.state.inflight = {}
+    return app
@@ -6,13 +6,13 @@ from flask import (
     redirect,
     url_for,
     jsonify,
+    make_response,
+    Response,
+    stream_with_context,
 )
 from datetime import datetime
 from models.airplane import Airplane
-from models.cancellation import Cancellation
-from models.reservation import Reservation
 import io
-import base64
 import matplotlib
 import seaborn as sns
 import pandas as pd
@@ -21,7 +21,19 @@ from models.statistics import (
     get_group02_stats,
     get_window01_stats,
     get_window02_stats,
+    iter_stats,
+    get_window01_page,
+    encode_cursor,
+    decode_cursor,
 )
+from models.stats_cache import stats_cache
+from models.history import (
+    get_history_page,
+    encode_history_cursor,
+    decode_history_cursor,
+)
+from routes.api import parse_search_paging, search_flights_page
+from config import Config
 
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
@@ -74,22 +86,41 @@ def search_page():
 
 @main.route("/reservation", methods=["GET"])
 def reservation_page():
-    # 세션에서 검색 결과 가져오기
-    search_results = session.get("search_results", [])
-    search_params = session.get("search_params", {})
+    # 세션에는 검색 조건만 저장되어 있으므로 결과는 페이지 단위로 다시 조회 (검색 캐시 사용)
+    search_params = session.get("search_params")
 
     # 사용자 정보 가져오기
     user_name = session.get("user_name", "회원")
     user_role = session.get("user_role", None)
 
+    if not search_params:
+        return redirect(url_for("main.search_page", error="검색 결과가 없습니다."))
+
+    # 정렬/페이지 조건을 SQL로 처리하여 현재 페이지만 조회
+    paging = parse_search_paging(request.args)
+    try:
+        flights, has_next = search_flights_page(
+            search_params["departure_date"],
+            search_params["departure_airport"],
+            search_params["arrival_airport"],
+            search_params["seat_class"],
+            paging,
+        )
+    except Exception as e:
+        return redirect(
+            url_for("main.search_page", error=f"검색 중 오류가 발생했습니다: {str(e)}")
+        )
+
     # 검색 결과가 없으면 검색 페이지로 리다이렉트
-    if not search_results:
+    if not flights and paging["page"] == 1:
         return redirect(url_for("main.search_page", error="검색 결과가 없습니다."))
 
     return render_template(
         "reservation.html",
-        flights=search_results,
+        flights=flights,
         search_params=search_params,
+        paging=paging,
+        has_next=has_next,
         user_name=user_name,
         user_role=user_role,
     )
@@ -144,9 +175,6 @@ def history_result_page():
     start_date = request.args.get("startDate")
     end_date = request.args.get("endDate")
 
-    reservations = []
-    cancellations = []
-
     # 날짜 필터링을 위한 변환
     start_datetime = None
     end_datetime = None
@@ -156,33 +184,54 @@ def history_result_page():
     if end_date:
         end_datetime = datetime.strptime(end_date + " 23:59:59", "%Y-%m-%d %H:%M:%S")
 
-    # 예약 내역 조회
-    if search_type in ["all", "reservation"]:
-        query = Reservation.query.filter_by(cno=user_cno)
-
-        if start_datetime:
-            query = query.filter(Reservation.departure_date_time >= start_datetime)
-        if end_datetime:
-            query = query.filter(Reservation.departure_date_time <= end_datetime)
-
-        reservations = query.order_by(Reservation.departure_date_time.desc()).all()
-
-    # 취소 내역 조회
-    if search_type in ["all", "cancellation"]:
-        query = Cancellation.query.filter_by(cno=user_cno)
-
-        if start_datetime:
-            query = query.filter(Cancellation.departure_date_time >= start_datetime)
-        if end_datetime:
-            query = query.filter(Cancellation.departure_date_time <= end_datetime)
+    # 다음 페이지 커서 (첫 페이지는 커서 없음, 다음 페이지에는 남은 항목이 있는 목록의 커서만 전달)
+    cursors = {
+        kind: request.args.get(f"{kind}Cursor")
+        for kind in ("reservation", "cancellation")
+    }
+    first_page = not any(cursors.values())
+
+    # 예약 내역(출발일시 내림차순), 취소 내역(취소일시 내림차순) 조회
+    results = {}
+    next_cursors = {}
+    for kind in ("reservation", "cancellation"):
+        if search_type not in ["all", kind]:
+            continue
+        if not first_page and not cursors[kind]:
+            continue
+        try:
+            after = (
+                decode_history_cursor(kind, cursors[kind]) if cursors[kind] else None
+            )
+        except ValueError:
+            return redirect(url_for("main.history_search_page"))
+
+        results[kind], next_after = get_history_page(
+            kind,
+            user_cno,
+            start=start_datetime,
+            end=end_datetime,
+            page_size=Config.HISTORY_PAGE_SIZE,
+            after=after,
+        )
+        if next_after:
+            next_cursors[f"{kind}Cursor"] = encode_history_cursor(next_after)
 
-        cancellations = query.order_by(Cancellation.cancel_date_time.desc()).all()
+    # 페이지 이동 링크에 유지할 조회 조건
+    search_args = {
+        "searchType": search_type,
+        "startDate": start_date or "",
+        "endDate": end_date or "",
+    }
 
     return render_template(
         "history-result.html",
-        reservations=reservations,
-        cancellations=cancellations,
+        reservations=results.get("reservation", []),
+        cancellations=results.get("cancellation", []),
         now=datetime.now(),
+        search_args=search_args,
+        next_page_args={**search_args, **next_cursors} if next_cursors else None,
+        first_page=first_page,
     )
 
 
@@ -197,46 +246,45 @@ def statistics_page():
     return render_template("statistics.html", user_name=user_name, user_role=user_role)
 
 
-@main.route("/statistics/data", methods=["GET"])
-def statistics_data():
-    stat_type = request.args.get("type")
+# 통계 타입별 조회 함수
+STAT_LOADERS = {
+    "group01": get_group01_stats,
+    "group02": get_group02_stats,
+    "window01": get_window01_stats,
+    "window02": get_window02_stats,
+}
+
+# 차트 응답 형식별 Content-Type
+CHART_MIMETYPES = {"png": "image/png", "svg": "image/svg+xml"}
+
+
+def _load_stats(stat_type):
+    """통계 DataFrame 조회 (데이터 버전별 캐시)"""
+    return stats_cache.get_or_build(("table", stat_type), STAT_LOADERS[stat_type])
+
+
+def _draw_chart(stat_type, df):
+    """통계 타입별 차트 그리기 (현재 pyplot figure에)"""
     # Group 01: Total & Average Reservation Amount by Flight
     if stat_type == "group01":
-        df = get_group01_stats()
         plt.figure(figsize=(14, 4))
         sns.barplot(x="flight_number", y="total_amount", data=df)
         plt.title("Total Reservation Amount by Flight")
         plt.xlabel("Flight Number")
         plt.ylabel("Total Reservation Amount")
         plt.xticks(rotation=45)
-        plt.tight_layout()
-        buf = io.BytesIO()
-        plt.savefig(buf, format="png")
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode("utf-8")
-        plt.close()
-        return jsonify({"table": df.to_dict(orient="records"), "chart": img_base64})
 
     # Group 02: Total & Max Refund by Customer
     elif stat_type == "group02":
-        df = get_group02_stats()
         plt.figure(figsize=(14, 4))
         sns.barplot(x="cno", y="total_refund", data=df)
         plt.title("Total Refund by Customer")
         plt.xlabel("Customer No (cno)")
         plt.ylabel("Total Refund")
         plt.xticks(rotation=45)
-        plt.tight_layout()
-        buf = io.BytesIO()
-        plt.savefig(buf, format="png")
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode("utf-8")
-        plt.close()
-        return jsonify({"table": df.to_dict(orient="records"), "chart": img_base64})
 
     # Window 01: Cumulative Reservation Amount by Flight (Line Plot)
     elif stat_type == "window01":
-        df = get_window01_stats()
         plt.figure(figsize=(14, 6))
         if not df.empty:
             for fn, g in df.groupby("flight_number"):
@@ -253,28 +301,158 @@ def statistics_data():
         plt.xlabel("Departure DateTime")
         plt.ylabel("Cumulative Amount")
         plt.xticks(rotation=45)
-        plt.tight_layout()
-        buf = io.BytesIO()
-        plt.savefig(buf, format="png")
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode("utf-8")
-        plt.close()
-        return jsonify({"table": df.to_dict(orient="records"), "chart": img_base64})
 
     # Window 02: Moving Average of Last 3 Reservations by Customer (Line Plot)
     elif stat_type == "window02":
-        df = get_window02_stats()
         plt.figure(figsize=(10, 5))
         plt.bar(df["cno"], df["total_amount"])
         plt.title("Total Reservation Amount by Customer")
         plt.xlabel("Customer No (cno)")
         plt.ylabel("Total Reservation Amount")
-        plt.tight_layout()
+
+    plt.tight_layout()
+
+
+def _render_chart(stat_type, fmt):
+    """차트 이미지 렌더링 결과 (이미지 bytes, ETag) 반환 (데이터 버전별 캐시)"""
+
+    def build():
+        df = _load_stats(stat_type)
+        _draw_chart(stat_type, df)
         buf = io.BytesIO()
-        plt.savefig(buf, format="png")
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode("utf-8")
+        plt.savefig(buf, format=fmt)
         plt.close()
-        return jsonify({"table": df.to_dict(orient="records"), "chart": img_base64})
+        content = buf.getvalue()
+        return content, stats_cache.make_etag(content)
+
+    return stats_cache.get_or_build(("chart", stat_type, fmt), build)
 
-    return jsonify({"table": [], "chart": ""})
+
+def warm_statistics():
+    """모든 통계 표/차트(PNG)를 미리 렌더링하여 캐시에 저장 (백그라운드 스레드에서 호출)"""
+    for stat_type in STAT_LOADERS:
+        _render_chart(stat_type, "png")
+
+
+@main.route("/statistics/data", methods=["GET"])
+def statistics_data():
+    stat_type = request.args.get("type")
+    if stat_type not in STAT_LOADERS:
+        return jsonify({"table": [], "chart_url": ""})
+
+    df = _load_stats(stat_type)
+    chart_url = url_for(
+        "main.statistics_chart",
+        stat_type=stat_type,
+        fmt="png",
+        v=stats_cache.version,
+    )
+    return jsonify({"table": df.to_dict(orient="records"), "chart_url": chart_url})
+
+
+@main.route("/statistics/chart/<stat_type>.<fmt>", methods=["GET"])
+def statistics_chart(stat_type, fmt):
+    """통계 차트 이미지 (PNG/SVG, ETag/If-None-Match 지원)"""
+    if session.get("user_role") != "admin":
+        return redirect(url_for("main.index"))
+    if stat_type not in STAT_LOADERS or fmt not in CHART_MIMETYPES:
+        return jsonify({"message": "지원하지 않는 통계 차트입니다."}), 404
+
+    content, etag = _render_chart(stat_type, fmt)
+    response = make_response(content)
+    response.mimetype = CHART_MIMETYPES[fmt]
+    response.set_etag(etag)
+    # 관리자 전용 데이터이므로 브라우저에만 저장하고 매번 ETag로 재검증
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response.make_conditional(request)
+
+
+def _ndjson_stream(chunks):
+    for chunk in chunks:
+        yield chunk.to_json(orient="records", lines=True, date_format="iso")
+
+
+def _csv_stream(chunks):
+    header = True
+    for chunk in chunks:
+        yield chunk.to_csv(index=False, header=header)
+        header = False
+
+
+def _parquet_stream(chunks):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # 청크마다 row group 하나씩 기록하고 버퍼에 쌓인 바이트를 바로 전송
+    buf = io.BytesIO()
+    writer = None
+    for chunk in chunks:
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(buf, table.schema)
+        writer.write_table(table)
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+    if writer is not None:
+        writer.close()
+        yield buf.getvalue()
+
+
+# 내보내기 형식별 (스트림 생성 함수, Content-Type, 파일 확장자)
+EXPORT_FORMATS = {
+    "ndjson": (_ndjson_stream, "application/x-ndjson", "ndjson"),
+    "csv": (_csv_stream, "text/csv; charset=utf-8", "csv"),
+    "parquet": (_parquet_stream, "application/vnd.apache.parquet", "parquet"),
+}
+
+
+@main.route("/statistics/export", methods=["GET"])
+def statistics_export():
+    """통계 결과 스트리밍 내보내기 (NDJSON/CSV/Parquet, 청크 단위 조회)"""
+    if session.get("user_role") != "admin":
+        return jsonify({"message": "관리자 권한이 필요합니다."}), 403
+
+    stat_type = request.args.get("type")
+    fmt = request.args.get("format", "ndjson")
+    chunksize = request.args.get("chunksize", 10000, type=int)
+    if stat_type not in STAT_LOADERS or fmt not in EXPORT_FORMATS:
+        return jsonify({"message": "지원하지 않는 통계 형식입니다."}), 400
+    if fmt == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return (
+                jsonify({"message": "Parquet 내보내기에는 pyarrow가 필요합니다."}),
+                400,
+            )
+
+    stream, mimetype, extension = EXPORT_FORMATS[fmt]
+    chunks = iter_stats(stat_type, chunksize=max(chunksize, 1))
+    response = Response(stream_with_context(stream(chunks)), mimetype=mimetype)
+    response.headers["Content-Disposition"] = (
+        f"attachment; filename={stat_type}.{extension}"
+    )
+    return response
+
+
+@main.route("/statistics/page", methods=["GET"])
+def statistics_page_data():
+    """window01 통계 키셋 페이지 조회 (cursor로 다음 페이지 요청)"""
+    if session.get("user_role") != "admin":
+        return jsonify({"message": "관리자 권한이 필요합니다."}), 403
+
+    page_size = min(max(request.args.get("page_size", 100, type=int), 1), 1000)
+    cursor = request.args.get("cursor")
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        return jsonify({"message": "잘못된 커서입니다."}), 400
+
+    df, next_after = get_window01_page(page_size=page_size, after=after)
+    return jsonify(
+        {
+            "table": df.to_dict(orient="records"),
+            "next_cursor": encode_cursor(next_after) if next_after else None,
+        }
+    )
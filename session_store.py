@@ -0,0 +1,247 @@
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from itsdangerous import BadSignature, Signer
+
+# 서버 측 세션 저장소
+# - 쿠키에는 서명된 세션 ID만 저장하고 실제 세션 데이터는 서버에 보관
+# - 세션 데이터는 처음 접근할 때 불러오고(lazy loading), 변경된 경우에만 저장
+
+
+class MemorySessionStore:
+    """
+    메모리 LRU 세션 저장소 (단일 프로세스용)
+    """
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self._entries = OrderedDict()  # sid -> (만료 시각, 데이터)
+        self._lock = threading.Lock()
+
+    def get(self, sid):
+        with self._lock:
+            entry = self._entries.get(sid)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[sid]
+                return None
+            self._entries.move_to_end(sid)
+            return dict(entry[1])
+
+    def set(self, sid, data, lifetime):
+        with self._lock:
+            self._entries[sid] = (time.time() + lifetime, dict(data))
+            self._entries.move_to_end(sid)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, sid):
+        with self._lock:
+            self._entries.pop(sid, None)
+
+
+class SQLiteSessionStore:
+    """
+    SQLite 파일 세션 저장소 (여러 워커 프로세스가 같은 파일을 공유)
+    """
+
+    def __init__(self, path, cleanup_interval=1000):
+        self.path = path
+        self.cleanup_interval = cleanup_interval
+        self.serializer = TaggedJSONSerializer()
+        self._local = threading.local()
+        self._writes = 0
+        self._conn().execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "sid TEXT PRIMARY KEY, data TEXT NOT NULL, expires REAL NOT NULL)"
+        )
+
+    def _conn(self):
+        # sqlite3 연결은 스레드 간 공유하지 않으므로 스레드마다 생성
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, sid):
+        row = (
+            self._conn()
+            .execute(
+                "SELECT data FROM sessions WHERE sid = ? AND expires > ?",
+                (sid, time.time()),
+            )
+            .fetchone()
+        )
+        return self.serializer.loads(row[0]) if row else None
+
+    def set(self, sid, data, lifetime):
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO sessions (sid, data, expires) VALUES (?, ?, ?)",
+            (sid, self.serializer.dumps(dict(data)), time.time() + lifetime),
+        )
+        # 주기적으로 만료된 세션 삭제
+        self._writes += 1
+        if self._writes % self.cleanup_interval == 0:
+            conn.execute("DELETE FROM sessions WHERE expires <= ?", (time.time(),))
+
+    def delete(self, sid):
+        self._conn().execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+
+
+class ServerSideSession(SessionMixin):
+    """
+    처음 접근할 때 저장소에서 데이터를 불러오는 세션 객체
+    """
+
+    def __init__(self, store, sid=None):
+        self.store = store
+        self.sid = sid
+        self.new = sid is None
+        self.modified = False
+        self.accessed = False
+        self._data = None
+        self.previous_sid = None  # regenerate() 전 세션 ID (저장 시 저장소에서 삭제)
+
+    def _load(self):
+        self.accessed = True
+        if self._data is None:
+            self._data = (self.store.get(self.sid) if self.sid else None) or {}
+        return self._data
+
+    def regenerate(self):
+        """
+        세션 ID 재발급 (로그인 시 세션 고정 공격 방지, 데이터는 새 ID로 옮김)
+        """
+        self._load()
+        if self.sid is not None and self.previous_sid is None:
+            self.previous_sid = self.sid
+        self.sid = None
+        self.modified = True
+
+    @property
+    def loaded(self):
+        return self._data is not None
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __setitem__(self, key, value):
+        self._load()[key] = value
+        self.modified = True
+
+    def __delitem__(self, key):
+        del self._load()[key]
+        self.modified = True
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def __repr__(self):
+        return f"<ServerSideSession {self.sid}>"
+
+
+class ServerSideSessionInterface(SessionInterface):
+    """
+    Flask 세션 인터페이스 (쿠키에는 서명된 세션 ID만 저장)
+    """
+
+    salt = "c-air-session"
+
+    def __init__(self, store):
+        self.store = store
+
+    def _signer(self, app):
+        return Signer(app.secret_key, salt=self.salt)
+
+    def open_session(self, app, request):
+        if not app.secret_key:
+            return None
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if not cookie:
+            return ServerSideSession(self.store)
+        try:
+            sid = self._signer(app).unsign(cookie).decode("ascii")
+        except BadSignature:
+            return ServerSideSession(self.store)
+        return ServerSideSession(self.store, sid)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if session.accessed:
+            response.vary.add("Cookie")
+
+        # 변경되지 않은 세션은 저장소/쿠키 모두 갱신하지 않음
+        if not session.modified:
+            return
+
+        # 재발급 전 세션 ID는 더 이상 쓸 수 없도록 삭제
+        if session.previous_sid is not None:
+            self.store.delete(session.previous_sid)
+            session.previous_sid = None
+
+        if not len(session):
+            if session.sid:
+                self.store.delete(session.sid)
+                response.delete_cookie(
+                    name,
+                    domain=domain,
+                    path=path,
+                    secure=self.get_cookie_secure(app),
+                    httponly=self.get_cookie_httponly(app),
+                )
+            return
+
+        if session.sid is None:
+            session.sid = secrets.token_urlsafe(32)
+        lifetime = app.permanent_session_lifetime.total_seconds()
+        self.store.set(session.sid, session, lifetime)
+
+        response.set_cookie(
+            name,
+            self._signer(app).sign(session.sid).decode("ascii"),
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app),
+        )
+
+
+def regenerate_session(session):
+    """
+    로그인 시 세션 ID 재발급 (서버 측 세션만 해당, 쿠키 세션은 ID가 없으므로 그대로 사용)
+    """
+    if isinstance(session, ServerSideSession):
+        session.regenerate()
+
+
+def create_session_interface(config):
+    """
+    SESSION_BACKEND 설정에 따라 세션 인터페이스 생성 (cookie면 Flask 기본 쿠키 세션 사용)
+    """
+    backend = config["SESSION_BACKEND"]
+    if backend == "memory":
+        return ServerSideSessionInterface(
+            MemorySessionStore(max_size=config["SESSION_MEMORY_MAX"])
+        )
+    if backend == "sqlite":
+        return ServerSideSessionInterface(
+            SQLiteSessionStore(config["SESSION_SQLITE_PATH"])
+        )
+    return None